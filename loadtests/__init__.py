@@ -0,0 +1,6 @@
+"""Load test Locust untuk endpoint `/ping` dan `/trx` dengan baseline performa.
+
+Jalankan dari root project:
+    python -m loadtests.run                    # bandingkan dengan baseline
+    python -m loadtests.run --update-baseline  # rekam ulang baseline
+"""
@@ -0,0 +1,128 @@
+"""Hasil run Locust, file baseline, dan deteksi regresi.
+
+Satu hasil skenario diambil dari baris `Aggregated` di `<prefix>_stats.csv`
+yang ditulis Locust (`--csv`). Baseline disimpan sebagai JSON:
+
+    {
+      "config": {"users": 20, "spawn_rate": 20, "duration": 15, "workers": 1},
+      "scenarios": {"ping": {"rps": ..., "p50": ..., "p95": ..., "p99": ...,
+                             "requests": ..., "failures": ...}}
+    }
+
+Run dianggap regresi jika RPS turun atau p95/p99 naik melewati toleransi
+relatif, atau jika ada request yang gagal (status di luar yang diharapkan).
+Latensi diberi kelonggaran absolut kecil karena persentil Locust dibulatkan
+ke milidetik dan noise pada nilai beberapa ms sangat besar secara relatif.
+"""
+
+import csv
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+
+DEFAULT_RPS_TOLERANCE = 0.30
+DEFAULT_LATENCY_TOLERANCE = 0.50
+DEFAULT_LATENCY_SLACK_MS = 5.0
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioResult:
+    """Ringkasan satu skenario (latensi dalam milidetik).
+
+    Attributes:
+        rps (float): request per detik rata-rata selama run.
+        p50 (float): median latensi.
+        p95 (float): persentil 95 latensi.
+        p99 (float): persentil 99 latensi.
+        requests (int): total request.
+        failures (int): request dengan status tidak terduga.
+    """
+
+    rps: float
+    p50: float
+    p95: float
+    p99: float
+    requests: int
+    failures: int
+
+    @classmethod
+    def from_stats_csv(cls, path: str | Path) -> "ScenarioResult":
+        """Baca baris `Aggregated` dari file `*_stats.csv` Locust."""
+        with Path(path).open(newline="", encoding="utf-8") as fh:
+            for row in csv.DictReader(fh):
+                if row["Name"] == "Aggregated":
+                    return cls(
+                        rps=round(float(row["Requests/s"]), 1),
+                        p50=float(row["50%"]),
+                        p95=float(row["95%"]),
+                        p99=float(row["99%"]),
+                        requests=int(row["Request Count"]),
+                        failures=int(row["Failure Count"]),
+                    )
+        raise ValueError(f"baris Aggregated tidak ditemukan di {path}")
+
+
+def load_baseline(path: str | Path = BASELINE_PATH) -> dict:
+    """Load file baseline; dict kosong jika belum ada."""
+    path = Path(path)
+    if not path.exists():
+        return {"config": {}, "scenarios": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(
+    config: dict,
+    results: dict[str, ScenarioResult],
+    path: str | Path = BASELINE_PATH,
+) -> None:
+    """Tulis baseline baru (urutan key stabil agar diff mudah dibaca)."""
+    data = {
+        "config": config,
+        "scenarios": {name: asdict(result) for name, result in results.items()},
+    }
+    Path(path).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def find_regressions(
+    results: dict[str, ScenarioResult],
+    baseline: dict,
+    rps_tolerance: float = DEFAULT_RPS_TOLERANCE,
+    latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+    latency_slack_ms: float = DEFAULT_LATENCY_SLACK_MS,
+) -> list[str]:
+    """Bandingkan hasil run dengan baseline.
+
+    Args:
+        results: hasil per skenario dari run sekarang.
+        baseline: isi file baseline (lihat `load_baseline`).
+        rps_tolerance: penurunan RPS relatif maksimum (0.30 = 30%).
+        latency_tolerance: kenaikan p95/p99 relatif maksimum.
+        latency_slack_ms: kelonggaran absolut latensi di atas toleransi relatif.
+
+    Returns:
+        list pesan regresi; kosong jika semua skenario dalam batas.
+    """
+    problems: list[str] = []
+    expected = baseline.get("scenarios", {})
+    for name, result in results.items():
+        if result.failures:
+            problems.append(f"{name}: {result.failures} request gagal")
+        base = expected.get(name)
+        if base is None:
+            continue
+        min_rps = base["rps"] * (1 - rps_tolerance)
+        if result.rps < min_rps:
+            problems.append(
+                f"{name}: rps {result.rps:.1f} < {min_rps:.1f} (baseline {base['rps']:.1f})"
+            )
+        for metric in ("p95", "p99"):
+            limit = base[metric] * (1 + latency_tolerance) + latency_slack_ms
+            value = getattr(result, metric)
+            if value > limit:
+                problems.append(
+                    f"{name}: {metric} {value:.0f} ms > {limit:.0f} ms "
+                    f"(baseline {base[metric]:.0f} ms)"
+                )
+    return problems
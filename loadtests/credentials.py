@@ -0,0 +1,13 @@
+"""Kredensial member load test, dibagi oleh locustfile dan runner.
+
+Sengaja terpisah dari `locustfile`: mengimpor `locust` memasang monkey-patch
+gevent, sehingga runner tidak boleh mengimpor locustfile.
+"""
+
+import os
+
+MEMBERID = os.environ.get("LOADTEST_MEMBERID", "LOAD01")
+PIN = os.environ.get("LOADTEST_PIN", "1234")
+PASSWORD = os.environ.get("LOADTEST_PASSWORD", "LOADPASS")
+# member dengan IP allowlist yang tidak pernah cocok dengan client load test
+FOREIGN_MEMBERID = os.environ.get("LOADTEST_FOREIGN_MEMBERID", "LOAD02")
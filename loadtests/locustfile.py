@@ -0,0 +1,124 @@
+r"""Skenario Locust untuk API transaksi.
+
+Setiap skenario adalah satu kelas `HttpUser`; `loadtests.run` memilih kelas
+lewat argumen posisi Locust, misalnya:
+
+    locust -f loadtests/locustfile.py TrxPinUser --headless -u 50 -t 20s \
+        --host http://127.0.0.1:8000
+
+Kredensial dibaca dari env `LOADTEST_*` dan default-nya sama dengan file
+member yang ditulis `loadtests.run`. Status yang memang diharapkan (401/403
+untuk skenario storm) dihitung sebagai sukses, sehingga failure hanya
+muncul untuk balasan yang tidak terduga.
+"""
+
+import itertools
+import uuid
+
+from locust import HttpUser, constant, task
+from src.services.siganture_auth import OtomaxSignatureService
+
+from loadtests.credentials import FOREIGN_MEMBERID, MEMBERID, PASSWORD, PIN
+
+PRODUCT = "TSEL10"
+DEST = "081234567890"
+
+# prefix per proses + counter: trxid unik agar tidak terlayani cache idempotency
+_trxids = (f"{uuid.uuid4().hex[:8]}-{n}" for n in itertools.count())
+
+
+def next_trxid() -> str:
+    """Trxid unik untuk satu request."""
+    return next(_trxids)
+
+
+class _ApiUser(HttpUser):
+    abstract = True
+    wait_time = constant(0)
+
+    def expect(self, name: str, params: dict | None, status: int) -> None:
+        """GET /trx (atau /ping) dan tandai gagal jika status bukan `status`."""
+        path = "/ping" if params is None else "/trx"
+        with self.client.get(
+            path, params=params, name=name, catch_response=True
+        ) as response:
+            if response.status_code == status:
+                response.success()
+            else:
+                response.failure(f"status {response.status_code}, expected {status}")
+
+
+class PingUser(_ApiUser):
+    """Baseline overhead framework: `/ping`."""
+
+    @task
+    def ping(self) -> None:
+        """Ping tanpa autentikasi."""
+        self.expect("/ping", None, 200)
+
+
+class TrxPinUser(_ApiUser):
+    """Transaksi valid dengan pin + password."""
+
+    @task
+    def trx_pin(self) -> None:
+        """Transaksi dengan pin + password benar."""
+        params = {
+            "trxid": next_trxid(),
+            "memberid": MEMBERID,
+            "product": PRODUCT,
+            "dest": DEST,
+            "pin": PIN,
+            "password": PASSWORD,
+        }
+        self.expect("/trx [pin]", params, 200)
+
+
+class TrxSignUser(_ApiUser):
+    """Transaksi valid dengan signature saja."""
+
+    @task
+    def trx_sign(self) -> None:
+        """Transaksi dengan signature benar."""
+        trxid = next_trxid()
+        sign = OtomaxSignatureService.generate_transaction_signature(
+            MEMBERID, PRODUCT, DEST, trxid, PIN, PASSWORD
+        )
+        params = {
+            "trxid": trxid,
+            "memberid": MEMBERID,
+            "product": PRODUCT,
+            "dest": DEST,
+            "sign": sign,
+        }
+        self.expect("/trx [sign]", params, 200)
+
+
+class AuthStormUser(_ApiUser):
+    """Storm kredensial salah (401) dan IP tidak diizinkan (403)."""
+
+    @task(3)
+    def wrong_pin(self) -> None:
+        """Pin salah, diharapkan 401."""
+        params = {
+            "trxid": next_trxid(),
+            "memberid": MEMBERID,
+            "product": PRODUCT,
+            "dest": DEST,
+            "pin": "0000",
+            "password": PASSWORD,
+        }
+        self.expect("/trx [401]", params, 401)
+
+    @task(1)
+    def foreign_ip(self) -> None:
+        """Member dengan IP lain, diharapkan 403."""
+        params = {
+            "trxid": next_trxid(),
+            "memberid": FOREIGN_MEMBERID,
+            "product": PRODUCT,
+            "dest": DEST,
+            "pin": PIN,
+            "password": PASSWORD,
+        }
+        self.expect("/trx [403]", params, 403)
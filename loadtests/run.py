@@ -0,0 +1,277 @@
+"""Jalankan skenario Locust headless terhadap server lokal dan cek baseline.
+
+Langkah:
+    1. tulis file member sementara (LOAD01 dengan IP 127.0.0.1, LOAD02 dengan
+       IP yang tidak pernah cocok) lalu start `python -m src.server` di port
+       bebas dengan rate limit dan report callback dimatikan
+    2. jalankan setiap skenario `locust --headless --csv` secara berurutan
+    3. simpan hasil ke `.reports/loadtests/results.json` dan bandingkan dengan
+       `loadtests/baselines.json`; exit code 1 jika ada regresi
+
+Parameter run (users, spawn rate, durasi, worker) default-nya diambil dari
+blok `config` di baseline agar run dapat dibandingkan apel dengan apel.
+
+Jalankan dari root project:
+    python -m loadtests.run
+    python -m loadtests.run --scenario trx_pin --duration 30
+    python -m loadtests.run --update-baseline
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from dataclasses import asdict
+from pathlib import Path
+
+import httpx
+
+from loadtests.baseline import (
+    BASELINE_PATH,
+    DEFAULT_LATENCY_SLACK_MS,
+    DEFAULT_LATENCY_TOLERANCE,
+    DEFAULT_RPS_TOLERANCE,
+    ScenarioResult,
+    find_regressions,
+    load_baseline,
+    save_baseline,
+)
+from loadtests.credentials import FOREIGN_MEMBERID, MEMBERID, PASSWORD, PIN
+
+LOCUSTFILE = Path(__file__).with_name("locustfile.py")
+ROOT = LOCUSTFILE.parent.parent
+REPORT_DIR = ROOT / ".reports" / "loadtests"
+
+SCENARIOS = {
+    "ping": "PingUser",
+    "trx_pin": "TrxPinUser",
+    "trx_sign": "TrxSignUser",
+    "auth_storm": "AuthStormUser",
+}
+DEFAULT_CONFIG = {"users": 20, "spawn_rate": 20, "duration": 15, "workers": 1}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def write_members(path: Path) -> None:
+    """File member untuk server load test (lihat kredensial di locustfile)."""
+    members = [
+        {
+            "memberid": MEMBERID,
+            "pin": PIN,
+            "password": PASSWORD,
+            "ip_address": "127.0.0.1",
+            "report_url": "",
+        },
+        {
+            "memberid": FOREIGN_MEMBERID,
+            "pin": PIN,
+            "password": PASSWORD,
+            "ip_address": "203.0.113.10",
+            "report_url": "",
+        },
+    ]
+    path.write_text(json.dumps(members), encoding="utf-8")
+
+
+def server_env(members_path: Path) -> dict[str, str]:
+    """Environment server: registry dari file, komponen non-esensial mati."""
+    oto = {
+        "memberid": MEMBERID,
+        "password": PASSWORD,
+        "pin": PIN,
+        "memberip": "127.0.0.1",
+        "memberreporturl": "",
+    }
+    return {
+        **os.environ,
+        "OTO": json.dumps(oto),
+        "MEMBER_SOURCE": str(members_path),
+        "RATE_LIMIT_ENABLED": "false",
+        "REPORT_ENABLED": "false",
+        "JOURNAL_ENABLED": "false",
+        "RELOAD_ENABLED": "false",
+        "STORE_ENABLED": "false",
+    }
+
+
+@contextlib.contextmanager
+def local_server(workers: int, workdir: Path, timeout: float = 30.0) -> Iterator[str]:
+    """Start `src.server` di port bebas; yield base URL, stop saat keluar."""
+    members_path = workdir / "members.json"
+    write_members(members_path)
+    port = _free_port()
+    log = (workdir / "server.log").open("wb")
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "src.server",
+            "--workers",
+            str(workers),
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+        ],
+        cwd=ROOT,
+        env=server_env(members_path),
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+    host = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError(f"server berhenti saat startup, lihat {log.name}")
+            try:
+                if httpx.get(f"{host}/ping", timeout=1.0).status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"server tidak siap dalam {timeout}s")
+            time.sleep(0.2)
+        yield host
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        log.close()
+
+
+def run_scenario(name: str, host: str, config: dict, outdir: Path) -> ScenarioResult:
+    """Jalankan satu skenario Locust headless dan baca ringkasannya."""
+    prefix = outdir / name
+    with (outdir / f"{name}.log").open("wb") as log:
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "locust",
+                "-f",
+                str(LOCUSTFILE),
+                SCENARIOS[name],
+                "--headless",
+                "--host",
+                host,
+                "--users",
+                str(config["users"]),
+                "--spawn-rate",
+                str(config["spawn_rate"]),
+                "--run-time",
+                f"{config['duration']}s",
+                "--csv",
+                str(prefix),
+                "--only-summary",
+                "--loglevel",
+                "WARNING",
+                "--exit-code-on-error",
+                "0",
+            ],
+            cwd=ROOT,
+            env={**os.environ, "PYTHONPATH": str(ROOT)},
+            check=True,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+    return ScenarioResult.from_stats_csv(f"{prefix}_stats.csv")
+
+
+def run_suite(
+    config: dict, scenarios: list[str], outdir: Path
+) -> dict[str, ScenarioResult]:
+    """Start satu server lokal lalu jalankan skenario secara berurutan."""
+    outdir.mkdir(parents=True, exist_ok=True)
+    with (
+        tempfile.TemporaryDirectory() as tmp,
+        local_server(config["workers"], Path(tmp)) as host,
+    ):
+        return {name: run_scenario(name, host, config, outdir) for name in scenarios}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point CLI `python -m loadtests.run`; exit code 1 bila regresi."""
+    baseline = load_baseline()
+    defaults = {**DEFAULT_CONFIG, **baseline.get("config", {})}
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS))
+    parser.add_argument("--users", type=int, default=defaults["users"])
+    parser.add_argument("--spawn-rate", type=float, default=defaults["spawn_rate"])
+    parser.add_argument("--duration", type=int, default=defaults["duration"])
+    parser.add_argument("--workers", type=int, default=defaults["workers"])
+    parser.add_argument("--output", type=Path, default=REPORT_DIR)
+    parser.add_argument("--rps-tolerance", type=float, default=DEFAULT_RPS_TOLERANCE)
+    parser.add_argument(
+        "--latency-tolerance", type=float, default=DEFAULT_LATENCY_TOLERANCE
+    )
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    config = {
+        "users": args.users,
+        "spawn_rate": args.spawn_rate,
+        "duration": args.duration,
+        "workers": args.workers,
+    }
+    scenarios = args.scenario or list(SCENARIOS)
+    results = run_suite(config, scenarios, args.output)
+
+    print(f"{'scenario':<12} {'rps':>9} {'p50':>6} {'p95':>6} {'p99':>6} {'fail':>6}")
+    for name, result in results.items():
+        print(
+            f"{name:<12} {result.rps:>9.1f} {result.p50:>6.0f} {result.p95:>6.0f} "
+            f"{result.p99:>6.0f} {result.failures:>6}"
+        )
+    (args.output / "results.json").write_text(
+        json.dumps(
+            {"config": config, "scenarios": {k: asdict(v) for k, v in results.items()}},
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+
+    if args.update_baseline:
+        save_baseline(config, {**_baseline_results(baseline), **results})
+        print(f"baseline ditulis ke {BASELINE_PATH}")
+        return 0
+
+    if baseline.get("config") and baseline["config"] != config:
+        print("peringatan: parameter run berbeda dengan baseline", baseline["config"])
+    problems = find_regressions(
+        results,
+        baseline,
+        rps_tolerance=args.rps_tolerance,
+        latency_tolerance=args.latency_tolerance,
+        latency_slack_ms=DEFAULT_LATENCY_SLACK_MS,
+    )
+    for problem in problems:
+        print("REGRESI", problem)
+    return 1 if problems else 0
+
+
+def _baseline_results(baseline: dict) -> dict[str, ScenarioResult]:
+    return {
+        name: ScenarioResult(**values)
+        for name, values in baseline.get("scenarios", {}).items()
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
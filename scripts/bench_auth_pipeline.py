@@ -0,0 +1,91 @@
+"""Benchmark: pipeline auth per-request (lama) vs app-scoped (baru).
+
+Mengukur latency dan alokasi memori (tracemalloc) per request untuk
+`authenticate_transaction` dengan model `Auth` yang sudah tervalidasi.
+
+Jalankan dari root project:
+    python -m scripts.bench_auth_pipeline --requests 100000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from src.api.api_trx import Auth
+from src.domain.member.registry import MemberRecord, MemberRegistry
+from src.services.auth import AuthenticationService
+from src.services.client_auth import ClientAuth
+from src.services.credential_auth import CredentialAuth
+from src.services.siganture_auth import OtomaxSignatureService
+
+REGISTRY = MemberRegistry(
+    [MemberRecord("TESTOK01", "1111", "TESTOK01", "10.0.0.2", "http://x/report")]
+)
+
+
+def legacy_request(auth: Auth, client_ip: str) -> dict:
+    """Replika alur lama: service + komponen dibuat ulang, model di-dump dan di-strip."""
+    svc = AuthenticationService(OtomaxSignatureService, REGISTRY)
+    data = auth.model_dump()
+    memberid = str(data.get("memberid", "")).strip()
+    trxid = str(data.get("trxid", "")).strip()
+    product = str(data.get("product", "")).strip()
+    dest = str(data.get("dest", "")).strip()
+    ClientAuth(svc.registry).validate(memberid, client_ip)
+    CredentialAuth(svc.registry).validate(memberid, data["pin"], data["password"])
+    sign = svc.signature.generate_transaction_signature(
+        memberid, product, dest, trxid, data["pin"], data["password"]
+    )
+    return {"status": "success", "trxid": trxid, "memberid": memberid, "sign": sign}
+
+
+SERVICE = AuthenticationService(OtomaxSignatureService, REGISTRY)
+
+
+def scoped_request(auth: Auth, client_ip: str) -> dict:
+    return SERVICE.authenticate_transaction(auth, client_ip)
+
+
+def measure(label: str, func, auths: list[Auth]) -> None:
+    start = time.perf_counter()
+    for auth in auths:
+        func(auth, "10.0.0.2")
+    per_req_us = (time.perf_counter() - start) / len(auths) * 1e6
+
+    sample = auths[:1000]
+    tracemalloc.start()
+    peak_total = 0
+    for auth in sample:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func(auth, "10.0.0.2")
+        peak_total += tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    print(
+        f"{label:<8} {per_req_us:>8.2f} us/req  "
+        f"{peak_total / len(sample):>8.0f} B peak alloc/req"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100_000)
+    args = parser.parse_args()
+
+    auths = [
+        Auth(
+            trxid=f"TRX{i}",
+            memberid="TESTOK01",
+            product="XL5",
+            dest="08123456789",
+            pin="1111",
+            password="TESTOK01",
+        )
+        for i in range(args.requests)
+    ]
+    measure("before", legacy_request, auths)
+    measure("after", scoped_request, auths)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark: throughput jalur error (AuthError 401/403).
+
+Membandingkan handler lama (dict baru + `JSONResponse`) dengan handler
+template byte, lalu throughput end-to-end `/trx` yang selalu gagal IP check.
+
+Jalankan dari root project:
+    python -m scripts.bench_error_path --requests 200000
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from loguru import logger
+from starlette.requests import Request
+
+from src.api.api_trx import router
+from src.core.exceptions import register_exception_handlers
+from src.core.exceptions.handlers import app_exception_handler
+from src.domain.member.registry import MemberRecord, MemberRegistry
+from src.services.auth import AuthenticationService
+from src.services.errors import AuthError
+from src.services.siganture_auth import OtomaxSignatureService
+
+
+async def legacy_handler(request: Request, exc: Exception) -> JSONResponse:
+    trace_id = getattr(request.state, "trace_id", "unknown")
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={
+            "success": False,
+            "rc": exc.__class__.__name__,
+            "message": str(exc),
+            "trace_id": trace_id,
+        },
+    )
+
+
+async def bench_handler(handler, requests: int) -> float:
+    exc = AuthError("invalid IP", 403)
+    scope = {"type": "http", "headers": [], "state": {"trace_id": "a1b2c3d4e5f6"}}
+    start = time.perf_counter()
+    for _ in range(requests):
+        await handler(Request(scope), exc)
+    return requests / (time.perf_counter() - start)
+
+
+async def bench_app(requests: int) -> float:
+    app = FastAPI()
+    app.include_router(router)
+    register_exception_handlers(app)
+    app.state.auth_service = AuthenticationService(
+        OtomaxSignatureService,
+        MemberRegistry([MemberRecord("M1", "1", "p", "10.9.9.9", "")]),
+    )
+    params = {"trxid": "t", "memberid": "M1", "product": "P", "dest": "1", "sign": "x"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://b") as client:
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/trx", params=params)
+        return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200_000)
+    args = parser.parse_args()
+    logger.remove()
+
+    legacy = asyncio.run(bench_handler(legacy_handler, args.requests))
+    fast = asyncio.run(bench_handler(app_exception_handler, args.requests))
+    print(f"handler legacy    {legacy:>12,.0f} err/sec")
+    print(f"handler template  {fast:>12,.0f} err/sec  ({fast / legacy:.2f}x)")
+    e2e = asyncio.run(bench_app(max(args.requests // 50, 1000)))
+    print(f"/trx 403 storm    {e2e:>12,.0f} req/sec (in-process)")
+
+
+if __name__ == "__main__":
+    main()
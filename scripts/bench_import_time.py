@@ -0,0 +1,117 @@
+"""Benchmark: waktu import `src.main` (cold start worker/test) dari `-X importtime`.
+
+Menjalankan `python -X importtime -c "import src.main"` beberapa kali di
+proses baru, mem-parse laporan stderr, lalu mencetak total (run tercepat)
+dan modul dengan waktu kumulatif/self terbesar. Exit code 1 jika total
+melewati `--budget-ms` atau ada modul di `DEFERRED_MODULES` yang ikut
+ter-import (modul ini seharusnya baru dimuat saat startup lifespan).
+
+Jalankan dari root project:
+    python -m scripts.bench_import_time --runs 5 --top 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+TARGET = "src.main"
+IMPORT_BUDGET_MS = 800.0
+# dimuat lazy: lifespan / include_routers / ReportDispatcher.start / setup_logging
+DEFERRED_MODULES = (
+    "httpx",
+    "loguru_config",
+    "src.api.api_trx",
+    "src.api.dependencies",
+    "src.api.stream",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ImportEntry:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(report: str) -> list[ImportEntry]:
+    """Parse baris `import time: self | cumulative | module` dari stderr."""
+    entries = []
+    for line in report.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # baris header
+        stripped = name.lstrip()
+        entries.append(
+            ImportEntry(
+                module=stripped.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return entries
+
+
+def measure(target: str = TARGET, runs: int = 3) -> tuple[float, list[ImportEntry]]:
+    """Import `target` di `runs` proses baru; (total ms run tercepat, entry-nya)."""
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    best: tuple[float, list[ImportEntry]] | None = None
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        entries = parse_importtime(proc.stderr)
+        total = next(e.cumulative_us for e in entries if e.module == target) / 1000
+        if best is None or total < best[0]:
+            best = (total, entries)
+    return best
+
+
+def deferred_imported(entries: list[ImportEntry]) -> list[str]:
+    """Modul di `DEFERRED_MODULES` yang ternyata ikut ter-import."""
+    imported = {e.module for e in entries}
+    return [m for m in DEFERRED_MODULES if m in imported]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", default=TARGET)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    args = parser.parse_args()
+
+    total, entries = measure(args.target, args.runs)
+    print(f"import {args.target}: {total:.1f} ms (tercepat dari {args.runs} run)")
+    for title, key in (("cumulative", "cumulative_us"), ("self", "self_us")):
+        print(f"\ntop {args.top} {title}:")
+        for entry in sorted(entries, key=lambda e: getattr(e, key), reverse=True)[
+            : args.top
+        ]:
+            print(f"  {getattr(entry, key) / 1000:8.1f} ms  {entry.module}")
+
+    problems = []
+    if total > args.budget_ms:
+        problems.append(f"total {total:.1f} ms > budget {args.budget_ms:.0f} ms")
+    problems += [
+        f"{m} ter-import saat import {args.target}" for m in deferred_imported(entries)
+    ]
+    for problem in problems:
+        print("GAGAL", problem)
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark: IP check dengan allowlist CIDR per member.
+
+Membangun registry dengan banyak member, masing-masing punya beberapa range
+IPv4/IPv6, lalu mengukur waktu compile dan latency `ClientAuth.validate`.
+
+Jalankan dari root project:
+    python -m scripts.bench_ip_allowlist --members 100000 --ranges 10
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from src.domain.member.registry import MemberRecord, MemberRegistry
+from src.services.client_auth import ClientAuth
+
+
+def member_ranges(i: int, ranges: int) -> list[str]:
+    entries = []
+    for r in range(ranges):
+        if r % 2:
+            entries.append(f"2001:db8:{i & 0xFFFF:x}:{r:x}::/64")
+        else:
+            entries.append(f"10.{(i >> 8) & 255}.{i & 255}.{r * 16}/28")
+    return entries
+
+
+def build_registry(members: int, ranges: int) -> MemberRegistry:
+    return MemberRegistry(
+        MemberRecord(
+            memberid=f"M{i:07d}",
+            pin="1",
+            password="p",
+            allowed_ip=",".join(member_ranges(i, ranges)),
+            report_url="",
+        )
+        for i in range(members)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=100_000)
+    parser.add_argument("--ranges", type=int, default=10)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    registry = build_registry(args.members, args.ranges)
+    build_s = time.perf_counter() - start
+
+    sample = min(args.members, 10_000)
+    tracemalloc.start()
+    retained = build_registry(sample, args.ranges)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del retained
+    print(
+        f"compile   {args.members:,} members x {args.ranges} ranges: "
+        f"{build_s:.2f}s, ~{memory / sample:.0f} B/member"
+    )
+
+    client_auth = ClientAuth(registry)
+    requests = []
+    for _ in range(args.lookups):
+        i = random.randrange(args.members)
+        r = random.randrange(args.ranges)
+        if r % 2:
+            ip = f"2001:db8:{i & 0xFFFF:x}:{r:x}::{random.randrange(1, 999):x}"
+        else:
+            ip = f"10.{(i >> 8) & 255}.{i & 255}.{r * 16 + random.randrange(16)}"
+        requests.append((f"M{i:07d}", ip))
+
+    for label in ("cold", "warm"):
+        start = time.perf_counter()
+        for memberid, ip in requests:
+            client_auth.validate(memberid, ip)
+        per_check = (time.perf_counter() - start) / len(requests) * 1e9
+        print(f"ip check  {label:<5} {per_check:8.0f} ns/check")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark: append journal transaksi (group commit) vs fsync per record.
+
+Jalankan dari root project:
+    python -m scripts.bench_journal --n 100000 --interval-ms 5
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from src.services.journal import TransactionJournal, encode_record
+
+
+def _result(i: int) -> dict:
+    return {
+        "status": "success",
+        "trxid": f"TRX{i:010d}",
+        "memberid": "M0001",
+        "sign": "kKpXIK3Zc0xd6jW5yX8e7qG4ZrQ",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--interval-ms", type=float, default=5.0)
+    parser.add_argument(
+        "--fsync-n", type=int, default=2_000, help="record fsync per record"
+    )
+    args = parser.parse_args()
+    tmp = Path(tempfile.mkdtemp())
+
+    journal = TransactionJournal(
+        tmp / "trx.journal", commit_interval_ms=args.interval_ms
+    )
+    start = time.perf_counter()
+    for i in range(args.n):
+        journal.append(_result(i))
+    append_elapsed = time.perf_counter() - start
+    journal.close()
+    total_elapsed = time.perf_counter() - start
+    print(
+        f"group commit: {args.n / append_elapsed:,.0f} append/sec "
+        f"({args.n / total_elapsed:,.0f}/sec termasuk fsync akhir)"
+    )
+
+    with (tmp / "naive.journal").open("ab") as fh:
+        start = time.perf_counter()
+        for i in range(args.fsync_n):
+            fh.write(encode_record(_result(i)))
+            fh.flush()
+            os.fsync(fh.fileno())
+        elapsed = time.perf_counter() - start
+    print(f"fsync per record: {args.fsync_n / elapsed:,.0f} append/sec")
+
+    journal = TransactionJournal(tmp / "trx.journal")
+    start = time.perf_counter()
+    scanned = sum(1 for _ in journal.scan())
+    scan_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(0, args.n, max(args.n // 10_000, 1)):
+        journal.lookup("M0001", f"TRX{i:010d}")
+    lookups = len(range(0, args.n, max(args.n // 10_000, 1)))
+    lookup_elapsed = time.perf_counter() - start
+    journal.close()
+    print(
+        f"mmap scan: {scanned / scan_elapsed:,.0f} record/sec, "
+        f"lookup via index: {lookup_elapsed / lookups * 1e6:.1f} us/lookup"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark: throughput reserve+commit ledger di bawah ribuan task asyncio.
+
+Jalankan dari root project:
+    python -m scripts.bench_ledger --tasks 5000 --ops 20 --hot 10 --wal
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from src.domain.member.ledger import BalanceLedger
+
+
+async def run(ledger: BalanceLedger, tasks: int, ops: int, hot: int) -> None:
+    async def worker(t: int) -> None:
+        for i in range(ops):
+            trxid, memberid = f"{t}-{i}", f"M{(t + i) % hot}"
+            ledger.reserve(memberid, trxid, 1)
+            await asyncio.sleep(0)
+            ledger.commit(memberid, trxid)
+
+    await asyncio.gather(*(worker(t) for t in range(tasks)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=5_000)
+    parser.add_argument("--ops", type=int, default=20)
+    parser.add_argument("--hot", type=int, default=10, help="jumlah member panas")
+    parser.add_argument("--wal", action="store_true", help="aktifkan WAL")
+    args = parser.parse_args()
+
+    wal = Path(tempfile.mkdtemp()) / "ledger.wal" if args.wal else None
+    ledger = BalanceLedger(wal_path=wal)
+    for m in range(args.hot):
+        ledger.open_account(f"M{m}", 10**12)
+
+    start = time.perf_counter()
+    asyncio.run(run(ledger, args.tasks, args.ops, args.hot))
+    elapsed = time.perf_counter() - start
+    ledger.close()
+
+    total = args.tasks * args.ops
+    print(
+        f"{args.tasks} tasks x {args.ops} trx on {args.hot} hot members "
+        f"(wal={'on' if wal else 'off'}): {total / elapsed:,.0f} trx/sec"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Load test: latency /ping dengan handler log sinkron vs lewat queue.
+
+Aplikasi minimal (FastAPI + RequestContextMiddleware + /ping) dipanggil
+in-process lewat httpx ASGITransport dengan sejumlah request konkuren.
+Kedua skenario memakai handler Loguru yang sama (file sink level INFO,
+seperti handler di mlog.yaml): "sync" memasangnya apa adanya, "queue"
+memasangnya lewat `queue_handlers` seperti `setup_logging()` saat
+`LOG_QUEUE_ENABLED=true`.
+
+Jalankan dari root project:
+    python -m scripts.bench_log_sink --requests 20000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from loguru import logger
+
+from src.config.settings import LogSettings
+from src.core.middlewares import RequestContextMiddleware
+from src.core.mlogging.config import queue_handlers, shutdown_logging
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/ping")
+    async def ping():
+        return {"message": "pong"}
+
+    return app
+
+
+async def run_load(app: FastAPI, requests: int, concurrency: int) -> list[float]:
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                start = time.perf_counter()
+                await client.get("/ping")
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        per_worker = requests // concurrency
+        await asyncio.gather(*(worker(per_worker) for _ in range(concurrency)))
+    return latencies
+
+
+def report(label: str, latencies: list[float], lines: int) -> None:
+    q = statistics.quantiles(latencies, n=100)
+    print(
+        f"{label:<6} p50={q[49]:.3f}ms  p99={q[98]:.3f}ms"
+        f"  n={len(latencies)}  log lines={lines}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--overflow", choices=("drop", "block"), default="drop")
+    args = parser.parse_args()
+    tmp = Path(tempfile.mkdtemp())
+    app = build_app()
+    settings = LogSettings(queue_enabled=True, queue_overflow=args.overflow)
+
+    for label in ("sync", "queue"):
+        path = tmp / f"{label}.log"
+        handlers = [{"sink": path, "level": "INFO"}]
+        if label == "queue":
+            handlers = queue_handlers(handlers, settings)
+        logger.configure(handlers=handlers)
+        latencies = asyncio.run(run_load(app, args.requests, args.concurrency))
+        # sink queue di-flush dulu agar jumlah baris mencerminkan hasil akhir
+        logger.remove()
+        shutdown_logging()
+        report(label, latencies, len(path.read_text().splitlines()))
+
+
+if __name__ == "__main__":
+    main()
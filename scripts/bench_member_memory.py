@@ -0,0 +1,124 @@
+"""Benchmark: memori per member dan latency lookup, pydantic vs MemberRecord.
+
+Membandingkan tiga representasi untuk N member dari JSON yang sama:
+
+    - pydantic   : dict memberid -> `Member` (model validasi)
+    - record     : dict memberid -> `MemberRecord.from_member` (tanpa intern)
+    - registry   : `MemberRegistry.from_members` (string + allowlist di-intern)
+
+Memori diukur dengan `tracemalloc` (byte yang masih dialokasikan setelah
+build, dibagi N). Lookup mengukur get + cek IP + pin + password per member.
+
+Jalankan dari root project:
+    python -m scripts.bench_member_memory --members 100000 1000000
+"""
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+from pydantic import TypeAdapter
+
+from src.domain.member.model import Member
+from src.domain.member.registry import MemberRecord, MemberRegistry
+
+
+def ip_of(i: int) -> str:
+    return f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}"
+
+
+def member_json(n: int) -> bytes:
+    return json.dumps(
+        [
+            {
+                "memberid": f"M{i:07d}",
+                "pin": f"{i % 10000:04d}",
+                "password": f"pwd{i}",
+                "ip_address": ip_of(i),
+                "report_url": f"http://h2h{i % 20}.local/report",
+            }
+            for i in range(n)
+        ]
+    ).encode()
+
+
+def build_pydantic(raw: bytes) -> dict:
+    members = TypeAdapter(list[Member]).validate_json(raw)
+    return {m.memberid.upper(): m for m in members}
+
+
+def build_record(raw: bytes) -> dict:
+    members = TypeAdapter(list[Member]).validate_json(raw)
+    return {r.memberid: r for r in map(MemberRecord.from_member, members)}
+
+
+def build_registry(raw: bytes) -> MemberRegistry:
+    return MemberRegistry.from_members(TypeAdapter(list[Member]).validate_json(raw))
+
+
+def measure(build, raw: bytes, n: int) -> tuple[object, float, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    obj = build(raw)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, current / n, elapsed
+
+
+def lookup_pydantic(members: dict, keys: list[tuple[str, str]]) -> float:
+    start = time.perf_counter()
+    for key, ip in keys:
+        m = members.get(key.strip().upper())
+        assert ip == m.ip_address and m.pin and m.password
+    return (time.perf_counter() - start) / len(keys) * 1e9
+
+
+def lookup_record(members: dict, keys: list[tuple[str, str]]) -> float:
+    start = time.perf_counter()
+    for key, ip in keys:
+        m = members.get(key.strip().upper())
+        assert m.allows(ip) and m.pin and m.password
+    return (time.perf_counter() - start) / len(keys) * 1e9
+
+
+def lookup_registry(registry: MemberRegistry, keys: list[tuple[str, str]]) -> float:
+    start = time.perf_counter()
+    for key, ip in keys:
+        m = registry.get(key)
+        assert m.allows(ip) and m.pin and m.password
+    return (time.perf_counter() - start) / len(keys) * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'members':>9} {'model':<10} {'B/member':>9} {'build s':>8} {'lookup ns':>10}"
+    )
+    for n in args.members:
+        raw = member_json(n)
+        picks = [random.randrange(n) for _ in range(args.lookups)]
+        keys = [(f"m{i:07d}", ip_of(i)) for i in picks]
+        for name, build, lookup in (
+            ("pydantic", build_pydantic, lookup_pydantic),
+            ("record", build_record, lookup_record),
+            ("registry", build_registry, lookup_registry),
+        ):
+            obj, per_member, elapsed = measure(build, raw, n)
+            ns = lookup(obj, keys)
+            print(f"{n:>9,} {name:<10} {per_member:>9.0f} {elapsed:>8.2f} {ns:>10.0f}")
+            del obj
+            gc.collect()
+
+
+if __name__ == "__main__":
+    main()
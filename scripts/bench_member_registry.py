@@ -0,0 +1,58 @@
+"""Benchmark: latency auth (IP + credential check) terhadap jumlah member.
+
+Jalankan dari root project:
+    python -m scripts.bench_member_registry --sizes 10 1000 100000 1000000
+"""
+
+import argparse
+import random
+import time
+
+from src.domain.member.registry import MemberRecord, MemberRegistry
+from src.services.client_auth import ClientAuth
+from src.services.credential_auth import CredentialAuth
+
+
+def build_registry(size: int) -> MemberRegistry:
+    return MemberRegistry(
+        MemberRecord(
+            memberid=f"M{i:07d}",
+            pin=f"{i % 10000:04d}",
+            password=f"pwd{i}",
+            allowed_ip=f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}",
+            report_url="http://localhost/report",
+        )
+        for i in range(size)
+    )
+
+
+def bench(size: int, lookups: int) -> float:
+    registry = build_registry(size)
+    client_auth = ClientAuth(registry)
+    credential_auth = CredentialAuth(registry)
+    picks = [registry.get(f"m{random.randrange(size):07d}") for _ in range(lookups)]
+    requests = [(m.memberid, m.allowed_ip, m.pin, m.password) for m in picks]
+
+    start = time.perf_counter()
+    for memberid, ip, pin, password in requests:
+        client_auth.validate(memberid, ip)
+        credential_auth.validate(memberid, pin, password)
+    elapsed = time.perf_counter() - start
+    return elapsed / lookups * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 1_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'members':>10}  {'ns/auth':>10}")
+    for size in args.sizes:
+        print(f"{size:>10,}  {bench(size, args.lookups):>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
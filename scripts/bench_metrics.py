@@ -0,0 +1,41 @@
+"""Microbenchmark: biaya satu observasi metric.
+
+Jalankan dari root project:
+    python -m scripts.bench_metrics --observations 1000000
+"""
+
+import argparse
+import random
+import time
+
+from src.core.metrics import MetricsRegistry
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--observations", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    registry = MetricsRegistry()
+    hist = registry.histogram("bench_seconds", "bench", stage="x")
+    counter = registry.counter("bench_total", "bench")
+    values = [int(random.lognormvariate(9, 1.5)) for _ in range(args.observations)]
+
+    observe = hist.observe_ns
+    start = time.perf_counter_ns()
+    for value in values:
+        observe(value)
+    hist_ns = (time.perf_counter_ns() - start) / len(values)
+
+    inc = counter.inc
+    start = time.perf_counter_ns()
+    for _ in values:
+        inc()
+    counter_ns = (time.perf_counter_ns() - start) / len(values)
+
+    print(f"histogram.observe_ns  {hist_ns:6.0f} ns/obs")
+    print(f"counter.inc           {counter_ns:6.0f} ns/obs")
+
+
+if __name__ == "__main__":
+    main()
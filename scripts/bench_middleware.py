@@ -0,0 +1,75 @@
+"""Microbenchmark: overhead RequestContextMiddleware per request.
+
+Middleware dipanggil langsung dengan scope/receive/send palsu di atas ASGI app
+kosong, lalu dibandingkan dengan app tanpa middleware. Log level di-set ke
+INFO ke sink kosong (TRACE tidak aktif), sama seperti produksi.
+
+Jalankan dari root project:
+    python -m scripts.bench_middleware --requests 200000
+"""
+
+import argparse
+import asyncio
+import time
+
+from loguru import logger
+
+from src.core.middlewares import RequestContextMiddleware
+
+START = {"type": "http.response.start", "status": 200, "headers": []}
+BODY = {"type": "http.response.body", "body": b"{}"}
+
+
+async def app(scope, receive, send) -> None:
+    await send(dict(START))
+    await send(BODY)
+
+
+async def receive() -> dict:
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message) -> None:
+    return None
+
+
+def make_scope() -> dict:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": "/trx",
+        "query_string": b"memberid=M1",
+        "client": ("10.0.0.2", 5000),
+        "headers": [
+            (b"host", b"localhost"),
+            (b"user-agent", b"otomax/1.0"),
+            (b"accept", b"*/*"),
+            (b"x-forwarded-for", b"10.0.0.2"),
+        ],
+    }
+
+
+async def run(target, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        await target(make_scope(), receive, send)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200_000)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(lambda _: None, level="INFO")
+
+    bare = asyncio.run(run(app, args.requests))
+    wrapped = asyncio.run(run(RequestContextMiddleware(app), args.requests))
+    print(f"bare app     {bare:7.2f} us/req")
+    print(f"middleware   {wrapped:7.2f} us/req")
+    print(f"overhead     {wrapped - bare:7.2f} us/req")
+
+
+if __name__ == "__main__":
+    main()
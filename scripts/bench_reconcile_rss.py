@@ -0,0 +1,96 @@
+"""Benchmark: peak RSS dan throughput CLI rekonsiliasi streaming per ukuran input.
+
+Setiap ukuran dijalankan di proses terpisah agar peak RSS (ru_maxrss) tidak
+tercampur. Peak RSS harus relatif konstan meskipun jumlah baris naik.
+
+Jalankan dari root project:
+    python -m scripts.bench_reconcile_rss --sizes 10000 100000 500000
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def write_input(path: Path, n: int) -> None:
+    with path.open("wb") as fh:
+        for i in range(n):
+            item = {
+                "trxid": f"T{i}",
+                "memberid": "TESTOK01",
+                "product": "PROD",
+                "dest": "081",
+                "pin": "1111",
+                "password": "TESTOK01",
+            }
+            fh.write(json.dumps(item).encode() + b"\n")
+
+
+def child(input_path: str, members: str) -> None:
+    from src.reconcile import main
+
+    start = time.perf_counter()
+    main([input_path, "-o", os.devnull, "--members", members])
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"elapsed": elapsed, "peak_kb": peak_kb}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 500_000]
+    )
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(*args.child)
+        return
+
+    tmp = Path(tempfile.mkdtemp())
+    members = tmp / "members.json"
+    members.write_text(
+        json.dumps(
+            [
+                {
+                    "memberid": "TESTOK01",
+                    "pin": "1111",
+                    "password": "TESTOK01",
+                    "ip_address": "127.0.0.1",
+                    "report_url": "",
+                }
+            ]
+        )
+    )
+    for n in args.sizes:
+        input_path = tmp / f"trx_{n}.ndjson"
+        write_input(input_path, n)
+        out = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "scripts.bench_reconcile_rss",
+                "--child",
+                str(input_path),
+                str(members),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        stats = json.loads(out.stdout.strip().splitlines()[-1])
+        size_mb = input_path.stat().st_size / 1e6
+        print(
+            f"{n:>9,} trx ({size_mb:7.1f} MB): peak RSS {stats['peak_kb'] / 1024:7.1f} MiB, "
+            f"{n / stats['elapsed']:>10,.0f} trx/sec"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark: parses/sec parser balasan supplier vs loop regex per aturan.
+
+Memakai balasan rekaman di tests/data/supplier_replies.json.
+
+Jalankan dari root project:
+    python -m scripts.bench_reply_parser --repeat 20000
+"""
+
+import argparse
+import json
+import re
+import time
+import tomllib
+from pathlib import Path
+
+from src.domain.supplier.parser import DEFAULT_RULES_PATH, load_parser, parse_amount
+
+REPLIES_PATH = Path("tests/data/supplier_replies.json")
+
+
+def naive_parser():
+    """Baseline: compile terpisah, coba setiap pola satu per satu."""
+    rules = tomllib.loads(DEFAULT_RULES_PATH.read_text(encoding="utf-8"))["suppliers"]
+    compiled = {
+        name.upper(): (
+            [(r["status"], re.compile(r["pattern"], re.I)) for r in rule["status"]],
+            {f: re.compile(p, re.I) for f, p in rule["fields"].items()},
+        )
+        for name, rule in rules.items()
+    }
+
+    def parse(supplier: str, reply: str) -> tuple:
+        statuses, fields = compiled.get(supplier.upper(), compiled["DEFAULT"])
+        found = [(m.start(), s) for s, rx in statuses if (m := rx.search(reply))]
+        status = min(found)[1] if found else "unknown"
+        values = {f: m.group(f) for f, rx in fields.items() if (m := rx.search(reply))}
+        return (
+            status,
+            values.get("sn"),
+            parse_amount(values["balance"]) if "balance" in values else None,
+            parse_amount(values["price"]) if "price" in values else None,
+        )
+
+    return parse
+
+
+def measure(parse, cases: list[tuple[str, str]]) -> float:
+    start = time.perf_counter()
+    for supplier, reply in cases:
+        parse(supplier, reply)
+    return len(cases) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20_000)
+    args = parser.parse_args()
+
+    replies = json.loads(REPLIES_PATH.read_text())
+    cases = [(r["supplier"], r["reply"]) for r in replies] * (
+        args.repeat // len(replies)
+    )
+
+    start = time.perf_counter()
+    compiled = load_parser.__wrapped__()
+    print(f"compile rules: {(time.perf_counter() - start) * 1e3:.2f} ms")
+
+    print(f"naive per-rule loop : {measure(naive_parser(), cases):>12,.0f} parses/sec")
+    print(f"combined regex      : {measure(compiled.parse, cases):>12,.0f} parses/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark: biaya submit() di jalur /trx dan throughput callback ke stub lokal.
+
+Jalankan dari root project:
+    python -m scripts.bench_report_dispatcher --n 20000 --urls 20 --batch 50
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.services.report_dispatcher import ReportDispatcher
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_POST(self):  # noqa: N802
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+async def run(base: str, n: int, urls: int, batch: int) -> None:
+    dispatcher = ReportDispatcher(batch_size=batch, max_connections_per_host=8)
+    await dispatcher.start()
+
+    start = time.perf_counter()
+    for i in range(n):
+        dispatcher.submit(
+            f"{base}/m{i % urls}",
+            {"trxid": f"T{i}", "memberid": f"M{i % urls}", "status": "success"},
+        )
+    submit_elapsed = time.perf_counter() - start
+    await dispatcher.drain()
+    total_elapsed = time.perf_counter() - start
+    await dispatcher.aclose()
+
+    print(f"submit: {submit_elapsed / n * 1e6:.2f} us/report (latency tambahan /trx)")
+    print(
+        f"delivered {dispatcher.sent:,} reports to {urls} urls "
+        f"(batch={batch}): {dispatcher.sent / total_elapsed:,.0f} reports/sec"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=20_000)
+    parser.add_argument("--urls", type=int, default=20)
+    parser.add_argument("--batch", type=int, default=50)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        asyncio.run(
+            run(f"http://127.0.0.1:{server.server_port}", args.n, args.urls, args.batch)
+        )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Benchmark: throughput /trx dan /ping, response dict (FastAPI) vs TrxResponse/PongResponse.
+
+App dirakit seperti `src.main` lalu dipanggil langsung lewat antarmuka ASGI
+(tanpa HTTP client), sehingga angka mencakup middleware, validasi query,
+autentikasi, dan encoding response. Route `legacy` mengembalikan dict seperti
+sebelumnya (jsonable_encoder + JSONResponse) untuk pembanding.
+
+Jalankan dari root project:
+    python -m scripts.bench_response_encoding --requests 5000 --rounds 5
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Annotated
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, Depends, FastAPI, Query, Request
+from fastapi.responses import JSONResponse
+from loguru import logger
+
+from src.api.api_trx import Auth, router
+from src.api.dependencies import get_auth_service, get_report_dispatcher
+from src.api.responses import PongResponse, TrxResponse
+from src.core.exceptions import register_exception_handlers
+from src.core.middlewares import RequestContextMiddleware
+from src.domain.member.registry import MemberRecord, MemberRegistry
+from src.services.auth import AuthenticationService
+from src.services.report_dispatcher import ReportDispatcher
+from src.services.siganture_auth import OtomaxSignatureService
+
+legacy = APIRouter()
+
+
+@legacy.get("/legacy/trx")
+async def legacy_trx(
+    auth: Annotated[Auth, Query()],
+    request: Request,
+    auth_service: Annotated[AuthenticationService, Depends(get_auth_service)],
+    reports: Annotated[ReportDispatcher | None, Depends(get_report_dispatcher)],
+):
+    # sama dengan get_trx sebelum TrxResponse: dict lewat jsonable_encoder
+    return auth_service.authenticate_transaction(auth, request.client.host)
+
+
+@legacy.get("/legacy/ping")
+async def legacy_ping():
+    return {"message": "pong"}
+
+
+def make_app() -> FastAPI:
+    registry = MemberRegistry(
+        [MemberRecord("TESTOK01", "1111", "TESTOK01", "127.0.0.1", "")]
+    )
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+    register_exception_handlers(app)
+    app.include_router(router)
+    app.include_router(legacy)
+
+    @app.get("/ping", response_class=PongResponse)
+    async def ping():
+        return PongResponse()
+
+    app.state.auth_service = AuthenticationService(OtomaxSignatureService, registry)
+    return app
+
+
+async def call(app, path: str, query: bytes) -> bytes:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query,
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 5000),
+        "server": ("bench", 80),
+    }
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message["body"])
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+def query(i: int) -> bytes:
+    return urlencode(
+        {
+            "trxid": f"T{i}",
+            "memberid": "TESTOK01",
+            "product": "PROD",
+            "dest": "081",
+            "pin": "1111",
+            "password": "TESTOK01",
+        }
+    ).encode()
+
+
+async def run(n: int, rounds: int) -> None:
+    app = make_app()
+    cases = (
+        ("/trx     legacy dict ", "/legacy/trx", True),
+        ("/trx     TrxResponse ", "/trx", True),
+        ("/ping    legacy dict ", "/legacy/ping", False),
+        ("/ping    PongResponse", "/ping", False),
+    )
+    queries = [query(i) for i in range(n)]
+    best: dict[str, float] = {}
+    # case dijalankan bergantian per ronde, diambil ronde tercepat
+    for _ in range(rounds):
+        for label, path, is_trx in cases:
+            start = time.perf_counter()
+            for i in range(n):
+                await call(app, path, queries[i] if is_trx else b"")
+            elapsed = time.perf_counter() - start
+            best[label] = min(best.get(label, elapsed), elapsed)
+    for label, elapsed in best.items():
+        print(f"{label}: {n / elapsed:10,.0f} req/s  {elapsed / n * 1e6:7.1f} us/req")
+
+    result = {
+        "status": "success",
+        "trxid": "T1",
+        "memberid": "TESTOK01",
+        "sign": "x" * 27,
+    }
+    for label, cls in (("JSONResponse", JSONResponse), ("TrxResponse ", TrxResponse)):
+        start = time.perf_counter()
+        for _ in range(n):
+            cls(result)
+        print(f"encode   {label}: {(time.perf_counter() - start) / n * 1e6:7.2f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    logger.remove()
+    asyncio.run(run(args.requests, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Benchmark: throughput GET /trx server pre-fork untuk 1..N worker.
+
+Untuk setiap jumlah worker, `python -m src.server` dijalankan sebagai proses
+terpisah lalu dibebani oleh beberapa proses client (koneksi keep-alive,
+`http.client`) selama `--duration` detik. Rate limiter dimatikan agar yang
+diukur adalah kapasitas autentikasi, bukan limit.
+
+Catatan interpretasi:
+    - client berjalan di mesin yang sama dan ikut memakai CPU; untuk angka
+      bersih jalankan client di mesin lain atau pakai `--clients` kecil
+    - speedup ideal ~linear sampai jumlah worker = jumlah core fisik; di
+      atas itu throughput mendatar (lihat kolom speedup)
+
+Jalankan dari root project:
+    python -m scripts.bench_server_scaling --workers 1 2 4 8 --clients 16
+"""
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+QUERY = (
+    "/trx?trxid={}&memberid=TESTOK01&product=PROD&dest=081&pin=1111&password=TESTOK01"
+)
+
+
+def client(port: int, duration: float, seed: int, results) -> None:
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    done, i = 0, 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        conn.request("GET", QUERY.format(f"{seed}-{i}"))
+        response = conn.getresponse()
+        response.read()
+        if response.status == 200:
+            done += 1
+        i += 1
+    conn.close()
+    results.put(done)
+
+
+def wait_ready(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/ping")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("server tidak siap")
+
+
+def run(workers: int, port: int, clients: int, duration: float, env: dict) -> float:
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "src.server",
+            "--workers",
+            str(workers),
+            "--port",
+            str(port),
+        ],
+        env=env,
+    )
+    try:
+        wait_ready(port)
+        time.sleep(0.5 * workers)  # semua worker selesai lifespan startup
+        ctx = multiprocessing.get_context("fork")
+        results = ctx.Queue()
+        procs = [
+            ctx.Process(target=client, args=(port, duration, c, results))
+            for c in range(clients)
+        ]
+        for proc in procs:
+            proc.start()
+        total = sum(results.get() for _ in procs)
+        for proc in procs:
+            proc.join()
+        return total / duration
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8790)
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp())
+    members = tmp / "members.json"
+    members.write_text(
+        json.dumps(
+            [
+                {
+                    "memberid": "TESTOK01",
+                    "pin": "1111",
+                    "password": "TESTOK01",
+                    "ip_address": "127.0.0.1",
+                    "report_url": "",
+                }
+            ]
+        )
+    )
+    env = {
+        **os.environ,
+        "OTO": json.dumps(
+            {
+                "memberid": "TESTOK01",
+                "password": "TESTOK01",
+                "pin": "1111",
+                "memberip": "127.0.0.1",
+                "memberreporturl": "",
+            }
+        ),
+        "MEMBER_SOURCE": str(members),
+        "RATE_LIMIT_ENABLED": "false",
+    }
+
+    print(f"cpu count: {os.cpu_count()}, clients: {args.clients}")
+    baseline = None
+    for n, workers in enumerate(args.workers):
+        rps = run(workers, args.port + n, args.clients, args.duration, env)
+        baseline = baseline or rps
+        print(
+            f"workers={workers:<3} {rps:>10,.0f} req/s  speedup x{rps / baseline:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Microbenchmark: batch signature engine vs per-call path.
+
+Jalankan dari root project:
+    python -m scripts.bench_signature --rows 100000 --members 100
+"""
+
+import argparse
+import time
+
+from src.services.siganture_auth import OtomaxSignatureService
+
+
+def build_rows(count: int, members: int) -> list[tuple[str, ...]]:
+    return [
+        (f"M{i % members:05d}", "XL5", "08123456789", f"TRX{i}", "1234", "secret")
+        for i in range(count)
+    ]
+
+
+def bench(label: str, func, rows, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - start)
+    rate = len(rows) / best
+    print(f"{label:<12} {rate:>14,.0f} rows/sec  ({best * 1000:.1f} ms)")
+    return rate
+
+
+def per_call(rows) -> list[str]:
+    generate = OtomaxSignatureService.generate_transaction_signature
+    return [generate(*row) for row in rows]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--members", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows, args.members)
+    assert per_call(rows[:1000]) == OtomaxSignatureService.generate_many(rows[:1000])
+
+    base = bench("per-call", per_call, rows, args.repeat)
+    batch = bench("batch", OtomaxSignatureService.generate_many, rows, args.repeat)
+    print(f"speedup      {batch / base:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
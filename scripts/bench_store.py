@@ -0,0 +1,195 @@
+"""Benchmark: throughput `SqliteStore` untuk beban campuran baca/tulis.
+
+Setiap skenario menjalankan `--ops` operasi dengan rasio berbeda antara
+lookup member, update member, dan insert transaksi. Lookup memilih member
+dengan distribusi miring (sebagian kecil member paling sering dipakai).
+
+Dibandingkan dengan baseline naif: satu koneksi SQLite (journal rollback
+default), query langsung tanpa cache, dan commit per penulisan.
+
+Jalankan dari root project:
+    python -m scripts.bench_store --members 10000 --ops 50000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from src.domain.member.registry import MemberRecord
+from src.services.store import (
+    _INSERT_TRX,
+    _SCHEMA,
+    _SELECT_MEMBER,
+    _UPSERT_MEMBER,
+    SqliteStore,
+)
+
+# (nama, porsi lookup, porsi update member); sisanya insert transaksi
+SCENARIOS = (
+    ("read-only", 1.00, 0.00),
+    ("95/5", 0.95, 0.01),
+    ("80/20", 0.80, 0.02),
+    ("50/50", 0.50, 0.05),
+)
+
+
+def _member(i: int, pin: str = "1234") -> MemberRecord:
+    return MemberRecord(f"M{i:06d}", pin, f"PW{i}", "10.0.0.1", "http://r/report")
+
+
+def _result(i: int, memberid: str) -> dict:
+    return {
+        "status": "success",
+        "trxid": f"TRX{i:010d}",
+        "memberid": memberid,
+        "sign": "kKpXIK3Zc0xd6jW5yX8e7qG4ZrQ",
+    }
+
+
+def workload(
+    members: int, ops: int, read: float, update: float, seed: int = 7
+) -> list[tuple[str, int]]:
+    """Daftar operasi (jenis, index member) yang sama untuk semua implementasi."""
+    rng = random.Random(seed)
+    hot = max(1, members // 20)
+    plan = []
+    for _ in range(ops):
+        # 80% lookup mengenai 5% member
+        index = rng.randrange(hot) if rng.random() < 0.8 else rng.randrange(members)
+        roll = rng.random()
+        if roll < read:
+            plan.append(("read", index))
+        elif roll < read + update:
+            plan.append(("update", index))
+        else:
+            plan.append(("trx", index))
+    return plan
+
+
+async def run_store(
+    store: SqliteStore, plan: list[tuple[str, int]], concurrency: int
+) -> float:
+    async def worker(ops: list[tuple[str, int]]) -> None:
+        for i, (kind, index) in enumerate(ops):
+            if kind == "read":
+                await store.aget(f"M{index:06d}")
+            elif kind == "update":
+                store.upsert_member(_member(index, pin=str(i)))
+            else:
+                store.append(_result(i, f"M{index:06d}"))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(plan[i::concurrency]) for i in range(concurrency)))
+    # throughput dihitung sampai semua penulisan ter-commit
+    await asyncio.get_running_loop().run_in_executor(None, store.flush)
+    return len(plan) / (time.perf_counter() - start)
+
+
+def run_naive(path: Path, plan: list[tuple[str, int]]) -> float:
+    conn = sqlite3.connect(path)
+    start = time.perf_counter()
+    for i, (kind, index) in enumerate(plan):
+        memberid = f"M{index:06d}"
+        if kind == "read":
+            conn.execute(_SELECT_MEMBER, (memberid,)).fetchone()
+        elif kind == "update":
+            record = _member(index, pin=str(i))
+            conn.execute(
+                _UPSERT_MEMBER,
+                (
+                    record.memberid,
+                    record.pin,
+                    record.password,
+                    record.allowed_ip,
+                    record.report_url,
+                    0,
+                    0,
+                ),
+            )
+            conn.commit()
+        else:
+            result = _result(i, memberid)
+            conn.execute(
+                _INSERT_TRX,
+                (
+                    result["trxid"],
+                    result["memberid"],
+                    result["sign"],
+                    result["status"],
+                    time.time_ns(),
+                ),
+            )
+            conn.commit()
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return len(plan) / elapsed
+
+
+def _seed_naive(path: Path, members: int) -> None:
+    conn = sqlite3.connect(path)
+    conn.executescript(_SCHEMA)
+    conn.executemany(
+        "INSERT INTO members (memberid, pin, password, ip_address, report_url)"
+        " VALUES (?, ?, ?, ?, ?)",
+        [
+            (r.memberid, r.pin, r.password, r.allowed_ip, r.report_url)
+            for r in map(_member, range(members))
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=10_000)
+    parser.add_argument("--ops", type=int, default=50_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--read-pool", type=int, default=4)
+    parser.add_argument("--cache-size", type=int, default=10_000)
+    parser.add_argument(
+        "--naive-ops", type=int, default=5_000, help="operasi untuk baseline naif"
+    )
+    args = parser.parse_args()
+    logger.remove()
+    tmp = Path(tempfile.mkdtemp())
+
+    for name, read, update in SCENARIOS:
+        plan = workload(args.members, args.ops, read, update)
+
+        store = SqliteStore(
+            tmp / f"{name.replace('/', '-')}.db",
+            read_pool_size=args.read_pool,
+            cache_size=args.cache_size,
+        )
+        store.upsert_members(map(_member, range(args.members)))
+        store.flush()
+        seeded = store.stats()
+        ops_per_sec = asyncio.run(run_store(store, plan, args.concurrency))
+        stats = {key: value - seeded[key] for key, value in store.stats().items()}
+        store.close()
+
+        naive_path = tmp / f"{name.replace('/', '-')}-naive.db"
+        _seed_naive(naive_path, args.members)
+        naive_ops = run_naive(naive_path, plan[: args.naive_ops])
+
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = stats["hits"] / lookups if lookups else 0.0
+        writes_per_commit = (
+            stats["writes"] / stats["commits"] if stats["commits"] else 0
+        )
+        print(
+            f"{name:<10} store {ops_per_sec:>10,.0f} ops/s"
+            f"  (cache hit {hit_rate:5.1%}, {writes_per_commit:6.1f} writes/commit)"
+            f"   naive {naive_ops:>10,.0f} ops/s  ({ops_per_sec / naive_ops:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark: biaya per transaksi GET /trx vs POST /trx/batch (1, 100, 10.000).
+
+App dirakit seperti `src.main` (router + RequestContextMiddleware + exception
+handler) dan dipanggil in-process lewat `httpx.ASGITransport`, sehingga angka
+mencakup middleware, validasi, handler, dan serialisasi response tanpa
+jaringan.
+
+Jalankan dari root project:
+    python -m scripts.bench_trx_batch --total 20000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+from fastapi import FastAPI
+from loguru import logger
+
+from src.api.api_trx import router
+from src.core.exceptions import register_exception_handlers
+from src.core.middlewares import RequestContextMiddleware
+from src.domain.member.registry import MemberRecord, MemberRegistry
+from src.services.auth import AuthenticationService
+from src.services.siganture_auth import OtomaxSignatureService
+
+
+def make_app() -> FastAPI:
+    registry = MemberRegistry(
+        [MemberRecord("TESTOK01", "1111", "TESTOK01", "127.0.0.1", "")]
+    )
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+    register_exception_handlers(app)
+    app.include_router(router)
+    app.state.auth_service = AuthenticationService(OtomaxSignatureService, registry)
+    return app
+
+
+def item(i: int) -> dict:
+    return {
+        "trxid": f"T{i}",
+        "memberid": "TESTOK01",
+        "product": "PROD",
+        "dest": "081",
+        "pin": "1111",
+        "password": "TESTOK01",
+    }
+
+
+async def run(total: int) -> None:
+    transport = httpx.ASGITransport(app=make_app(), client=("127.0.0.1", 5000))
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        n = min(total, 5_000)
+        start = time.perf_counter()
+        for i in range(n):
+            response = await client.get("/trx", params=item(i))
+            assert response.status_code == 200
+        single = (time.perf_counter() - start) / n * 1e6
+        print(f"GET /trx           : {single:8.2f} us/trx")
+
+        for size in (1, 100, 10_000):
+            batches = max(total // size, 1)
+            bodies = [
+                json.dumps([item(b * size + i) for i in range(size)]).encode()
+                for b in range(batches)
+            ]
+            start = time.perf_counter()
+            for body in bodies:
+                response = await client.post(
+                    "/trx/batch",
+                    content=body,
+                    headers={"content-type": "application/json"},
+                )
+                assert response.status_code == 200
+            per_trx = (time.perf_counter() - start) / (batches * size) * 1e6
+            print(f"POST batch {size:>6}: {per_trx:8.2f} us/trx")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--total", type=int, default=20_000)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(lambda _: None, level="INFO")
+    asyncio.run(run(args.total))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark: decodes/sec query string `/trx`, `decode_trx_query` vs model `Auth`.
+
+Baseline meniru jalur `Annotated[Auth, Query()]` FastAPI: `QueryParams`
+Starlette, susun dict per field lalu `Auth.model_validate`.
+
+Jalankan dari root project:
+    python -m scripts.bench_trx_query --repeat 200000
+"""
+
+import argparse
+import time
+
+from fastapi.exceptions import RequestValidationError
+from starlette.datastructures import QueryParams
+
+from src.api.api_trx import Auth, decode_trx_query
+
+CASES = {
+    "pin+password": b"trxid=2407150001&memberid=TESTOK01&dest=081234567890"
+    b"&product=TSEL10&pin=1111&password=TESTOK01",
+    "sign": b"trxid=2407150002&memberid=TESTOK01&dest=081234567890"
+    b"&product=TSEL10&sign=Zm9vYmFyYmF6cXV4cXV1eA",
+    "percent-encoded": b"trxid=2407150003&memberid=TESTOK01&dest=0812%2034567890"
+    b"&product=TSEL+10&pin=1111&password=TEST%2BOK01",
+    "invalid (422)": b"trxid=2407150004&memberid=TESTOK01&dest=081234567890"
+    b"&product=TSEL10&pin=1111",
+}
+
+
+def pydantic_query(query_string: bytes) -> Auth:
+    received = QueryParams(query_string)
+    data = {name: received[name] for name in Auth.model_fields if name in received}
+    return Auth.model_validate(data)
+
+
+def measure(decode, query_string: bytes, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        try:
+            decode(query_string)
+        except (RequestValidationError, ValueError):
+            pass
+    return repeat / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200_000)
+    args = parser.parse_args()
+
+    for name, query_string in CASES.items():
+        baseline = measure(pydantic_query, query_string, args.repeat)
+        decoder = measure(decode_trx_query, query_string, args.repeat)
+        print(
+            f"{name:<16} pydantic {baseline:>12,.0f}/s  decoder {decoder:>12,.0f}/s"
+            f"  ({decoder / baseline:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
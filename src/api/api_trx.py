@@ -1,11 +1,28 @@
+"""Endpoint transaksi `/trx` dan `/trx/batch` beserta decoder query-nya."""
+
+import contextlib
+from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query, Request
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.openapi.utils import (
+    validation_error_definition,
+    validation_error_response_definition,
+)
+from pydantic import BaseModel, TypeAdapter, ValidationError, model_validator
+from pydantic_core import from_json
+from starlette.datastructures import QueryParams
 
-from src.config.settings import get_settings
-from src.services.auth import AuthenticationService, AuthError
-from src.services.siganture_auth import OtomaxSignatureService
+from src.api.dependencies import get_auth_service, get_report_dispatcher
+from src.api.responses import TrxResponse
+from src.core.exceptions.errorcases import InvalidInputError
+from src.core.middlewares.rate_limit import item_admission
+from src.core.query import parse_query
+from src.services.auth import AuthenticationService
+from src.services.report_dispatcher import ReportDispatcher
+from src.services.store import SqliteStore
 
 router = APIRouter(tags=["Transaction"])
 
@@ -25,13 +42,258 @@ class Auth(BaseModel):
 
     model_config = {"extra": "forbid", "str_strip_whitespace": True}
 
+    @model_validator(mode="after")
+    def check_pin_or_sign(self) -> "Auth":
+        """Wajib ada pin+password atau sign."""
+        if (self.pin is None or self.password is None) and self.sign is None:
+            raise ValueError("Provide either 'pin' and 'password', or 'sign'.")
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class TrxQuery:
+    """Parameter `/trx` hasil `decode_trx_query`, field sama dengan `Auth`."""
+
+    trxid: str
+    memberid: str
+    dest: str
+    product: str
+    pin: str | None = None
+    password: str | None = None
+    sign: str | None = None
+
 
-@router.get("/trx")
-async def get_trx(auth: Annotated[Auth, Query()], request: Request):
-    """Endpoint transaksi. Semua logika auth didelegasikan ke service."""
-    auth_service = AuthenticationService(OtomaxSignatureService, get_settings())
+_QUERY_FIELDS = frozenset(Auth.model_fields)
+_REQUIRED_FIELDS = frozenset(
+    name for name, field in Auth.model_fields.items() if field.is_required()
+)
+
+
+def decode_trx_query(query_string: bytes) -> TrxQuery:
+    """Parse `scope["query_string"]` `/trx` sekali jalan tanpa pydantic.
+
+    Decoding lewat `parse_query` (aturan `QueryParams` Starlette, nilai
+    terakhir untuk key yang sama yang dipakai). Query yang tidak valid (key
+    asing, field wajib tidak ada, tanpa pin+password maupun sign) divalidasi ulang
+    lewat model `Auth` agar error 422-nya identik dengan `Query()` FastAPI.
+
+    Raises:
+        RequestValidationError: query tidak valid (dirender 422 oleh FastAPI).
+    """
+    params = parse_query(query_string)
+    keys = params.keys()
+    if (
+        keys <= _QUERY_FIELDS
+        and keys >= _REQUIRED_FIELDS
+        and (("pin" in keys and "password" in keys) or "sign" in keys)
+    ):
+        return TrxQuery(**params)
+    return _validate_query(query_string)
+
+
+def _validate_query(query_string: bytes) -> TrxQuery:
+    """Jalur lambat: susun input persis seperti FastAPI untuk `Query()` model."""
+    received = QueryParams(query_string)
+    data = {name: received[name] for name in _QUERY_FIELDS if name in received}
+    for key in received:
+        if key not in data:
+            values = received.getlist(key)
+            data[key] = values[0] if len(values) == 1 else values
     try:
-        result = auth_service.authenticate_transaction(auth, request.client.host)
-    except AuthError as exc:
-        raise HTTPException(status_code=exc.status_code, detail=exc.detail)
-    return result
+        auth = Auth.model_validate(data)
+    except ValidationError as exc:
+        errors = [
+            {**error, "loc": ("query", *error["loc"])}
+            for error in exc.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors) from exc
+    return TrxQuery(**auth.model_dump())
+
+
+def _query_openapi() -> dict:
+    """Parameter dan response 422 OpenAPI `/trx` seperti pada `Query()` model.
+
+    Handler tidak mendeklarasikan parameter, jadi FastAPI tidak membuat
+    keduanya sendiri; skema error ditulis inline karena komponen
+    `HTTPValidationError` hanya didaftarkan untuk route yang berparameter.
+    """
+    properties = Auth.model_json_schema()["properties"]
+    parameters = [
+        {
+            "name": name,
+            "in": "query",
+            "required": field.is_required(),
+            "schema": {k: v for k, v in properties[name].items() if k != "default"},
+        }
+        for name, field in Auth.model_fields.items()
+    ]
+    error_schema = {
+        **validation_error_response_definition,
+        "properties": {
+            "detail": {
+                "title": "Detail",
+                "type": "array",
+                "items": validation_error_definition,
+            }
+        },
+    }
+    return {
+        "parameters": parameters,
+        "responses": {
+            "422": {
+                "description": "Validation Error",
+                "content": {"application/json": {"schema": error_schema}},
+            }
+        },
+    }
+
+
+@router.get(
+    "/trx",
+    response_class=TrxResponse,
+    openapi_extra=_query_openapi(),
+)
+async def get_trx(
+    request: Request,
+    auth_service: Annotated[AuthenticationService, Depends(get_auth_service)],
+    reports: Annotated[ReportDispatcher | None, Depends(get_report_dispatcher)],
+):
+    """Endpoint transaksi. Semua logika auth didelegasikan ke service.
+
+    Query string di-decode oleh `decode_trx_query` (tanpa model pydantic);
+    error validasi tetap sama dengan model `Auth`. Jika member dibaca dari
+    `SqliteStore`, cache member diisi lebih dulu lewat `aget`.
+    `AuthError` dibiarkan naik ke `app_exception_handler`. Laporan ke
+    `report_url` member hanya diantrikan; pengiriman berjalan di background.
+    Hasil dikembalikan sebagai `TrxResponse` agar FastAPI tidak menjalankan
+    `jsonable_encoder` untuk bentuk hasil yang sudah pasti.
+    """
+    auth = decode_trx_query(request.scope["query_string"])
+    await prewarm_members(auth_service, (auth.memberid,))
+    result = auth_service.authenticate_transaction(auth, request.client.host)
+    if reports is not None:
+        await _submit_report(auth_service, reports, result)
+    return TrxResponse(result)
+
+
+async def prewarm_members(
+    auth_service: AuthenticationService, memberids: Iterable[str]
+) -> None:
+    """Isi cache member `SqliteStore` lewat thread executor.
+
+    Lookup member di service bersifat sinkron; tanpa pre-warm, cache miss
+    menjalankan query SQLite di event loop. Tanpa store tidak melakukan apa-apa.
+    """
+    registry = auth_service.registry
+    if isinstance(registry, SqliteStore):
+        await registry.aget_many(memberids)
+
+
+MAX_BATCH_SIZE = 10_000
+# ~400 byte per item sudah jauh di atas ukuran item normal (~150 byte)
+MAX_BATCH_BYTES = MAX_BATCH_SIZE * 400
+_AUTH_LIST = TypeAdapter(list[Auth])
+
+
+def _batch_too_large(message: str) -> InvalidInputError:
+    return InvalidInputError(message, status_code=413)
+
+
+async def read_batch_body(request: Request) -> bytes:
+    """Baca body batch dengan batas `MAX_BATCH_BYTES`.
+
+    `Content-Length` dicek sebelum body dibaca; body chunked dihitung per
+    chunk sehingga request yang kebesaran dihentikan sebelum seluruhnya
+    ditahan di memori.
+
+    Raises:
+        InvalidInputError: body melebihi `MAX_BATCH_BYTES` (413).
+    """
+    too_large = f"body batch maksimal {MAX_BATCH_BYTES} byte"
+    length = request.headers.get("content-length", "")
+    if length.isdigit() and int(length) > MAX_BATCH_BYTES:
+        raise _batch_too_large(too_large)
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > MAX_BATCH_BYTES:
+            raise _batch_too_large(too_large)
+    return bytes(body)
+
+
+def parse_batch(body: bytes) -> list[Auth]:
+    """Validasi body JSON array atau NDJSON menjadi list `Auth` sekali jalan.
+
+    Jumlah item dihitung sebelum validasi model agar batch kebesaran tidak
+    sempat dibangun (atau menghasilkan jutaan error). NDJSON dihitung per
+    baris lalu digabung menjadi satu JSON array agar tetap divalidasi oleh
+    satu `TypeAdapter(list[Auth])`. JSON array yang mungkin melebihi batas
+    (jumlah koma >= `MAX_BATCH_SIZE`) di-parse dulu untuk dihitung, lalu
+    hasil parse-nya yang divalidasi.
+
+    Raises:
+        RequestValidationError: body tidak valid (dirender 422 oleh FastAPI).
+        InvalidInputError: jumlah item melebihi `MAX_BATCH_SIZE`.
+    """
+    body = body.strip()
+    items = None
+    if not body.startswith(b"["):
+        lines = [line for line in body.split(b"\n") if line.strip()]
+        count = len(lines)
+        body = b"[" + b",".join(lines) + b"]"
+    elif body.count(b",") >= MAX_BATCH_SIZE:
+        # JSON rusak: items tetap None, error 422 dibuat oleh validate_json
+        with contextlib.suppress(ValueError):
+            items = from_json(body)
+        count = len(items) if isinstance(items, list) else 0
+    else:
+        count = 0
+    if count > MAX_BATCH_SIZE:
+        raise _batch_too_large(f"batch maksimal {MAX_BATCH_SIZE} transaksi")
+    try:
+        if items is None:
+            return _AUTH_LIST.validate_json(body)
+        return _AUTH_LIST.validate_python(items)
+    except ValidationError as exc:
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in exc.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors) from exc
+
+
+@router.post("/trx/batch")
+async def post_trx_batch(
+    request: Request,
+    auth_service: Annotated[AuthenticationService, Depends(get_auth_service)],
+    reports: Annotated[ReportDispatcher | None, Depends(get_report_dispatcher)],
+):
+    """Autentikasi banyak transaksi dalam satu request (JSON array / NDJSON).
+
+    Hasil per item dikembalikan dengan urutan yang sama dengan input; item
+    yang gagal berstatus `error` tanpa menggagalkan item lain. Rate limit
+    dikenakan per item (token IP dan member), bukan sekali per request;
+    item yang melebihi limit berstatus error 429.
+    """
+    auths = parse_batch(await read_batch_body(request))
+    await prewarm_members(auth_service, (auth.memberid for auth in auths))
+    results = auth_service.authenticate_many(
+        auths, request.client.host, admit=item_admission(request)
+    )
+    if reports is not None:
+        for result in results:
+            if result["status"] == "success":
+                await _submit_report(auth_service, reports, result)
+    return {"results": results}
+
+
+async def _submit_report(
+    auth_service: AuthenticationService, reports: ReportDispatcher, result: dict
+) -> None:
+    registry = auth_service.registry
+    if isinstance(registry, SqliteStore):
+        member = await registry.aget(result["memberid"])
+    else:
+        member = registry.current.get(result["memberid"])
+    if member is not None and member.report_url:
+        reports.submit(member.report_url, result)
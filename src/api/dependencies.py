@@ -0,0 +1,163 @@
+"""FastAPI dependencies untuk komponen app-scoped.
+
+Komponen dibangun sekali di `lifespan` (lihat `src.main`) dan disimpan di
+`app.state`. Dependency di sini hanya membaca instance tersebut, dengan
+fallback lazy-build jika app dijalankan tanpa lifespan (mis. test sederhana).
+"""
+
+from fastapi import Request
+
+from src.config.settings import (
+    get_idempotency_settings,
+    get_journal_settings,
+    get_reload_settings,
+    get_report_settings,
+    get_store_settings,
+)
+from src.core.shared_state import SharedIdempotencyStore, get_shared_state
+from src.domain.member.provider import RegistryProvider
+from src.domain.member.registry import MemberRegistry, get_registry
+from src.services.auth import AuthenticationService
+from src.services.idempotency import IdempotencyStore
+from src.services.journal import TransactionJournal
+from src.services.report_dispatcher import ReportDispatcher
+from src.services.siganture_auth import OtomaxSignatureService
+from src.services.store import SqliteStore
+
+
+def build_idempotency_store() -> IdempotencyStore | SharedIdempotencyStore | None:
+    """Bangun cache idempotency trxid sesuai settings, None jika dimatikan.
+
+    Di mode server multi-worker, cache bersama di shared memory yang dipakai.
+    """
+    settings = get_idempotency_settings()
+    if not settings.enabled:
+        return None
+    shared = get_shared_state()
+    if shared is not None and shared.idempotency is not None:
+        return shared.idempotency
+    return IdempotencyStore(
+        max_size=settings.max_size,
+        ttl=settings.ttl,
+        path=settings.path,
+        flush_interval_ms=settings.flush_interval_ms,
+    )
+
+
+def build_journal() -> TransactionJournal | None:
+    """Bangun journal transaksi sesuai settings, None jika dimatikan."""
+    settings = get_journal_settings()
+    if not settings.enabled:
+        return None
+    return TransactionJournal(
+        settings.path, commit_interval_ms=settings.commit_interval_ms
+    )
+
+
+def build_registry_provider() -> RegistryProvider | None:
+    """Bangun provider registry dengan hot reload, None jika dimatikan."""
+    settings = get_reload_settings()
+    if not settings.enabled:
+        return None
+    return RegistryProvider.from_settings(settings.env_path, settings.interval)
+
+
+def build_store() -> SqliteStore | None:
+    """Bangun store SQLite sesuai settings, None jika dimatikan.
+
+    Tabel member di-seed dari registry settings jika masih kosong.
+    """
+    settings = get_store_settings()
+    if not settings.enabled:
+        return None
+    return SqliteStore.from_registry(
+        get_registry(),
+        settings.path,
+        read_pool_size=settings.read_pool_size,
+        cache_size=settings.cache_size,
+        negative_cache_size=settings.negative_cache_size,
+        batch_size=settings.batch_size,
+        synchronous=settings.synchronous,
+    )
+
+
+def build_auth_service(
+    registry: RegistryProvider | None = None,
+    store: SqliteStore | None = None,
+) -> AuthenticationService:
+    """Bangun pipeline autentikasi dari registry member aplikasi.
+
+    Args:
+        registry: provider hot reload; default registry statis dari settings.
+        store: store SQLite; jika ada, dipakai sebagai sumber member dan
+            tujuan pencatatan transaksi (menggantikan journal biner). Jika
+            `registry` juga ada, snapshot hasil reload disinkronkan ke store.
+    """
+    if store is not None:
+        if registry is not None:
+            _sync_store_on_reload(registry, store)
+        return AuthenticationService(
+            OtomaxSignatureService,
+            store,
+            idempotency=build_idempotency_store(),
+            journal=store,
+        )
+    return AuthenticationService(
+        OtomaxSignatureService,
+        registry or get_registry(),
+        idempotency=build_idempotency_store(),
+        journal=build_journal(),
+    )
+
+
+def _sync_store_on_reload(registry: RegistryProvider, store: SqliteStore) -> None:
+    """Sambungkan hot reload registry ke tabel member dan toggle IP check store."""
+    publish = registry.on_reload
+    snapshot = registry.current
+    store.sync_members(snapshot)
+    store.enable_ip_check = snapshot.enable_ip_check
+
+    def on_reload(new: MemberRegistry) -> None:
+        nonlocal snapshot
+        store.sync_members(new, previous=snapshot)
+        store.enable_ip_check = new.enable_ip_check
+        snapshot = new
+        if publish is not None:
+            publish(new)
+
+    registry.on_reload = on_reload
+
+
+def build_report_dispatcher() -> ReportDispatcher | None:
+    """Bangun dispatcher callback laporan member, None jika dimatikan."""
+    settings = get_report_settings()
+    if not settings.enabled:
+        return None
+    return ReportDispatcher(
+        max_connections=settings.max_connections,
+        max_connections_per_host=settings.max_connections_per_host,
+        batch_size=settings.batch_size,
+        timeout=settings.timeout,
+        max_attempts=settings.max_attempts,
+        base_delay=settings.base_delay,
+        max_delay=settings.max_delay,
+        max_retry=settings.max_retry,
+        max_pending_per_url=settings.max_pending_per_url,
+        max_pending=settings.max_pending,
+        retry_path=settings.retry_path,
+        persist_interval=settings.persist_interval,
+    )
+
+
+def get_auth_service(request: Request) -> AuthenticationService:
+    """Ambil `AuthenticationService` app-scoped dari `app.state`."""
+    state = request.app.state
+    service = getattr(state, "auth_service", None)
+    if service is None:
+        service = state.auth_service = build_auth_service()
+    return service
+
+
+def get_report_dispatcher(request: Request) -> ReportDispatcher | None:
+    """Ambil dispatcher laporan app-scoped, None jika tidak aktif."""
+    return getattr(request.app.state, "report_dispatcher", None)
@@ -0,0 +1,91 @@
+"""Response JSON ter-encode langsung ke bytes untuk endpoint transaksi.
+
+Handler yang mengembalikan dict dilewatkan FastAPI ke `jsonable_encoder`
+(traversal rekursif + copy) lalu `json.dumps` di `JSONResponse`. Hasil sukses
+`/trx` selalu berbentuk tetap `{"status", "trxid", "memberid", "sign"}` dengan
+nilai string, jadi `TrxResponse` cukup menyambung nilai yang sudah di-escape
+ke template. Handler mengembalikan instance response secara langsung sehingga
+FastAPI tidak menjalankan serialisasi sama sekali.
+
+Body yang tidak berbentuk tersebut (mis. hasil batch) di-encode dengan
+`json.dumps` yang setara `JSONResponse`. Output selalu identik byte per byte
+dengan `JSONResponse` untuk dict yang sama.
+"""
+
+import json
+from json.encoder import encode_basestring
+from typing import Any
+
+from fastapi.responses import Response
+
+_SUCCESS_KEYS = ("status", "trxid", "memberid", "sign")
+
+PONG_BODY = b'{"message":"pong"}'
+
+
+def _dumps(content: Any) -> bytes:
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def render_trx(result: dict) -> bytes:
+    """Encode hasil transaksi; bentuk sukses lewat template tanpa `json.dumps`.
+
+    Args:
+        result: hasil `AuthenticationService.authenticate_transaction`.
+
+    Returns:
+        body JSON identik dengan `JSONResponse(result).body`.
+    """
+    if len(result) == 4 and tuple(result) == _SUCCESS_KEYS:
+        status, trxid, memberid, sign = result.values()
+        if (
+            type(status) is str
+            and type(trxid) is str
+            and type(memberid) is str
+            and type(sign) is str
+        ):
+            return (
+                f'{{"status":{encode_basestring(status)},'
+                f'"trxid":{encode_basestring(trxid)},'
+                f'"memberid":{encode_basestring(memberid)},'
+                f'"sign":{encode_basestring(sign)}}}'
+            ).encode()
+    return _dumps(result)
+
+
+class TrxResponse(Response):
+    """Response JSON untuk hasil transaksi, di-encode lewat `render_trx`."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Bytes diteruskan apa adanya, dict hasil transaksi lewat `render_trx`."""
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, dict):
+            return render_trx(content)
+        return _dumps(content)
+
+
+class PongResponse(Response):
+    """Response `/ping` dengan body dan header yang dibangun sekali.
+
+    `__init__` hanya mengisi atribut yang dipakai `Response.__call__`; header
+    disalin dari template agar header tambahan per request tidak bocor.
+    Parameter `status_code` dibaca FastAPI saat membangun skema OpenAPI.
+    """
+
+    media_type = "application/json"
+
+    def __init__(self, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.background = None
+        self.body = PONG_BODY
+        self.raw_headers = list(_PONG_HEADERS)
+
+
+_PONG_HEADERS = tuple(
+    Response(PONG_BODY, media_type=PongResponse.media_type).raw_headers
+)
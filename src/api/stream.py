@@ -0,0 +1,301 @@
+"""Autentikasi transaksi NDJSON secara streaming dengan memori terbatas.
+
+Dipakai oleh endpoint `POST /trx/stream` dan CLI `python -m src.reconcile`
+untuk replay rekonsiliasi akhir hari. Input dibaca baris per baris, setiap
+`CHUNK_SIZE` record divalidasi lalu diautentikasi lewat
+`AuthenticationService.authenticate_many`, dan hasilnya langsung dikirim
+sebagai NDJSON. Yang ditahan di memori hanya satu chunk record plus satu
+baris yang belum lengkap, sehingga peak RSS tidak bergantung pada ukuran
+input.
+
+Baris yang tidak valid (JSON rusak, field kurang, melebihi `MAX_LINE_BYTES`)
+menghasilkan item `{"status": "error", "line": n, "rc": "ValidationError",
+"message": ...}` tanpa menghentikan stream. Urutan output sama dengan urutan
+baris input (baris kosong dilewati).
+
+Pasangan (memberid, trxid) dilacak di seluruh stream, bukan hanya per chunk,
+sehingga duplikat di chunk berbeda tetap ditolak 409. Endpoint HTTP mengenai
+rate limit per baris (lihat `item_admission`) dan berhenti setelah
+`MAX_STREAM_LINES` baris dengan item error `InvalidInputError`.
+"""
+
+import asyncio
+import json
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request
+from pydantic import ValidationError
+from starlette.requests import ClientDisconnect
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from src.api.api_trx import Auth, prewarm_members
+from src.api.dependencies import get_auth_service
+from src.core.middlewares.rate_limit import item_admission
+from src.services.auth import AuthenticationService
+
+router = APIRouter(tags=["Transaction"])
+
+CHUNK_SIZE = 500
+MAX_LINE_BYTES = 64 * 1024
+MAX_STREAM_LINES = 1_000_000
+
+Admit = Callable[[str], float]
+
+
+def _validation_error(lineno: int, message: str) -> dict:
+    return {
+        "status": "error",
+        "line": lineno,
+        "rc": "ValidationError",
+        "message": message,
+    }
+
+
+def _too_many_lines(lineno: int, max_lines: int) -> bytes:
+    error = {
+        "status": "error",
+        "line": lineno,
+        "rc": "InvalidInputError",
+        "message": f"stream maksimal {max_lines} baris",
+    }
+    return json.dumps(error, separators=(",", ":")).encode() + b"\n"
+
+
+def _process(
+    service: AuthenticationService,
+    lines: list[tuple[int, bytes | None]],
+    client_ip: str,
+    seen: set[tuple[str, str]],
+    admit: Admit | None = None,
+) -> bytes:
+    """Validasi + autentikasi satu chunk, kembalikan NDJSON hasilnya."""
+    return _authenticate(service, *_validate(lines), client_ip, seen, admit)
+
+
+async def _aprocess(
+    service: AuthenticationService,
+    lines: list[tuple[int, bytes | None]],
+    client_ip: str,
+    seen: set[tuple[str, str]],
+    admit: Admit | None = None,
+) -> bytes:
+    """Versi async `_process`: cache member store diisi dulu lewat `aget`."""
+    results, slots, auths = _validate(lines)
+    await prewarm_members(service, (auth.memberid for auth in auths))
+    return _authenticate(service, results, slots, auths, client_ip, seen, admit)
+
+
+def _validate(
+    lines: list[tuple[int, bytes | None]],
+) -> tuple[list[dict | None], list[int], list[Auth]]:
+    """Validasi satu chunk; slot None di `results` menunggu hasil autentikasi."""
+    results: list[dict | None] = []
+    auths: list[Auth] = []
+    slots: list[int] = []
+    for lineno, line in lines:
+        if line is None:
+            results.append(_validation_error(lineno, "baris melebihi batas panjang"))
+            continue
+        try:
+            auth = Auth.model_validate_json(line)
+        except ValidationError as exc:
+            error = exc.errors(include_url=False)[0]
+            results.append(_validation_error(lineno, error["msg"]))
+            continue
+        slots.append(len(results))
+        results.append(None)
+        auths.append(auth)
+    return results, slots, auths
+
+
+def _authenticate(
+    service: AuthenticationService,
+    results: list[dict | None],
+    slots: list[int],
+    auths: list[Auth],
+    client_ip: str,
+    seen: set[tuple[str, str]],
+    admit: Admit | None,
+) -> bytes:
+    processed = service.authenticate_many(auths, client_ip, admit=admit, seen=seen)
+    for slot, result in zip(slots, processed, strict=True):
+        results[slot] = result
+    return b"".join(
+        json.dumps(result, separators=(",", ":")).encode() + b"\n" for result in results
+    )
+
+
+def iter_lines(
+    chunks: Iterable[bytes], max_line: int = MAX_LINE_BYTES
+) -> Iterator[tuple[int, bytes | None]]:
+    """Pecah aliran bytes menjadi (nomor baris, baris); None jika terlalu panjang."""
+    splitter = _LineSplitter(max_line)
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    yield from splitter.finish()
+
+
+async def aiter_lines(
+    chunks: AsyncIterable[bytes], max_line: int = MAX_LINE_BYTES
+) -> AsyncIterator[tuple[int, bytes | None]]:
+    """Versi async dari `iter_lines` untuk ASGI receive stream."""
+    splitter = _LineSplitter(max_line)
+    async for chunk in chunks:
+        for item in splitter.feed(chunk):
+            yield item
+    for item in splitter.finish():
+        yield item
+
+
+def authenticate_lines(
+    service: AuthenticationService,
+    lines: Iterable[tuple[int, bytes | None]],
+    client_ip: str,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Autentikasi baris NDJSON per chunk, yield NDJSON hasil per chunk."""
+    seen: set[tuple[str, str]] = set()
+    batch: list[tuple[int, bytes | None]] = []
+    for item in lines:
+        batch.append(item)
+        if len(batch) >= chunk_size:
+            yield _process(service, batch, client_ip, seen)
+            batch = []
+    if batch:
+        yield _process(service, batch, client_ip, seen)
+
+
+async def aauthenticate_lines(
+    service: AuthenticationService,
+    lines: AsyncIterable[tuple[int, bytes | None]],
+    client_ip: str,
+    chunk_size: int = CHUNK_SIZE,
+    admit: Admit | None = None,
+    max_lines: int | None = None,
+) -> AsyncIterator[bytes]:
+    """Versi async dari `authenticate_lines` untuk response streaming.
+
+    Args:
+        service: service autentikasi app.
+        lines: pasangan (nomor baris, baris) dari `aiter_lines`.
+        client_ip: IP client pengirim stream.
+        chunk_size: jumlah record per panggilan `authenticate_many`.
+        admit: pengambil token rate limit per baris (`item_admission`).
+        max_lines: nomor baris maksimum; stream dihentikan dengan item error
+            setelah batas ini terlewati.
+    """
+    seen: set[tuple[str, str]] = set()
+    batch: list[tuple[int, bytes | None]] = []
+    async for item in lines:
+        if max_lines is not None and item[0] > max_lines:
+            if batch:
+                yield await _aprocess(service, batch, client_ip, seen, admit)
+            yield _too_many_lines(item[0], max_lines)
+            return
+        batch.append(item)
+        if len(batch) >= chunk_size:
+            yield await _aprocess(service, batch, client_ip, seen, admit)
+            batch = []
+            # beri kesempatan request lain di event loop yang sama
+            await asyncio.sleep(0)
+    if batch:
+        yield await _aprocess(service, batch, client_ip, seen, admit)
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """StreamingResponse yang boleh membaca body request sambil menulis response.
+
+    `StreamingResponse` bawaan (ASGI spec < 2.4) menjalankan task
+    `listen_for_disconnect` yang ikut memanggil `receive()` dan membuang
+    pesan body request. Di sini body dibaca oleh generator itu sendiri, jadi
+    response cukup ditulis langsung; disconnect terdeteksi lewat `OSError`
+    atau `ClientDisconnect` dari `request.stream()`.
+    """
+
+    media_type = "application/x-ndjson"
+
+    async def __call__(self, _scope: Scope, _receive: Receive, send: Send) -> None:
+        """Tulis response; `receive` sengaja tidak dipakai (lihat docstring kelas)."""
+        try:
+            await self.stream_response(send)
+        except OSError as exc:
+            raise ClientDisconnect() from exc
+        if self.background is not None:
+            await self.background()
+
+
+@router.post("/trx/stream", response_class=NDJSONStreamingResponse)
+async def post_trx_stream(
+    request: Request,
+    auth_service: Annotated[AuthenticationService, Depends(get_auth_service)],
+):
+    """Autentikasi body NDJSON besar secara streaming, hasil NDJSON per chunk."""
+    lines = aiter_lines(request.stream())
+    return NDJSONStreamingResponse(
+        aauthenticate_lines(
+            auth_service,
+            lines,
+            request.client.host,
+            admit=item_admission(request),
+            max_lines=MAX_STREAM_LINES,
+        )
+    )
+
+
+class _LineSplitter:
+    """Pemecah baris incremental dengan buffer maksimal `max_line` byte."""
+
+    __slots__ = ("_buffer", "_discarding", "_lineno", "_max_line")
+
+    def __init__(self, max_line: int) -> None:
+        self._buffer = bytearray()
+        self._discarding = False
+        self._lineno = 0
+        self._max_line = max_line
+
+    def feed(self, chunk: bytes) -> Iterator[tuple[int, bytes | None]]:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end < 0:
+                break
+            piece = chunk[start:end]
+            start = end + 1
+            self._lineno += 1
+            if self._discarding:
+                self._discarding = False
+                yield self._lineno, None
+                continue
+            if self._buffer:
+                self._buffer += piece
+                piece = bytes(self._buffer)
+                self._buffer.clear()
+            if len(piece) > self._max_line:
+                yield self._lineno, None
+            elif piece.strip():
+                yield self._lineno, piece
+
+        if not self._discarding:
+            self._buffer += chunk[start:]
+            if len(self._buffer) > self._max_line:
+                # buang sisa baris ini sampai newline berikutnya
+                self._buffer.clear()
+                self._discarding = True
+
+    def finish(self) -> Iterator[tuple[int, bytes | None]]:
+        if self._discarding:
+            self._lineno += 1
+            yield self._lineno, None
+        elif self._buffer.strip():
+            self._lineno += 1
+            yield self._lineno, bytes(self._buffer)
+        self._buffer.clear()
+        self._discarding = False
@@ -1,7 +1,9 @@
-# [ ] TODO : document this module bro
+"""Settings aplikasi per kelompok (`BaseSettings` dengan env prefix) dan getter ter-cache."""
+
 from functools import lru_cache
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
 
@@ -12,7 +14,8 @@ class UserCred(BaseModel):
         - memberid: member identifier
         - password: shared password
         - pin: member pin
-        - memberip: allowed member IP (optionally with port)
+        - memberip: allowed member IP (optionally with port); multiple IPs or
+          CIDR ranges may be given separated by commas
         - memberreporturl: callback/report URL
         - enable_ip_check: toggle IP validation (env: OTO_ENABLE_IP_CHECK)
     """
@@ -28,9 +31,16 @@ class UserCred(BaseModel):
 
 
 class Settings(BaseSettings):
-    """application settings from environment variables."""
+    """application settings from environment variables.
+
+    Fields:
+        - OTO: credential member tunggal (mode default)
+        - MEMBER_SOURCE: path file JSON / SQLite berisi banyak member. Jika
+          di-set, registry member di-load dari file ini.
+    """
 
     OTO: UserCred
+    MEMBER_SOURCE: str | None = None
 
     model_config = {
         "env_file": ".env",
@@ -43,3 +53,273 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()  # type: ignore
+
+
+class IdempotencySettings(BaseSettings):
+    """settings cache idempotency trxid (env prefix: IDEMPOTENCY_).
+
+    Fields:
+        - enabled: aktifkan cache balasan untuk trxid yang dikirim ulang
+        - max_size: jumlah entry maksimum sebelum eviction LRU
+        - ttl: umur entry dalam detik
+        - path: file journal opsional agar cache bertahan saat restart
+        - flush_interval_ms: interval thread writer menulis journal ke disk
+    """
+
+    enabled: bool = True
+    max_size: int = 100_000
+    ttl: float = 600.0
+    path: str | None = None
+    flush_interval_ms: float = Field(default=10.0, gt=0)
+
+    model_config = {"env_prefix": "IDEMPOTENCY_", "env_file": ".env", "extra": "ignore"}
+
+
+@lru_cache
+def get_idempotency_settings() -> IdempotencySettings:
+    """Get cached idempotency settings instance."""
+    return IdempotencySettings()
+
+
+class LogSettings(BaseSettings):
+    """settings sink logging non-blocking (env prefix: LOG_).
+
+    Fields:
+        - queue_enabled: tulis log lewat queue + writer thread di background
+        - queue_path: file tujuan sink queue
+        - queue_maxsize: kapasitas queue (jumlah record)
+        - queue_overflow: "drop" (buang dan hitung) atau "block" saat queue penuh
+        - queue_block_timeout: detik maksimum menunggu di mode "block" sebelum drop
+        - queue_batch_size: jumlah record maksimum per write ke file
+        - queue_level: level minimum untuk sink queue
+    """
+
+    queue_enabled: bool = False
+    queue_path: str = "logs/app.log"
+    queue_maxsize: int = 10_000
+    queue_overflow: Literal["drop", "block"] = "drop"
+    queue_block_timeout: float = Field(default=1.0, gt=0)
+    queue_batch_size: int = 512
+    queue_level: str = "INFO"
+
+    model_config = {"env_prefix": "LOG_", "env_file": ".env", "extra": "ignore"}
+
+
+@lru_cache
+def get_log_settings() -> LogSettings:
+    """Get cached log settings instance."""
+    return LogSettings()
+
+
+class AccessLogSettings(BaseSettings):
+    """settings access log middleware (env prefix: ACCESS_LOG_).
+
+    Fields:
+        - sample_rate: log 1 dari N request sukses (1 = semua)
+        - slow_ms: request lebih lambat dari ini selalu di-log
+        - error_status: status >= nilai ini selalu di-log
+        - summary_interval: detik antar summary per route (0 = nonaktif)
+    """
+
+    sample_rate: int = Field(default=1, ge=1)
+    slow_ms: float = 1000.0
+    error_status: int = 400
+    summary_interval: float = 0.0
+
+    model_config = {
+        "env_prefix": "ACCESS_LOG_",
+        "env_file": ".env",
+        "extra": "ignore",
+    }
+
+
+@lru_cache
+def get_access_log_settings() -> AccessLogSettings:
+    """Get cached access log settings instance."""
+    return AccessLogSettings()
+
+
+class ProxySettings(BaseSettings):
+    """settings reverse proxy tepercaya (env prefix: PROXY_).
+
+    Fields:
+        - trusted: IP/CIDR proxy (dipisah koma) yang boleh mengisi
+          `X-Forwarded-For` / `X-Real-IP`; kosong = header diabaikan
+    """
+
+    trusted: str = "127.0.0.1,::1"
+
+    model_config = {"env_prefix": "PROXY_", "env_file": ".env", "extra": "ignore"}
+
+
+@lru_cache
+def get_proxy_settings() -> ProxySettings:
+    """Get cached trusted proxy settings instance."""
+    return ProxySettings()
+
+
+class RateLimitSettings(BaseSettings):
+    """settings rate limiter /trx (env prefix: RATE_LIMIT_).
+
+    Fields:
+        - enabled: aktifkan token bucket per member dan per IP
+        - paths: prefix path yang dibatasi
+        - member_burst / member_refill: kapasitas dan token per detik per memberid
+        - ip_burst / ip_refill: kapasitas dan token per detik per IP client
+        - idle_ttl: detik tanpa request sebelum bucket dibuang
+        - max_keys: jumlah bucket maksimum per jenis key
+    """
+
+    enabled: bool = True
+    paths: tuple[str, ...] = ("/trx",)
+    member_burst: float = Field(default=100.0, ge=1)
+    member_refill: float = Field(default=50.0, gt=0)
+    ip_burst: float = Field(default=200.0, ge=1)
+    ip_refill: float = Field(default=100.0, gt=0)
+    idle_ttl: float = 300.0
+    max_keys: int = 100_000
+
+    model_config = {"env_prefix": "RATE_LIMIT_", "env_file": ".env", "extra": "ignore"}
+
+
+@lru_cache
+def get_rate_limit_settings() -> RateLimitSettings:
+    """Get cached rate limit settings instance."""
+    return RateLimitSettings()
+
+
+class JournalSettings(BaseSettings):
+    """settings journal transaksi /trx (env prefix: JOURNAL_).
+
+    Fields:
+        - enabled: catat hasil transaksi sukses ke journal biner
+        - path: file journal (index disimpan di `<path>.idx`)
+        - commit_interval_ms: interval group commit (fsync)
+    """
+
+    enabled: bool = False
+    path: str = "data/trx.journal"
+    commit_interval_ms: float = Field(default=5.0, gt=0)
+
+    model_config = {"env_prefix": "JOURNAL_", "env_file": ".env", "extra": "ignore"}
+
+
+@lru_cache
+def get_journal_settings() -> JournalSettings:
+    """Get cached journal settings instance."""
+    return JournalSettings()
+
+
+class StoreSettings(BaseSettings):
+    """settings store SQLite member + transaksi (env prefix: STORE_).
+
+    Fields:
+        - enabled: baca member dari SQLite (cache LRU) dan catat transaksi sukses
+          ke tabel `transactions` menggantikan journal biner; tabel member
+          di-seed dari registry settings saat masih kosong; jika hot reload
+          (RELOAD_ENABLED) juga aktif, setiap snapshot baru disinkronkan ke
+          tabel member
+        - path: file database SQLite (mode WAL)
+        - read_pool_size: jumlah thread pembaca (satu koneksi per thread)
+        - cache_size: jumlah member maksimum di cache LRU
+        - negative_cache_size: jumlah memberid tidak dikenal yang di-cache
+        - batch_size: operasi tulis maksimum per transaksi writer
+        - synchronous: `PRAGMA synchronous` koneksi writer
+    """
+
+    enabled: bool = False
+    path: str = "data/otomax.db"
+    read_pool_size: int = Field(default=4, ge=1)
+    cache_size: int = Field(default=10_000, ge=1)
+    negative_cache_size: int = Field(default=1_024, ge=0)
+    batch_size: int = Field(default=512, ge=1)
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+
+    model_config = {"env_prefix": "STORE_", "env_file": ".env", "extra": "ignore"}
+
+
+@lru_cache
+def get_store_settings() -> StoreSettings:
+    """Get cached SQLite store settings instance."""
+    return StoreSettings()
+
+
+class ReportSettings(BaseSettings):
+    """settings callback laporan ke report_url member (env prefix: REPORT_).
+
+    Fields:
+        - enabled: aktifkan dispatcher callback
+        - max_connections: total koneksi pool HTTP
+        - max_connections_per_host: koneksi paralel per host member
+        - batch_size: laporan maksimum per request callback
+        - timeout: timeout request callback (detik)
+        - max_attempts: percobaan sebelum laporan dibuang
+        - base_delay / max_delay: batas backoff retry (detik)
+        - max_retry: kapasitas antrian retry
+        - max_pending_per_url: laporan pending maksimum per URL member
+        - max_pending: laporan pending maksimum untuk semua URL
+        - retry_path: file persistensi antrian laporan yang belum terkirim
+        - persist_interval: interval checkpoint antrian ke retry_path (detik)
+    """
+
+    enabled: bool = False
+    max_connections: int = Field(default=100, ge=1)
+    max_connections_per_host: int = Field(default=4, ge=1)
+    batch_size: int = Field(default=50, ge=1)
+    timeout: float = Field(default=5.0, gt=0)
+    max_attempts: int = Field(default=8, ge=1)
+    base_delay: float = Field(default=0.5, ge=0)
+    max_delay: float = Field(default=60.0, ge=0)
+    max_retry: int = Field(default=10_000, ge=1)
+    max_pending_per_url: int = Field(default=1_000, ge=1)
+    max_pending: int = Field(default=10_000, ge=1)
+    retry_path: str | None = "data/report_retry.jsonl"
+    persist_interval: float = Field(default=1.0, gt=0)
+
+    model_config = {"env_prefix": "REPORT_", "env_file": ".env", "extra": "ignore"}
+
+
+@lru_cache
+def get_report_settings() -> ReportSettings:
+    """Get cached report dispatcher settings instance."""
+    return ReportSettings()
+
+
+class ParserSettings(BaseSettings):
+    """settings parser balasan supplier (env prefix: PARSER_).
+
+    Fields:
+        - rules_path: file aturan TOML/JSON; None memakai aturan bawaan
+    """
+
+    rules_path: str | None = None
+
+    model_config = {"env_prefix": "PARSER_", "env_file": ".env", "extra": "ignore"}
+
+
+@lru_cache
+def get_parser_settings() -> ParserSettings:
+    """Get cached supplier parser settings instance."""
+    return ParserSettings()
+
+
+class ReloadSettings(BaseSettings):
+    """settings hot reload credential member (env prefix: RELOAD_).
+
+    Fields:
+        - enabled: pantau `.env` dan MEMBER_SOURCE, rebuild registry saat berubah
+        - interval: interval polling mtime (detik)
+        - env_path: file env yang dipantau
+    """
+
+    enabled: bool = False
+    interval: float = Field(default=2.0, gt=0)
+    env_path: str = ".env"
+
+    model_config = {"env_prefix": "RELOAD_", "env_file": ".env", "extra": "ignore"}
+
+
+@lru_cache
+def get_reload_settings() -> ReloadSettings:
+    """Get cached reload settings instance."""
+    return ReloadSettings()
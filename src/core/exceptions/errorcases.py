@@ -41,3 +41,10 @@ class DomainValidationError(AppBaseExceptionsError):
 
     DEFAULT_MESSAGE = "Validation error"
     DEFAULT_STATUS_CODE = 422
+
+
+class InsufficientBalanceError(DomainValidationError):
+    """Domain error: saldo (deposit) member tidak mencukupi."""
+
+    DEFAULT_MESSAGE = "Saldo tidak mencukupi"
+    DEFAULT_STATUS_CODE = 402
@@ -1,10 +1,87 @@
-from fastapi import FastAPI, Request  # noqa: D100
-from fastapi.responses import JSONResponse
+"""Exception handlers dengan body JSON yang sudah di-encode sebelumnya.
+
+Bentuk body error selalu sama: success, rc, message, trace_id. Prefix
+`{"success":false,"rc":"<NamaClass>","message":` di-encode sekali per class
+exception, message yang sering muncul di-cache, sehingga per request hanya
+message dan trace_id yang disambung ke template byte. Hasilnya identik dengan
+`JSONResponse` untuk dict yang sama.
+"""
+
+import json
+
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
 from loguru import logger
 from src.core.exceptions.base import AppBaseExceptionsError
 
+INTERNAL_ERROR_RC = "INTERNAL_SERVER_ERROR"
+INTERNAL_ERROR_MESSAGE = "Terjadi kesalahan internal, silakan hubungi admin."
+
+# batas cache message ter-encode agar message dinamis tidak membuat cache membengkak
+_MESSAGE_CACHE_LIMIT = 1024
+
+_prefix_cache: dict[str, bytes] = {}
+_message_cache: dict[str, bytes] = {}
+
+
+def _encode_str(value: str) -> bytes:
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def _prefix(rc: str) -> bytes:
+    prefix = _prefix_cache.get(rc)
+    if prefix is None:
+        prefix = _prefix_cache[rc] = (
+            b'{"success":false,"rc":' + _encode_str(rc) + b',"message":'
+        )
+    return prefix
+
+
+def _message(message: str) -> bytes:
+    encoded = _message_cache.get(message)
+    if encoded is None:
+        encoded = _encode_str(message)
+        if len(_message_cache) < _MESSAGE_CACHE_LIMIT:
+            _message_cache[message] = encoded
+    return encoded
+
+
+def _trace_id(trace_id: str) -> bytes:
+    # trace id dari middleware selalu alnum, aman disambung tanpa escaping
+    if trace_id.isascii() and trace_id.isalnum():
+        return b'"' + trace_id.encode("ascii") + b'"'
+    return _encode_str(trace_id)
+
+
+def render_error(rc: str, message: str, trace_id: str) -> bytes:
+    """Render body error dari template byte.
+
+    Args:
+        rc: kode error (nama class exception).
+        message: pesan error.
+        trace_id: trace id request.
+
+    Returns:
+        body JSON identik dengan `JSONResponse` untuk dict yang sama.
+    """
+    return b"".join(
+        (
+            _prefix(rc),
+            _message(message),
+            b',"trace_id":',
+            _trace_id(trace_id),
+            b"}",
+        )
+    )
+
+
+class ErrorResponse(Response):
+    """Response JSON untuk body error yang sudah berupa bytes."""
+
+    media_type = "application/json"
+
 
-async def app_exception_handler(request: Request, exc: Exception) -> JSONResponse:  # noqa: RUF029
+async def app_exception_handler(request: Request, exc: Exception) -> Response:
     """Handler for application-specific exceptions.
 
     Args:
@@ -17,31 +94,20 @@ async def app_exception_handler(request: Request, exc: Exception) -> JSONRespons
     trace_id = getattr(request.state, "trace_id", "unknown")
     # Cast exc to AppBaseExceptionsError
     if isinstance(exc, AppBaseExceptionsError):
-        return JSONResponse(
+        return ErrorResponse(
+            render_error(exc.__class__.__name__, str(exc), trace_id),
             status_code=exc.status_code,
-            content={
-                "success": False,
-                "rc": exc.__class__.__name__,
-                "message": str(exc),
-                "trace_id": trace_id,
-            },
+            headers=getattr(exc, "headers", None),
         )
     else:
         # fallback for unexpected types
-        return JSONResponse(
+        return ErrorResponse(
+            render_error(INTERNAL_ERROR_RC, INTERNAL_ERROR_MESSAGE, trace_id),
             status_code=500,
-            content={
-                "success": False,
-                "rc": "INTERNAL_SERVER_ERROR",
-                "message": "Terjadi kesalahan internal, silakan hubungi admin.",
-                "trace_id": trace_id,
-            },
         )
 
 
-async def unexpected_exception_handler(  # noqa: RUF029
-    request: Request, exc: Exception
-) -> JSONResponse:
+async def unexpected_exception_handler(request: Request, exc: Exception) -> Response:
     """Handler for unexpected system errors.
 
     Args:
@@ -52,16 +118,11 @@ async def unexpected_exception_handler(  # noqa: RUF029
         A JSON response with a generic error message.
     """
     trace_id = getattr(request.state, "trace_id", "unknown")
-    logger.opt(exception=exc).critical(f"UNEXPECTED ERROR | Trace: {trace_id}")
+    logger.opt(exception=exc).critical("UNEXPECTED ERROR | Trace: {}", trace_id)
     logger.debug("unexpected_exception_handler invoked")
-    return JSONResponse(
+    return ErrorResponse(
+        render_error(INTERNAL_ERROR_RC, INTERNAL_ERROR_MESSAGE, trace_id),
         status_code=500,
-        content={
-            "success": False,
-            "rc": "INTERNAL_SERVER_ERROR",
-            "message": "Terjadi kesalahan internal, silakan hubungi admin.",
-            "trace_id": trace_id,
-        },
     )
 
 
@@ -0,0 +1,195 @@
+"""Registry metrics in-process dengan export format teks Prometheus.
+
+Dirancang agar bisa selalu aktif di produksi:
+    - `Counter.inc` hanya menambah satu atribut
+    - `Histogram.observe_ns` memakai bucket log-linear ala HDR (4 sub-bucket
+      per kelipatan dua) yang dicari dengan `bisect` lalu menambah satu slot
+      list; tidak ada lock, cukup dengan atomisitas GIL untuk satu event loop
+
+Usage:
+    from src.core.metrics import metrics
+
+    hist = metrics.histogram("auth_stage_seconds", "...", stage="ip_check")
+    start = time.perf_counter_ns()
+    ...
+    hist.observe_ns(time.perf_counter_ns() - start)
+
+    text = metrics.render()  # untuk endpoint /metrics
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Mapping
+
+SUB_BUCKETS = 4
+
+
+def _log_linear_bounds(
+    low_ns: int = 256, high_ns: int = 10_000_000_000, sub_buckets: int = SUB_BUCKETS
+) -> tuple[int, ...]:
+    """Batas bucket (ns) log-linear: `sub_buckets` langkah rata per oktaf."""
+    bounds: list[int] = []
+    base = low_ns
+    while base < high_ns:
+        step = base // sub_buckets
+        bounds.extend(base + step * i for i in range(sub_buckets))
+        base *= 2
+    bounds.append(base)
+    return tuple(bounds)
+
+
+DEFAULT_BOUNDS_NS = _log_linear_bounds()
+
+
+def _format_labels(labels: dict[str, str], extra: str = "") -> str:
+    items = [f'{k}="{v}"' for k, v in labels.items()]
+    if extra:
+        items.append(extra)
+    return "{" + ",".join(items) + "}" if items else ""
+
+
+class Counter:
+    """Counter monoton naik."""
+
+    __slots__ = ("labels", "value")
+
+    def __init__(self, labels: dict[str, str]) -> None:
+        self.labels = labels
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        """Tambah counter."""
+        self.value += amount
+
+
+class Histogram:
+    """Histogram latency dengan bucket log-linear dalam nanodetik."""
+
+    __slots__ = ("bounds", "count", "counts", "labels", "sum_ns")
+
+    def __init__(
+        self, labels: dict[str, str], bounds: tuple[int, ...] = DEFAULT_BOUNDS_NS
+    ) -> None:
+        self.labels = labels
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum_ns = 0
+
+    def observe_ns(self, value_ns: int) -> None:
+        """Catat satu observasi dalam nanodetik."""
+        self.counts[bisect_left(self.bounds, value_ns)] += 1
+        self.count += 1
+        self.sum_ns += value_ns
+
+
+class MetricsRegistry:
+    """Kumpulan metric yang di-render sebagai teks Prometheus."""
+
+    def __init__(self) -> None:
+        # name -> (type, help, {label_key: metric})
+        self._families: dict[str, tuple[str, str, dict]] = {}
+        self._gauges: dict[str, tuple[str, dict]] = {}
+        # name -> (help, read snapshot, keys, nama label)
+        self._gauge_groups: dict[
+            str, tuple[str, Callable[[], Mapping[str, float]], tuple[str, ...], str]
+        ] = {}
+
+    def _family(self, name: str, kind: str, help_text: str) -> dict:
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = (kind, help_text, {})
+        elif family[0] != kind:
+            raise ValueError(f"metric {name!r} already registered as {family[0]}")
+        return family[2]
+
+    def counter(self, name: str, help_text: str, **labels: str) -> Counter:
+        """Ambil atau buat counter dengan label tertentu."""
+        metrics = self._family(name, "counter", help_text)
+        key = tuple(sorted(labels.items()))
+        metric = metrics.get(key)
+        if metric is None:
+            metric = metrics[key] = Counter(labels)
+        return metric
+
+    def histogram(self, name: str, help_text: str, **labels: str) -> Histogram:
+        """Ambil atau buat histogram dengan label tertentu."""
+        metrics = self._family(name, "histogram", help_text)
+        key = tuple(sorted(labels.items()))
+        metric = metrics.get(key)
+        if metric is None:
+            metric = metrics[key] = Histogram(labels)
+        return metric
+
+    def gauge(
+        self, name: str, help_text: str, read: Callable[[], float], **labels: str
+    ) -> None:
+        """Daftarkan gauge yang nilainya dibaca saat render."""
+        gauges = self._gauges.setdefault(name, (help_text, {}))[1]
+        gauges[tuple(sorted(labels.items()))] = (labels, read)
+
+    def gauge_group(
+        self,
+        name: str,
+        help_text: str,
+        read: Callable[[], Mapping[str, float]],
+        keys: Iterable[str],
+        label: str = "stat",
+    ) -> None:
+        """Daftarkan satu gauge per `keys` dari satu snapshot `read()`.
+
+        `read` (mis. `stats()` yang men-scan tabel shared memory) dipanggil
+        sekali per render, bukan sekali per seri.
+        """
+        self._gauge_groups[name] = (help_text, read, tuple(keys), label)
+
+    def render(self) -> str:
+        """Render semua metric dalam format teks Prometheus 0.0.4."""
+        lines: list[str] = []
+        for name, (kind, help_text, metrics) in self._families.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for metric in metrics.values():
+                if kind == "counter":
+                    lines.append(
+                        f"{name}{_format_labels(metric.labels)} {metric.value}"
+                    )
+                else:
+                    lines.extend(self._render_histogram(name, metric))
+        for name, (help_text, gauges) in self._gauges.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, read in gauges.values():
+                lines.append(f"{name}{_format_labels(labels)} {read()}")
+        for name, (help_text, read, keys, label) in self._gauge_groups.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            snapshot = read()
+            for key in keys:
+                labels = _format_labels({label: key})
+                lines.append(f"{name}{labels} {snapshot[key]}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histogram(name: str, hist: Histogram) -> list[str]:
+        # resolusi penuh dipakai internal; export cukup satu bucket per oktaf
+        # agar jumlah seri tetap kecil dan stabil antar scrape
+        lines = []
+        cumulative = 0
+        for index, (bound, count) in enumerate(
+            zip(hist.bounds, hist.counts, strict=False)
+        ):
+            cumulative += count
+            if index % SUB_BUCKETS == 0:
+                le = f'le="{bound / 1e9:.9g}"'
+                lines.append(
+                    f"{name}_bucket{_format_labels(hist.labels, le)} {cumulative}"
+                )
+        inf = 'le="+Inf"'
+        lines.append(f"{name}_bucket{_format_labels(hist.labels, inf)} {hist.count}")
+        lines.append(f"{name}_sum{_format_labels(hist.labels)} {hist.sum_ns / 1e9}")
+        lines.append(f"{name}_count{_format_labels(hist.labels)} {hist.count}")
+        return lines
+
+
+metrics = MetricsRegistry()
+"""Registry default aplikasi."""
@@ -1,3 +1,4 @@
+from src.core.middlewares.rate_limit import RateLimitMiddleware
 from src.core.middlewares.request_context import RequestContextMiddleware
 
-__all__ = ["RequestContextMiddleware"]
+__all__ = ["RateLimitMiddleware", "RequestContextMiddleware"]
@@ -0,0 +1,83 @@
+"""Agregasi access log per route di dalam proses.
+
+`RouteStats` menghitung jumlah request, total/maks durasi, dan histogram
+durasi per (method, path, status). Hasilnya di-flush sebagai satu baris
+summary setiap `interval` detik, sehingga observability tetap ada walaupun
+access log per request di-sampling.
+
+Path yang tidak cocok dengan route mana pun (404 scanner, typo) dicatat
+sebagai `UNMATCHED_PATH` agar jumlah key tetap terbatas.
+"""
+
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+
+# batas atas bucket histogram durasi (ms), bucket terakhir = +Inf
+DURATION_BUCKETS_MS: tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# key path untuk request yang tidak cocok dengan route aplikasi
+UNMATCHED_PATH = "<unmatched>"
+
+
+class _RouteEntry:
+    __slots__ = ("buckets", "count", "max_ms", "total_ms")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(DURATION_BUCKETS_MS) + 1)
+
+
+class RouteStats:
+    """Counter dan histogram durasi per (method, path, status).
+
+    Args:
+        interval: detik antar flush summary.
+        clock: sumber waktu monotonic, dapat diganti untuk test.
+    """
+
+    def __init__(
+        self, interval: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.interval = interval
+        self.clock = clock
+        self._entries: dict[tuple[str, str, int], _RouteEntry] = {}
+        self._last_flush = clock()
+
+    def record(self, method: str, path: str, status: int, duration_ms: float) -> None:
+        """Catat satu request."""
+        key = (method, path, status)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _RouteEntry()
+        entry.count += 1
+        entry.total_ms += duration_ms
+        if duration_ms > entry.max_ms:
+            entry.max_ms = duration_ms
+        entry.buckets[bisect_left(DURATION_BUCKETS_MS, duration_ms)] += 1
+
+    def due(self) -> bool:
+        """True jika sudah waktunya flush summary."""
+        return self.clock() - self._last_flush >= self.interval
+
+    def next_flush_in(self) -> float:
+        """Detik sampai flush berikutnya jatuh tempo (0 jika sudah due)."""
+        return max(0.0, self.interval - (self.clock() - self._last_flush))
+
+    def flush(self) -> str | None:
+        """Render summary lalu reset counter; None jika tidak ada request."""
+        self._last_flush = self.clock()
+        if not self._entries:
+            return None
+        entries, self._entries = self._entries, {}
+        parts = []
+        for (method, path, status), entry in sorted(entries.items()):
+            histogram = ",".join(str(n) for n in entry.buckets)
+            parts.append(
+                f"{method} {path} {status} n={entry.count} "
+                f"avg={entry.total_ms / entry.count:.2f}ms "
+                f"max={entry.max_ms:.2f}ms hist=[{histogram}]"
+            )
+        return " ; ".join(parts)
@@ -0,0 +1,214 @@
+"""Rate limiter token bucket untuk endpoint transaksi.
+
+Middleware ini berjalan sebelum routing FastAPI: memberid diambil langsung
+dari `scope["query_string"]` dan IP client dari header/scope, sehingga
+request yang melebihi batas ditolak dengan 429 sebelum validasi pydantic
+maupun hashing signature.
+
+State bucket O(1) per key di dalam `OrderedDict` yang diurutkan berdasarkan
+akses terakhir; bucket yang idle lebih lama dari `idle_ttl` (atau melebihi
+`max_keys`) dibuang dari depan, sehingga memori tetap terbatas walaupun IP
+terus berganti.
+
+Di mode server multi-worker (`src.server`) bucket diambil dari
+`src.core.shared_state` sehingga limit berlaku untuk semua worker sekaligus.
+
+Endpoint yang membawa banyak transaksi dalam satu request (`/trx/batch`,
+`/trx/stream`) hanya dikenai satu token IP di middleware; handler-nya
+mengambil token IP dan member per item lewat `item_admission`.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.config.settings import RateLimitSettings, get_rate_limit_settings
+from src.core.exceptions.handlers import app_exception_handler
+from src.core.middlewares.request_context import RequestContextMiddleware
+from src.core.query import parse_query
+from src.core.shared_state import get_shared_state
+from src.services.errors import RateLimitError
+from starlette.requests import Request
+
+
+class TokenBucketLimiter:
+    """Kumpulan token bucket per key dengan eviction berdasarkan idle time.
+
+    Args:
+        burst: kapasitas bucket (token maksimum).
+        refill_rate: token yang ditambahkan per detik.
+        idle_ttl: detik tanpa akses sebelum bucket dibuang.
+        max_keys: jumlah bucket maksimum.
+        clock: sumber waktu monotonic, dapat diganti untuk test.
+    """
+
+    def __init__(
+        self,
+        burst: float,
+        refill_rate: float,
+        idle_ttl: float = 300.0,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.burst = burst
+        self.refill_rate = refill_rate
+        self.idle_ttl = idle_ttl
+        self.max_keys = max_keys
+        self.clock = clock
+        self.rejected = 0
+        # key -> [tokens, last_seen]
+        self._buckets: OrderedDict[Any, list[float]] = OrderedDict()
+
+    def acquire(self, key: Any) -> float:
+        """Ambil satu token untuk `key`.
+
+        Returns:
+            0.0 jika diizinkan, atau detik sampai token berikutnya tersedia.
+        """
+        now = self.clock()
+        buckets = self._buckets
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = [self.burst, now]
+            self._evict(now)
+        else:
+            buckets.move_to_end(key)
+            tokens = bucket[0] + (now - bucket[1]) * self.refill_rate
+            bucket[0] = tokens if tokens < self.burst else self.burst
+            bucket[1] = now
+
+        if bucket[0] >= 1.0:
+            bucket[0] -= 1.0
+            return 0.0
+        self.rejected += 1
+        return (1.0 - bucket[0]) / self.refill_rate
+
+    def refund(self, key: Any) -> None:
+        """Kembalikan satu token yang sudah diambil `acquire` untuk `key`."""
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket[0] = min(bucket[0] + 1.0, self.burst)
+
+    def _evict(self, now: float) -> None:
+        buckets = self._buckets
+        while buckets:
+            oldest = next(iter(buckets.values()))
+            if len(buckets) <= self.max_keys and now - oldest[1] < self.idle_ttl:
+                break
+            buckets.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+def _memberid_from_query(query_string: bytes) -> str | None:
+    """Ambil memberid dari query string mentah.
+
+    Memakai aturan decode yang sama dengan `/trx` (`parse_query`): key ikut
+    di-unquote dan nilai terakhir yang menang, sehingga member yang dikenai
+    limit selalu member yang benar-benar diproses endpoint.
+    """
+    if b"memberid" not in query_string and b"%" not in query_string:
+        return None
+    value = parse_query(query_string).get("memberid", "")
+    return value.strip().upper() or None
+
+
+def item_admission(request: Request) -> Callable[[str], float] | None:
+    """Pengambil token per transaksi untuk endpoint batch/stream.
+
+    Returns:
+        fungsi `admit(memberid)` yang mengembalikan 0.0 jika item diizinkan
+        atau detik sampai token tersedia, atau None jika limiter tidak aktif
+        untuk request ini.
+    """
+    limiter = request.scope.get("state", {}).get("rate_limiter")
+    if limiter is None:
+        return None
+    client_ip = request.scope["state"]["client_ip"]
+    return lambda memberid: limiter.charge(client_ip, memberid)
+
+
+class RateLimitMiddleware:
+    """ASGI middleware: tolak dengan 429 saat bucket member atau IP habis."""
+
+    def __init__(
+        self,
+        app: Callable[[dict[str, Any], Callable, Callable], Awaitable[None]],
+        settings: RateLimitSettings | None = None,
+    ):
+        """Initialize the middleware with the ASGI app.
+
+        Args:
+            app: The ASGI application to wrap.
+            settings: Limiter options; read from `RATE_LIMIT_*` when omitted.
+        """
+        self.app = app
+        settings = settings or get_rate_limit_settings()
+        self.enabled = settings.enabled
+        self.paths = tuple(settings.paths)
+        shared = get_shared_state()
+        if shared is not None:
+            self.member_limiter = shared.member_limiter
+            self.ip_limiter = shared.ip_limiter
+            return
+        self.member_limiter = TokenBucketLimiter(
+            settings.member_burst,
+            settings.member_refill,
+            settings.idle_ttl,
+            settings.max_keys,
+        )
+        self.ip_limiter = TokenBucketLimiter(
+            settings.ip_burst, settings.ip_refill, settings.idle_ttl, settings.max_keys
+        )
+
+    def charge(self, client_ip: str, memberid: str | None) -> float:
+        """Ambil satu token IP lalu satu token member.
+
+        Token IP dikembalikan jika bucket member yang menolak, sehingga
+        penolakan per member tidak ikut menghabiskan kuota IP.
+
+        Returns:
+            0.0 jika diizinkan, atau detik sampai token berikutnya tersedia.
+        """
+        retry_after = self.ip_limiter.acquire(client_ip)
+        if retry_after or memberid is None:
+            return retry_after
+        retry_after = self.member_limiter.acquire(memberid.upper())
+        if retry_after:
+            self.ip_limiter.refund(client_ip)
+        return retry_after
+
+    async def __call__(
+        self,
+        scope: dict[str, Any],
+        receive: Callable[[], Awaitable[dict[str, Any]]],
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        """Check the buckets before handing the request to the app."""
+        if (
+            not self.enabled
+            or scope["type"] != "http"
+            or not scope["path"].startswith(self.paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+        client_ip = state.get("client_ip")
+        if client_ip is None:
+            client_ip = state["client_ip"] = RequestContextMiddleware._get_client_ip(
+                scope
+            )
+        memberid = _memberid_from_query(scope.get("query_string", b""))
+        retry_after = self.charge(client_ip, memberid)
+        if retry_after:
+            # middleware berjalan di luar ExceptionMiddleware: render lewat
+            # handler yang sama dengan exception aplikasi lain
+            request = Request(scope, receive)
+            response = await app_exception_handler(request, RateLimitError(retry_after))
+            await response(scope, receive, send)
+            return
+        state["rate_limiter"] = self
+        await self.app(scope, receive, send)
@@ -25,10 +25,12 @@ Example:
 
 
     async def homepage(request):
-        return JSONResponse({
-            "hello": "world",
-            "trace_id": request.state.trace_id,
-        })
+        return JSONResponse(
+            {
+                "hello": "world",
+                "trace_id": request.state.trace_id,
+            }
+        )
 
 
     app = Starlette(routes=[Route("/", homepage)])
@@ -39,27 +41,209 @@ Note:
     This middleware is designed to be used with ASGI frameworks like Starlette or FastAPI.
 """
 
+import asyncio
+import itertools
+import os
+import secrets
 import time
 import uuid
 from collections.abc import Awaitable, Callable
 from typing import Any
 
 from loguru import logger
-from starlette.requests import Request
+from src.config.settings import (
+    AccessLogSettings,
+    get_access_log_settings,
+    get_proxy_settings,
+)
+from src.core.middlewares.access_stats import (
+    DURATION_BUCKETS_MS,
+    UNMATCHED_PATH,
+    RouteStats,
+)
+from src.domain.member.allowlist import IpAllowlist, split_entries
+
+_TRACE_HEADER = b"x-trace-id"
+_FORWARDED_HEADER = b"x-forwarded-for"
+_REAL_IP_HEADER = b"x-real-ip"
+_USER_AGENT_HEADER = b"user-agent"
+_WANTED_HEADERS = frozenset(
+    {
+        _TRACE_HEADER,
+        _FORWARDED_HEADER,
+        _REAL_IP_HEADER,
+        _USER_AGENT_HEADER,
+    }
+)
+
+_trace_prefix = secrets.token_hex(6)
+_trace_counter = itertools.count(1)
+
+
+def _reseed_trace_ids() -> None:
+    """Give forked workers their own trace id prefix."""
+    global _trace_prefix, _trace_counter
+    _trace_prefix = secrets.token_hex(6)
+    _trace_counter = itertools.count(1)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_trace_ids)
+
+
+def fast_trace_id() -> str:
+    """Generate a 24-char hex trace id from a random process prefix and a counter.
+
+    Unique per process without calling the OS random source on every request.
+    """
+    return f"{_trace_prefix}{next(_trace_counter):012x}"
+
+
+def uuid_trace_id() -> str:
+    """Generate a random UUID4 trace id (previous default)."""
+    return str(uuid.uuid4())
+
+
+def _scan_headers(raw_headers: list[tuple[bytes, bytes]]) -> dict[bytes, bytes]:
+    """Pick the headers the middleware needs in a single pass over the scope.
+
+    The first occurrence wins, like `Headers.get`.
+    """
+    found: dict[bytes, bytes] = {}
+    for name, value in raw_headers:
+        if name in _WANTED_HEADERS and name not in found:
+            found[name] = value
+    return found
+
+
+def compile_trusted_proxies(raw: str) -> IpAllowlist:
+    """Compile daftar proxy tepercaya (IP/CIDR dipisah koma)."""
+    return IpAllowlist.compile(split_entries(raw))
+
+
+_default_trusted: IpAllowlist | None = None
+
+
+def _trusted_from_settings() -> IpAllowlist:
+    global _default_trusted
+    if _default_trusted is None:
+        _default_trusted = compile_trusted_proxies(get_proxy_settings().trusted)
+    return _default_trusted
 
 
 class RequestContextMiddleware:
-    """Pure ASGI middleware for request context handling, streaming-safe."""
+    """Pure ASGI middleware for request context handling, streaming-safe.
+
+    Headers are read straight from `scope["headers"]` without building a
+    Starlette `Request`, and trace/debug log lines are only formatted when
+    their level is active.
+
+    Access lines are sampled: errors and slow requests are always logged,
+    successes only 1-in-`sample_rate`. Every request is still counted in
+    per-route stats that are logged as one summary line per interval. The
+    summary is flushed by an event-loop timer started on lifespan startup
+    (so idle periods are reported too) and once more on lifespan shutdown.
+    """
 
     def __init__(
-        self, app: Callable[[dict[str, Any], Callable, Callable], Awaitable[None]]
+        self,
+        app: Callable[[dict[str, Any], Callable, Callable], Awaitable[None]],
+        trace_id_factory: Callable[[], str] = fast_trace_id,
+        access_log: AccessLogSettings | None = None,
+        trusted_proxies: str | None = None,
     ):
         """Initialize the middleware with the ASGI app.
 
         Args:
             app: The ASGI application to wrap.
+            trace_id_factory: Callable producing new trace ids. Use
+                `uuid_trace_id` for UUID4 ids.
+            access_log: Sampling and summary options; read from the
+                `ACCESS_LOG_*` environment when omitted.
+            trusted_proxies: Comma-separated proxy IPs/CIDRs whose forwarding
+                headers are honoured; read from `PROXY_TRUSTED` when omitted.
         """
         self.app = app
+        self.trusted_proxies = (
+            compile_trusted_proxies(trusted_proxies)
+            if trusted_proxies is not None
+            else _trusted_from_settings()
+        )
+        self.trace_id_factory = trace_id_factory
+        options = access_log or get_access_log_settings()
+        self.sample_rate = options.sample_rate
+        self.slow_ms = options.slow_ms
+        self.error_status = options.error_status
+        self.route_stats = (
+            RouteStats(options.summary_interval)
+            if options.summary_interval > 0
+            else None
+        )
+        self._success_count = 0
+        self._flush_timer: asyncio.TimerHandle | None = None
+
+    def _should_log(self, status: int, duration_ms: float) -> bool:
+        """Decide whether a finished request gets its own access line."""
+        if status >= self.error_status or duration_ms >= self.slow_ms:
+            return True
+        self._success_count += 1
+        return self._success_count % self.sample_rate == 0
+
+    def _record_stats(
+        self, scope: dict[str, Any], method: str, status: int, duration_ms: float
+    ) -> None:
+        """Count the request per route and emit the summary line when due."""
+        stats = self.route_stats
+        if stats is None:
+            return
+        # route template keeps cardinality bounded for parameterized paths;
+        # unmatched paths (404 probes) share a single key
+        path = getattr(scope.get("route"), "path", None) or UNMATCHED_PATH
+        stats.record(method, path, status, duration_ms)
+        if stats.due():
+            self._emit_summary()
+
+    def _emit_summary(self) -> None:
+        """Log the per-route summary line and reset the counters."""
+        summary = self.route_stats.flush()
+        if summary:
+            logger.bind(access_summary=True, buckets_ms=DURATION_BUCKETS_MS).info(
+                "access summary | {}", summary
+            )
+
+    def _schedule_flush(self) -> None:
+        """Arm the loop timer for the next due summary."""
+        delay = self.route_stats.next_flush_in() or self.route_stats.interval
+        self._flush_timer = asyncio.get_running_loop().call_later(
+            delay, self._on_flush_timer
+        )
+
+    def _on_flush_timer(self) -> None:
+        if self.route_stats.due():
+            self._emit_summary()
+        self._schedule_flush()
+
+    async def _lifespan(
+        self,
+        scope: dict[str, Any],
+        receive: Callable[[], Awaitable[dict[str, Any]]],
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        """Pass lifespan through, running the summary timer while the app is up."""
+
+        async def receive_wrapper() -> dict[str, Any]:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self._schedule_flush()
+            elif message["type"] == "lifespan.shutdown":
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                # before the app's own shutdown tears logging down
+                self._emit_summary()
+            return message
+
+        await self.app(scope, receive_wrapper, send)
 
     def _is_valid_trace_id(self, tid: str) -> bool:
         """Validate the trace ID.
@@ -72,7 +256,7 @@ class RequestContextMiddleware:
         """
         is_valid = tid.isalnum() and 8 <= len(tid) <= 64
         if not is_valid:
-            logger.trace(f"Invalid trace_id rejected: {tid}")
+            logger.trace("Invalid trace_id rejected: {}", tid)
         return is_valid
 
     async def __call__(
@@ -90,102 +274,138 @@ class RequestContextMiddleware:
         """
         logger.trace("RequestContextMiddleware invoked")
         if scope["type"] != "http":
-            await self.app(scope, receive, send)
+            if scope["type"] == "lifespan" and self.route_stats is not None:
+                await self._lifespan(scope, receive, send)
+            else:
+                await self.app(scope, receive, send)
             return
 
-        # Build request object
-        request = Request(scope, receive=receive)
+        headers = _scan_headers(scope.get("headers") or [])
+        state = scope.setdefault("state", {})
 
         # 1) Propagate incoming trace id if provided, else generate a new one
-        incoming_trace = request.headers.get("x-trace-id")
+        incoming_trace = headers.get(_TRACE_HEADER)
 
         if incoming_trace:
-            candidate = incoming_trace.strip()
+            candidate = incoming_trace.decode("latin-1").strip()
             trace_id = (
-                candidate if self._is_valid_trace_id(candidate) else str(uuid.uuid4())
+                candidate
+                if self._is_valid_trace_id(candidate)
+                else self.trace_id_factory()
             )
         else:
-            trace_id = str(uuid.uuid4())
-        request.state.trace_id = trace_id
+            trace_id = self.trace_id_factory()
+        state["trace_id"] = trace_id
 
-        logger.trace(f"Trace ID set to: {trace_id}")
+        logger.trace("Trace ID set to: {}", trace_id)
 
         # 2) Capture client info early
-        client_ip = self._get_client_ip(request)
-        user_agent = request.headers.get("user-agent", "unknown")
-        request.state.client_ip = client_ip
-        request.state.user_agent = user_agent
+        client_ip = self._get_client_ip(scope, headers, self.trusted_proxies)
+        user_agent_raw = headers.get(_USER_AGENT_HEADER)
+        user_agent = user_agent_raw.decode("latin-1") if user_agent_raw else "unknown"
+        state["client_ip"] = client_ip
+        state["user_agent"] = user_agent
 
-        logger.trace(f"Client IP: {client_ip}, User Agent: {user_agent}")
+        logger.trace("Client IP: {}, User Agent: {}", client_ip, user_agent)
 
         # 3) Measure processing time
         start_time = time.perf_counter()
         response_status = 500
-        response_headers = []
         duration_ms = None
+        trace_header = (_TRACE_HEADER, trace_id.encode())
 
         async def send_wrapper(message: dict[str, Any]) -> None:
-            nonlocal response_status, response_headers, duration_ms
+            nonlocal response_status
             if message["type"] == "http.response.start":
                 response_status = message["status"]
-                # Add trace headers safely without overwriting duplicates
-                headers = list(message.get("headers", []))
-                headers.append((b"x-trace-id", trace_id.encode()))
-                headers.append((
-                    b"x-process-time",
-                    f"{(time.perf_counter() - start_time) * 1000.0:.2f}ms".encode(),
-                ))
-                message["headers"] = headers
-                response_headers = message["headers"]
+                # Build a new list in one allocation: the original may be the
+                # response object's own raw_headers and must not be mutated.
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    trace_header,
+                    (
+                        b"x-process-time",
+                        b"%.2fms" % ((time.perf_counter() - start_time) * 1000.0),
+                    ),
+                ]
             await send(message)
 
+        method = scope.get("method", "unknown")
+        path = scope.get("path", "unknown")
         try:
             await self.app(scope, receive, send_wrapper)
         except Exception:
             duration_ms = (time.perf_counter() - start_time) * 1000.0
+            self._record_stats(scope, method, 500, duration_ms)
             logger.bind(
                 trace_id=trace_id,
                 client_ip=client_ip,
                 user_agent=user_agent,
                 status_code=500,
                 duration_ms=duration_ms,
-                method=scope.get("method", "unknown"),
-                path=scope.get("path", "unknown"),
+                method=method,
+                path=path,
             ).exception("Request failed")
             raise
         else:
             duration_ms = (time.perf_counter() - start_time) * 1000.0
+            self._record_stats(scope, method, response_status, duration_ms)
+            if not self._should_log(response_status, duration_ms):
+                return
             logger.bind(
                 trace_id=trace_id,
                 client_ip=client_ip,
                 user_agent=user_agent,
                 status_code=response_status,
                 duration_ms=duration_ms,
-                method=scope.get("method", "unknown"),
-                path=scope.get("path", "unknown"),
+                method=method,
+                path=path,
             ).info(
-                f"\u2190 {scope.get('method', 'unknown')} {scope.get('path', 'unknown')} | "
-                f"status={response_status} | {duration_ms:.2f}ms"
+                "\u2190 {} {} | status={} | {:.2f}ms",
+                method,
+                path,
+                response_status,
+                duration_ms,
             )
 
     @staticmethod
-    def _get_client_ip(request: Request) -> str:
-        """Extract real client IP, accounting for proxies.
+    def _get_client_ip(
+        scope: dict[str, Any],
+        headers: dict[bytes, bytes] | None = None,
+        trusted: IpAllowlist | None = None,
+    ) -> str:
+        """Extract real client IP, accounting for trusted proxies.
 
-        Chooses the left-most x-forwarded-for when present.
+        Forwarding headers are only honoured when the direct peer is a trusted
+        proxy. The client is then the right-most `x-forwarded-for` hop that
+        is not itself a trusted proxy: hops to the left of it were written by
+        the client and can be spoofed freely.
 
         Args:
-            request: The Starlette request object.
+            scope: The ASGI scope dictionary.
+            headers: Pre-scanned headers from `_scan_headers`; scanned from
+                the scope when omitted.
+            trusted: Trusted proxy allowlist; `PROXY_TRUSTED` when omitted.
 
         Returns:
             The client IP address as a string.
         """
-        forwarded = request.headers.get("x-forwarded-for")
+        client = scope.get("client")
+        peer = client[0] if client else "unknown"
+        if trusted is None:
+            trusted = _trusted_from_settings()
+        if peer not in trusted:
+            return peer
+        if headers is None:
+            headers = _scan_headers(scope.get("headers") or [])
+        forwarded = headers.get(_FORWARDED_HEADER)
         if forwarded:
-            return forwarded.split(",")[0].strip()
-        real_ip = request.headers.get("x-real-ip")
+            hops = [hop.strip() for hop in forwarded.decode("latin-1").split(",")]
+            for hop in reversed(hops):
+                if hop and hop not in trusted:
+                    return hop
+            return hops[0] or peer
+        real_ip = headers.get(_REAL_IP_HEADER)
         if real_ip:
-            return real_ip
-        if request.client:
-            return request.client.host
-        return "unknown"
+            return real_ip.decode("latin-1").strip()
+        return peer
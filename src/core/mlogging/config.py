@@ -8,6 +8,12 @@ Usage:
     from core.mlogging.config import setup_logging
     setup_logging()
 
+When `LOG_QUEUE_ENABLED=true`, the mlog.yaml handlers are routed through
+non-blocking queues too: file and stream sinks are wrapped in a `QueueSink`,
+other sinks (callables, files with rotation) get Loguru's `enqueue=True`. An
+extra `QueueSink` file sink is installed on top; call shutdown_logging() on
+exit to flush them all and restore the synchronous handlers.
+
 Constants:
     LOGCONFIGPATH (Path): Path to mlog.yaml used to configure Loguru.
 """
@@ -15,9 +21,11 @@ Constants:
 import inspect
 import logging
 from pathlib import Path
+from typing import Any, TextIO
 
 from loguru import logger
-from loguru_config import LoguruConfig
+from src.config.settings import LogSettings, get_log_settings
+from src.core.mlogging.queue_sink import QueueSink
 
 LOGCONFIGPATH = Path(__file__).parent.parent.parent.parent / "mlog.yaml"
 
@@ -51,7 +59,95 @@ class InterceptHandler(logging.Handler):
         )
 
 
+_queue_sinks: list[QueueSink] = []
+_queue_sink_id: int | None = None
+# handler mlog.yaml asli, dipasang kembali oleh shutdown_logging()
+_sync_handlers: list[dict[str, Any]] | None = None
+
+# opsi logger.add yang hanya berlaku jika Loguru sendiri membuka file sink
+_FILE_OPTIONS = frozenset(
+    {"rotation", "retention", "compression", "delay", "watch", "mode", "buffering"}
+)
+
+
+def _new_queue_sink(target: str | Path | TextIO, settings: LogSettings) -> QueueSink:
+    sink = QueueSink(
+        target,
+        maxsize=settings.queue_maxsize,
+        overflow=settings.queue_overflow,
+        batch_size=settings.queue_batch_size,
+        block_timeout=settings.queue_block_timeout,
+    )
+    sink.start()
+    _queue_sinks.append(sink)
+    return sink
+
+
+def queue_handlers(
+    handlers: list[dict[str, Any]], settings: LogSettings
+) -> list[dict[str, Any]]:
+    """Route configured Loguru handlers through non-blocking queues."""
+    queued = []
+    for handler in handlers:
+        handler = dict(handler)
+        sink = handler["sink"]
+        if hasattr(sink, "write") or (
+            isinstance(sink, str | Path) and not _FILE_OPTIONS & handler.keys()
+        ):
+            handler["sink"] = _new_queue_sink(sink, settings)
+            handler.pop("encoding", None)
+        else:
+            handler["enqueue"] = True
+        queued.append(handler)
+    return queued
+
+
+def install_queue_sink(settings: LogSettings) -> QueueSink:
+    """Install a non-blocking queue-backed file sink on Loguru."""
+    global _queue_sink_id
+    sink = _new_queue_sink(settings.queue_path, settings)
+    _queue_sink_id = logger.add(sink, level=settings.queue_level, catch=True)
+    return sink
+
+
 def setup_logging() -> None:
-    """Setup logging configuration."""
+    """Setup logging configuration.
+
+    Aman dipanggil ulang (mis. setiap startup lifespan): queue sink lama
+    dihentikan dulu sebelum konfigurasi dimuat ulang.
+    """
+    # parser YAML dimuat lazy agar tidak menambah waktu import aplikasi
+    from loguru_config import LoguruConfig  # noqa: PLC0415
+
+    global _sync_handlers
+    shutdown_logging()
     logging.basicConfig(handlers=[InterceptHandler()], level=0)
-    LoguruConfig().load(config_or_file=LOGCONFIGPATH, inplace=True, configure=True)
+    config = (
+        LoguruConfig()
+        .load(config_or_file=LOGCONFIGPATH, inplace=True, configure=False)
+        .parse()
+    )
+    settings = get_log_settings()
+    if settings.queue_enabled and config.handlers:
+        _sync_handlers = config.handlers
+        config.handlers = queue_handlers(config.handlers, settings)
+    config.configure()
+    if settings.queue_enabled:
+        install_queue_sink(settings)
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the queue sinks, restoring the synchronous handlers."""
+    global _queue_sink_id, _sync_handlers
+    if _queue_sink_id is not None:
+        logger.remove(_queue_sink_id)
+        _queue_sink_id = None
+    if _sync_handlers is not None:
+        logger.configure(handlers=_sync_handlers)
+        _sync_handlers = None
+    sinks = list(_queue_sinks)
+    _queue_sinks.clear()
+    for sink in sinks:
+        sink.stop()
+        if sink.dropped:
+            logger.warning(f"Log queue dropped {sink.dropped} records")
@@ -0,0 +1,136 @@
+"""Sink Loguru non-blocking berbasis queue.
+
+Sink ini hanya memasukkan pesan yang sudah diformat ke queue bounded; sebuah
+writer thread di background mengosongkan queue dan menulis ke target (file
+atau stream seperti `sys.stderr`) secara batch. Thread event loop tidak pernah
+menunggu I/O.
+
+Overflow saat queue penuh:
+    - "drop": pesan dibuang dan dihitung di `dropped`
+    - "block": pemanggil menunggu ruang di queue paling lama `block_timeout`
+      detik, lalu pesan dibuang. Jika writer thread ternyata sudah mati, sink
+      pindah permanen ke mode "drop" agar event loop tidak tertahan.
+
+Usage:
+    sink = QueueSink("logs/app.log", maxsize=10_000, overflow="drop")
+    sink.start()
+    logger.add(sink, level="INFO")
+    ...
+    sink.stop()
+"""
+
+import contextlib
+import queue
+import threading
+from pathlib import Path
+from typing import Literal, TextIO
+
+_STOP = object()
+
+
+class QueueSink:
+    """Callable sink untuk `logger.add` dengan writer thread di background.
+
+    Args:
+        target: file tujuan log, atau stream terbuka (mis. `sys.stderr`).
+        maxsize: kapasitas queue.
+        overflow: perilaku saat queue penuh, "drop" atau "block".
+        batch_size: jumlah record maksimum per write.
+        flush_interval: detik maksimum writer menunggu record berikutnya.
+        block_timeout: detik maksimum pemanggil menunggu di mode "block".
+    """
+
+    def __init__(
+        self,
+        target: str | Path | TextIO,
+        maxsize: int = 10_000,
+        overflow: Literal["drop", "block"] = "drop",
+        batch_size: int = 512,
+        flush_interval: float = 0.5,
+        block_timeout: float = 1.0,
+    ) -> None:
+        if overflow not in {"drop", "block"}:
+            raise ValueError(f"invalid overflow mode: {overflow!r}")
+        if hasattr(target, "write"):
+            self.path, self.stream = None, target
+        else:
+            self.path, self.stream = Path(target), None
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self.written = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread: threading.Thread | None = None
+
+    def __call__(self, message: str) -> None:
+        """Masukkan pesan ke queue tanpa menyentuh disk."""
+        if self.overflow == "block":
+            try:
+                self._queue.put(message, timeout=self.block_timeout)
+            except queue.Full:
+                self.dropped += 1
+                if self._thread is not None and not self._thread.is_alive():
+                    self.overflow = "drop"
+            return
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+
+    def start(self) -> None:
+        """Jalankan writer thread."""
+        if self._thread is not None:
+            return
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name="log-queue-writer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Flush sisa queue lalu hentikan writer thread."""
+        if self._thread is None:
+            return
+        if self._thread.is_alive():
+            with contextlib.suppress(queue.Full):
+                self._queue.put(_STOP, timeout=timeout)
+            self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        if self.stream is not None:
+            self._drain(self.stream)
+            return
+        with self.path.open("a", encoding="utf-8") as fh:
+            self._drain(fh)
+
+    def _drain(self, fh: TextIO) -> None:
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        running = True
+        while running:
+            try:
+                item = get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch: list[str] = []
+            while True:
+                if item is _STOP:
+                    running = False
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                fh.write("".join(batch))
+                fh.flush()
+                self.written += len(batch)
@@ -0,0 +1,33 @@
+"""Decoder query string mentah yang mengikuti aturan `QueryParams` Starlette.
+
+Dipakai oleh middleware (sebelum routing) dan oleh endpoint `/trx`, sehingga
+keduanya selalu sepakat nilai parameter mana yang dipakai: query string
+di-decode latin-1, dipisah `&`, segmen kosong dilewati, key dan nilai
+di-unquote (`+`/`%XX`, UTF-8) dan nilai terakhir untuk key yang sama yang
+menang. Nilai di-strip dengan himpunan whitespace pydantic-core.
+"""
+
+from urllib.parse import unquote_plus
+
+# whitespace yang di-strip pydantic-core (Unicode White_Space); berbeda dengan
+# `str.strip()` yang juga membuang \x1c-\x1f
+WHITESPACE = (
+    " \t\n\x0b\x0c\r\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005"
+    "\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+
+def parse_query(query_string: bytes) -> dict[str, str]:
+    """Parse `scope["query_string"]` menjadi dict (nilai terakhir menang)."""
+    text = query_string.decode("latin-1")
+    quoted = "%" in text or "+" in text
+    params: dict[str, str] = {}
+    for part in text.split("&"):
+        if not part:
+            continue
+        name, _, value = part.partition("=")
+        if quoted:
+            name = unquote_plus(name)
+            value = unquote_plus(value)
+        params[name] = value.strip(WHITESPACE)
+    return params
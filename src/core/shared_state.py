@@ -0,0 +1,353 @@
+"""State bersama antar worker proses untuk mode server pre-fork.
+
+Rate limiter dan cache idempotency biasanya hidup di memori satu proses.
+Dengan beberapa worker (lihat `src.server`), state tersebut harus sama di
+semua worker: resend trxid bisa mendarat di worker lain, dan limit per member
+tidak boleh dikalikan jumlah worker.
+
+Modul ini menyediakan tabel hash fixed-size di atas
+`multiprocessing.shared_memory.SharedMemory` yang dibuat oleh proses parent
+sebelum fork. Tabel dibagi menjadi bucket berisi `WAYS` slot; key hanya
+dicari di bucket-nya sendiri dan slot yang paling lama tidak dipakai
+di-evict saat bucket penuh, sehingga memori tetap terbatas. Setiap bucket
+dijaga oleh salah satu dari `stripes` lock antar-proses.
+
+Hash key memakai `hash()` bawaan: semua worker adalah hasil fork dari parent
+yang sama sehingga hash seed-nya identik.
+
+Counter hits/misses/rejected bersifat per worker; isi tabel dibagi bersama.
+
+Usage:
+    state = SharedState.create(get_rate_limit_settings(), get_idempotency_settings())
+    install_shared_state(state)   # sebelum fork
+    ...
+    state.close()                 # di parent saat shutdown
+"""
+
+import json
+import multiprocessing
+import struct
+import time
+from collections.abc import Callable, Hashable
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+from src.config.settings import IdempotencySettings, RateLimitSettings
+
+WAYS = 8
+_HASH_MASK = (1 << 64) - 1
+
+
+def _key_hash(key: Hashable) -> int:
+    # 0 dipakai sebagai penanda slot kosong
+    return (hash(key) & _HASH_MASK) or 1
+
+
+class SharedTable:
+    """Tabel slot fixed-size di shared memory dengan lock per stripe.
+
+    Args:
+        slots: jumlah slot minimum (dibulatkan ke kelipatan `WAYS`).
+        slot_size: ukuran satu slot dalam byte.
+        stripes: jumlah lock antar-proses.
+    """
+
+    def __init__(self, slots: int, slot_size: int, stripes: int = 64) -> None:
+        self.buckets = max(1, -(-slots // WAYS))
+        self.slot_size = slot_size
+        self.bucket_size = slot_size * WAYS
+        self.shm = SharedMemory(create=True, size=self.buckets * self.bucket_size)
+        self.buf = self.shm.buf
+        ctx = multiprocessing.get_context("fork")
+        self.locks = [ctx.Lock() for _ in range(stripes)]
+
+    def locate(self, key_hash: int) -> tuple[int, Any]:
+        """Offset bucket untuk hash dan lock yang menjaganya."""
+        bucket = key_hash % self.buckets
+        return bucket * self.bucket_size, self.locks[bucket % len(self.locks)]
+
+    def count(self) -> int:
+        """Jumlah slot terisi (scan kolom hash, dipakai untuk stats)."""
+        words = self.buf.cast("Q")
+        try:
+            return sum(1 for h in words[:: self.slot_size // 8] if h)
+        finally:
+            words.release()
+
+    def close(self, unlink: bool = False) -> None:
+        """Lepas mapping; `unlink` hanya dipanggil sekali oleh parent."""
+        self.buf.release()
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+_BUCKET = struct.Struct("<Qdd")  # key_hash, tokens, last_seen
+
+
+class SharedTokenBucketLimiter:
+    """Versi shared-memory dari `TokenBucketLimiter` dengan API yang sama.
+
+    Args:
+        table: tabel dengan `slot_size` >= 24 byte.
+        burst: kapasitas bucket (token maksimum).
+        refill_rate: token yang ditambahkan per detik.
+        idle_ttl: detik tanpa akses sebelum slot boleh dipakai key lain.
+        clock: sumber waktu monotonic (CLOCK_MONOTONIC sama di semua proses).
+    """
+
+    def __init__(
+        self,
+        table: SharedTable,
+        burst: float,
+        refill_rate: float,
+        idle_ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.table = table
+        self.burst = burst
+        self.refill_rate = refill_rate
+        self.idle_ttl = idle_ttl
+        self.clock = clock
+        self.rejected = 0
+
+    def acquire(self, key: Any) -> float:
+        """Ambil satu token untuk `key`.
+
+        Returns:
+            0.0 jika diizinkan, atau detik sampai token berikutnya tersedia.
+        """
+        key_hash = _key_hash(key)
+        base, lock = self.table.locate(key_hash)
+        buf, size = self.table.buf, self.table.slot_size
+        now = self.clock()
+        with lock:
+            target = -1
+            victim, victim_last = base, float("inf")
+            for offset in range(base, base + WAYS * size, size):
+                stored, tokens, last = _BUCKET.unpack_from(buf, offset)
+                if stored == key_hash:
+                    target = offset
+                    break
+                if stored == 0 or now - last >= self.idle_ttl:
+                    last = float("-inf")
+                if last < victim_last:
+                    victim, victim_last = offset, last
+
+            if target < 0:
+                target, tokens = victim, self.burst
+            else:
+                tokens = tokens + (now - last) * self.refill_rate
+                if tokens > self.burst:
+                    tokens = self.burst
+
+            allowed = tokens >= 1.0
+            if allowed:
+                tokens -= 1.0
+            _BUCKET.pack_into(buf, target, key_hash, tokens, now)
+
+        if allowed:
+            return 0.0
+        self.rejected += 1
+        return (1.0 - tokens) / self.refill_rate
+
+    def refund(self, key: Any) -> None:
+        """Kembalikan satu token yang sudah diambil `acquire` untuk `key`."""
+        key_hash = _key_hash(key)
+        base, lock = self.table.locate(key_hash)
+        buf, size = self.table.buf, self.table.slot_size
+        with lock:
+            for offset in range(base, base + WAYS * size, size):
+                stored, tokens, last = _BUCKET.unpack_from(buf, offset)
+                if stored == key_hash:
+                    tokens = min(tokens + 1.0, self.burst)
+                    _BUCKET.pack_into(buf, offset, key_hash, tokens, last)
+                    return
+
+
+_ENTRY = struct.Struct("<QQddH")  # key_hash, fingerprint_hash, expires_at, used, len
+IDEMPOTENCY_SLOT_SIZE = 256
+
+
+class SharedIdempotencyStore:
+    """Versi shared-memory dari `IdempotencyStore` dengan API yang sama.
+
+    Hasil disimpan sebagai JSON di slot fixed-size; hasil yang lebih besar
+    dari slot tidak di-cache. Tidak ada journal disk: state hidup selama
+    proses parent server hidup.
+
+    Args:
+        max_size: jumlah entry maksimum.
+        ttl: umur entry dalam detik.
+        stripes: jumlah lock antar-proses.
+        clock: sumber waktu (epoch detik).
+    """
+
+    def __init__(
+        self,
+        max_size: int = 100_000,
+        ttl: float = 600.0,
+        stripes: int = 64,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.table = SharedTable(max_size, IDEMPOTENCY_SLOT_SIZE, stripes)
+        self.max_size = self.table.buckets * WAYS
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._payload_size = IDEMPOTENCY_SLOT_SIZE - _ENTRY.size
+
+    def get(self, memberid: str, trxid: str, fingerprint: Hashable) -> dict | None:
+        """Kembalikan hasil semula untuk request identik, atau None."""
+        key_hash = _key_hash((memberid.upper(), trxid))
+        fingerprint_hash = _key_hash(fingerprint)
+        base, lock = self.table.locate(key_hash)
+        buf, size = self.table.buf, self.table.slot_size
+        now = self.clock()
+        payload = None
+        with lock:
+            for offset in range(base, base + WAYS * size, size):
+                stored, fp_hash, expires_at, _, length = _ENTRY.unpack_from(buf, offset)
+                if stored != key_hash:
+                    continue
+                if expires_at <= now:
+                    _ENTRY.pack_into(buf, offset, 0, 0, 0.0, 0.0, 0)
+                    self.expirations += 1
+                elif fp_hash == fingerprint_hash:
+                    _ENTRY.pack_into(
+                        buf, offset, stored, fp_hash, expires_at, now, length
+                    )
+                    start = offset + _ENTRY.size
+                    payload = bytes(buf[start : start + length])
+                break
+
+        if payload is None:
+            self.misses += 1
+            return None
+        result = json.loads(payload)
+        if result.get("trxid") != trxid:
+            # tabrakan hash 64-bit: perlakukan sebagai miss
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(
+        self, memberid: str, trxid: str, fingerprint: Hashable, result: dict
+    ) -> None:
+        """Simpan hasil transaksi yang berhasil."""
+        payload = json.dumps(result, separators=(",", ":")).encode()
+        if len(payload) > self._payload_size:
+            return
+        key_hash = _key_hash((memberid.upper(), trxid))
+        base, lock = self.table.locate(key_hash)
+        buf, size = self.table.buf, self.table.slot_size
+        now = self.clock()
+        with lock:
+            target = -1
+            victim, victim_used, victim_live = base, float("inf"), False
+            for offset in range(base, base + WAYS * size, size):
+                stored, _, expires_at, used, _ = _ENTRY.unpack_from(buf, offset)
+                if stored == key_hash:
+                    target = offset
+                    break
+                live = stored != 0 and expires_at > now
+                if not live:
+                    used = float("-inf")
+                if used < victim_used:
+                    victim, victim_used, victim_live = offset, used, live
+            if target < 0:
+                target = victim
+                if victim_live:
+                    self.evictions += 1
+            _ENTRY.pack_into(
+                buf,
+                target,
+                key_hash,
+                _key_hash(fingerprint),
+                now + self.ttl,
+                now,
+                len(payload),
+            )
+            start = target + _ENTRY.size
+            buf[start : start + len(payload)] = payload
+
+    def stats(self) -> dict[str, int]:
+        """Counter per worker; `size` dihitung dari tabel bersama."""
+        return {
+            "size": len(self),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def close(self) -> None:
+        """No-op di worker; tabel dilepas oleh `SharedState.close` di parent."""
+
+    def __len__(self) -> int:
+        return self.table.count()
+
+
+class SharedState:
+    """Pemilik semua tabel shared memory untuk satu server pre-fork."""
+
+    def __init__(
+        self,
+        member_limiter: SharedTokenBucketLimiter,
+        ip_limiter: SharedTokenBucketLimiter,
+        idempotency: SharedIdempotencyStore | None,
+    ) -> None:
+        self.member_limiter = member_limiter
+        self.ip_limiter = ip_limiter
+        self.idempotency = idempotency
+
+    @classmethod
+    def create(
+        cls, rate_limit: RateLimitSettings, idempotency: IdempotencySettings
+    ) -> "SharedState":
+        """Alokasikan tabel sesuai settings (panggil di parent sebelum fork)."""
+        return cls(
+            SharedTokenBucketLimiter(
+                SharedTable(rate_limit.max_keys, _BUCKET.size),
+                rate_limit.member_burst,
+                rate_limit.member_refill,
+                rate_limit.idle_ttl,
+            ),
+            SharedTokenBucketLimiter(
+                SharedTable(rate_limit.max_keys, _BUCKET.size),
+                rate_limit.ip_burst,
+                rate_limit.ip_refill,
+                rate_limit.idle_ttl,
+            ),
+            SharedIdempotencyStore(idempotency.max_size, idempotency.ttl)
+            if idempotency.enabled
+            else None,
+        )
+
+    def close(self, unlink: bool = True) -> None:
+        """Lepas semua tabel; parent memanggil dengan `unlink=True`."""
+        self.member_limiter.table.close(unlink)
+        self.ip_limiter.table.close(unlink)
+        if self.idempotency is not None:
+            self.idempotency.table.close(unlink)
+
+
+_shared_state: SharedState | None = None
+
+
+def install_shared_state(state: SharedState | None) -> None:
+    """Pasang state bersama; dipakai oleh builder komponen di setiap worker."""
+    global _shared_state
+    _shared_state = state
+
+
+def get_shared_state() -> SharedState | None:
+    """State bersama yang terpasang, None di mode single process."""
+    return _shared_state
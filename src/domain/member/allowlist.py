@@ -0,0 +1,186 @@
+"""Allowlist IP per member dengan dukungan IPv4/IPv6 CIDR.
+
+Entry allowlist di-compile sekali saat registry di-load:
+    - alamat tunggal (dan host non-IP seperti nama host) masuk ke frozenset
+      sehingga kasus umum cukup satu lookup hash tanpa parsing string
+    - CIDR / range di-merge menjadi interval integer terurut per versi IP,
+      dicari dengan `bisect`
+
+IP client yang tidak cocok secara exact di-parse lewat cache LRU bersama,
+jadi IP yang sama tidak pernah di-parse dua kali selama masih di cache.
+
+Untuk registry besar, `compact_allowlist` menyimpan allowlist berisi satu
+IPv4 / host sebagai string biasa (dicek dengan `==`) tanpa objek allowlist.
+
+Usage:
+    allowlist = IpAllowlist.compile(["10.0.0.0/24", "2001:db8::/32"])
+    "10.0.0.7" in allowlist  # True
+"""
+
+import socket
+from bisect import bisect_right
+from collections.abc import Iterable
+from functools import lru_cache
+
+_V4_BITS = 32
+_V6_BITS = 128
+
+
+def split_entries(raw: str) -> list[str]:
+    """Pecah string allowlist (dipisah koma/spasi) dan buang port.
+
+    Mendukung `host:port`, `[ipv6]:port`, IPv6 polos, dan CIDR.
+    """
+    entries = []
+    for item in raw.replace(",", " ").split():
+        if item.startswith("["):
+            item = item[1:].split("]", 1)[0]
+        elif item.count(":") == 1:
+            item = item.split(":", 1)[0]
+        if item:
+            entries.append(item)
+    return entries
+
+
+def _pack(value: str) -> tuple[int, bytes] | None:
+    """IP string -> (versi, bytes) via `inet_pton`, None jika bukan IP."""
+    family, version = (socket.AF_INET6, 6) if ":" in value else (socket.AF_INET, 4)
+    try:
+        return version, socket.inet_pton(family, value)
+    except (OSError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=65_536)
+def _parse_ip(value: str) -> tuple[int, int] | None:
+    """IP string -> (versi, integer), None jika bukan alamat IP."""
+    packed = _pack(value)
+    if packed is None:
+        return None
+    return packed[0], int.from_bytes(packed[1], "big")
+
+
+def _parse_network(entry: str) -> tuple[int, int, int, str | None] | None:
+    """CIDR/IP -> (versi, start, end, bentuk kanonik jika alamat tunggal)."""
+    address, _, prefix = entry.partition("/")
+    packed = _pack(address)
+    if packed is None:
+        return None
+    version, raw = packed
+    bits = _V4_BITS if version == 4 else _V6_BITS
+    if prefix:
+        if not prefix.isdigit() or int(prefix) > bits:
+            return None
+        length = int(prefix)
+    else:
+        length = bits
+    host_mask = (1 << (bits - length)) - 1
+    start = int.from_bytes(raw, "big") & ~host_mask
+    canonical = None
+    if length == bits:
+        family = socket.AF_INET if version == 4 else socket.AF_INET6
+        canonical = socket.inet_ntop(family, raw)
+    return version, start, start | host_mask, canonical
+
+
+def _merge(ranges: list[tuple[int, int]]) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    ranges.sort()
+    starts: list[int] = []
+    ends: list[int] = []
+    for start, end in ranges:
+        if ends and start <= ends[-1] + 1:
+            if end > ends[-1]:
+                ends[-1] = end
+        else:
+            starts.append(start)
+            ends.append(end)
+    return tuple(starts), tuple(ends)
+
+
+class IpAllowlist:
+    """Allowlist yang sudah di-compile; gunakan operator `in`."""
+
+    __slots__ = ("_exact", "_v4_ends", "_v4_starts", "_v6_ends", "_v6_starts")
+
+    def __init__(
+        self,
+        exact: frozenset[str],
+        v4: tuple[tuple[int, ...], tuple[int, ...]] = ((), ()),
+        v6: tuple[tuple[int, ...], tuple[int, ...]] = ((), ()),
+    ) -> None:
+        self._exact = exact
+        self._v4_starts, self._v4_ends = v4
+        self._v6_starts, self._v6_ends = v6
+
+    @classmethod
+    def compile(cls, entries: Iterable[str]) -> "IpAllowlist":
+        """Compile entry (IP, CIDR, atau host) menjadi allowlist."""
+        exact: set[str] = set()
+        v4: list[tuple[int, int]] = []
+        v6: list[tuple[int, int]] = []
+        for entry in entries:
+            entry = entry.strip()
+            if not entry:
+                continue
+            network = _parse_network(entry)
+            if network is None:
+                # bukan IP/CIDR (mis. nama host), hanya cocok secara exact
+                exact.add(entry)
+                continue
+            version, start, end, canonical = network
+            if canonical is not None:
+                exact.add(canonical)
+            (v4 if version == 4 else v6).append((start, end))
+        return cls(frozenset(exact), _merge(v4), _merge(v6))
+
+    def __contains__(self, ip: object) -> bool:
+        if ip in self._exact:
+            return True
+        if not self._v4_starts and not self._v6_starts:
+            return False
+        parsed = _parse_ip(str(ip))
+        if parsed is None:
+            return False
+        version, value = parsed
+        if version == 4:
+            starts, ends = self._v4_starts, self._v4_ends
+        else:
+            starts, ends = self._v6_starts, self._v6_ends
+        index = bisect_right(starts, value) - 1
+        return index >= 0 and value <= ends[index]
+
+    def single(self) -> str | None:
+        """Alamat tunggal jika allowlist setara dengan satu perbandingan string.
+
+        Berlaku untuk satu IPv4 (`inet_pton` hanya menerima bentuk kanonik)
+        atau satu host non-IP. IPv6 punya banyak penulisan, jadi tetap `None`.
+        """
+        if len(self._exact) != 1 or self._v6_starts:
+            return None
+        starts, ends = self._v4_starts, self._v4_ends
+        if starts and (len(starts) != 1 or starts[0] != ends[0]):
+            return None
+        return next(iter(self._exact))
+
+    def __bool__(self) -> bool:
+        return bool(self._exact or self._v4_starts or self._v6_starts)
+
+    def __repr__(self) -> str:
+        return (
+            f"IpAllowlist(exact={len(self._exact)}, "
+            f"v4_ranges={len(self._v4_starts)}, v6_ranges={len(self._v6_starts)})"
+        )
+
+
+def compact_allowlist(raw: str) -> "IpAllowlist | str":
+    """Compile string allowlist; alamat tunggal cukup disimpan sebagai string.
+
+    String yang dikembalikan dibandingkan dengan `==` (lihat
+    `IpAllowlist.single`), sehingga member dengan satu IP tidak perlu objek
+    allowlist sendiri.
+    """
+    allowlist = IpAllowlist.compile(split_entries(raw))
+    single = allowlist.single()
+    if single is None:
+        return allowlist
+    return raw if single == raw else single
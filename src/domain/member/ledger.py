@@ -0,0 +1,351 @@
+"""Ledger saldo (deposit) member in-process dengan write-ahead log.
+
+Saldo disimpan di `array('q')` yang diindeks slot member, bukan di objek per
+member. Transaksi memakai alur dua tahap:
+
+    reserve(memberid, trxid, amount)  -> saldo tersedia ditahan
+    commit(memberid, trxid)           -> saldo benar-benar dipotong
+    refund(memberid, trxid)           -> tahanan dilepas
+
+Reservation dikunci dengan (memberid, trxid) karena trxid hanya unik per
+member. Setiap mutasi dilindungi lock per stripe (slot % stripes) sehingga
+thread yang menyentuh member berbeda tidak saling menunggu; di dalam satu
+event loop operasi ini tidak pernah `await` sehingga ribuan task asyncio pada
+member yang sama tetap atomik.
+
+Semua mutasi ditulis ke WAL (teks, satu baris per operasi) dan di-replay saat
+start. Setiap mutasi baru kembali setelah barisnya di-`fsync`, memakai group
+commit: baris ditambahkan ke buffer di dalam lock stripe, lalu di luar lock
+pemanggil pertama yang mendapat `_flush_lock` menulis dan meng-`fsync` seluruh
+buffer, termasuk baris milik thread lain yang sedang menunggu. Lock stripe
+tidak pernah ditahan selama I/O.
+
+WAL dipadatkan (`compact`) saat dibuka dan setiap kali melewati
+`compact_bytes`: file diganti secara atomik dengan snapshot berisi satu baris
+OPEN per member (saldo buku) dan satu baris RESERVE per tahanan aktif.
+
+Usage:
+    ledger = BalanceLedger.from_registry(registry, wal_path="data/ledger.wal")
+    ledger.reserve("M1", "TRX1", 5_000)
+    ledger.commit("M1", "TRX1")
+"""
+
+import os
+import threading
+from array import array
+from collections.abc import Iterable
+from contextlib import ExitStack
+from pathlib import Path
+
+from loguru import logger
+from src.core.exceptions.errorcases import (
+    EntityNotFoundError,
+    InsufficientBalanceError,
+    ResourceConflictError,
+)
+from src.domain.member.registry import MemberRecord
+
+OPEN = "O"
+CREDIT = "C"
+RESERVE = "R"
+COMMIT = "K"
+REFUND = "F"
+
+
+class BalanceLedger:
+    """Ledger saldo member berbasis array dengan lock striping dan WAL.
+
+    Args:
+        wal_path: path file WAL; None berarti tanpa persistensi.
+        stripes: jumlah lock stripe.
+        compact_bytes: ukuran WAL yang memicu `compact`.
+    """
+
+    def __init__(
+        self,
+        wal_path: str | Path | None = None,
+        stripes: int = 64,
+        compact_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        self._slots: dict[str, int] = {}
+        self._balances = array("q")
+        self._held = array("q")
+        # (memberid, trxid) -> (slot, amount)
+        self._reservations: dict[tuple[str, str], tuple[int, int]] = {}
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._slot_lock = threading.Lock()
+        self._wal_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wal_buffer: list[str] = []
+        # nomor urut baris terakhir yang di-log / yang sudah di-fsync
+        self._logged = 0
+        self._durable = 0
+        self.compact_bytes = compact_bytes
+        self._path = None if wal_path is None else Path(wal_path)
+        self._wal = None
+        if self._path is not None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            if self._path.exists():
+                self._replay(self._path)
+            self._wal = self._path.open("a", encoding="utf-8")
+            self.compact()
+
+    @classmethod
+    def from_registry(
+        cls,
+        members: Iterable[MemberRecord],
+        wal_path: str | Path | None = None,
+        stripes: int = 64,
+        compact_bytes: int = 64 * 1024 * 1024,
+    ) -> "BalanceLedger":
+        """Bangun ledger; member yang belum ada di WAL dibuka dengan saldo registry."""
+        ledger = cls(wal_path, stripes, compact_bytes)
+        # satu fsync untuk semua baris OPEN, bukan satu per member
+        with ledger._slot_lock:
+            for member in members:
+                memberid = member.memberid.upper()
+                if memberid not in ledger._slots:
+                    ledger._log(OPEN, memberid, "", member.balance)
+                    ledger._new_slot(memberid, member.balance)
+        ledger.flush()
+        return ledger
+
+    def open_account(self, memberid: str, balance: int = 0) -> int:
+        """Daftarkan member dengan saldo awal, kembalikan slot-nya.
+
+        Raises:
+            ResourceConflictError: jika member sudah terdaftar.
+        """
+        memberid = memberid.upper()
+        with self._slot_lock:
+            if memberid in self._slots:
+                raise ResourceConflictError(f"member {memberid} sudah terdaftar")
+            # baris OPEN masuk WAL sebelum slot terlihat oleh thread lain
+            seq = self._log(OPEN, memberid, "", balance)
+            slot = self._new_slot(memberid, balance)
+        self._sync(seq)
+        return slot
+
+    def balance(self, memberid: str) -> int:
+        """Saldo buku (termasuk yang sedang ditahan)."""
+        return self._balances[self._slot(memberid)]
+
+    def available(self, memberid: str) -> int:
+        """Saldo yang bisa dipakai: saldo buku dikurangi tahanan."""
+        slot = self._slot(memberid)
+        return self._balances[slot] - self._held[slot]
+
+    def credit(self, memberid: str, amount: int) -> int:
+        """Tambah saldo (deposit), kembalikan saldo baru."""
+        self._check_amount(amount)
+        slot = self._slot(memberid)
+        with self._lock(slot):
+            self._balances[slot] += amount
+            seq = self._log(CREDIT, memberid.upper(), "", amount)
+            balance = self._balances[slot]
+        self._sync(seq)
+        return balance
+
+    def reserve(self, memberid: str, trxid: str, amount: int) -> None:
+        """Tahan saldo untuk transaksi.
+
+        Raises:
+            InsufficientBalanceError: jika saldo tersedia kurang dari `amount`.
+            ResourceConflictError: jika trxid sudah punya tahanan aktif.
+        """
+        self._check_amount(amount)
+        memberid = memberid.upper()
+        slot = self._slot(memberid)
+        key = (memberid, trxid)
+        with self._lock(slot):
+            if key in self._reservations:
+                raise ResourceConflictError(f"trxid {trxid} sudah di-reserve")
+            if self._balances[slot] - self._held[slot] < amount:
+                raise InsufficientBalanceError()
+            self._held[slot] += amount
+            self._reservations[key] = (slot, amount)
+            seq = self._log(RESERVE, memberid, trxid, amount)
+        self._sync(seq)
+
+    def commit(self, memberid: str, trxid: str) -> None:
+        """Potong saldo yang ditahan untuk trxid milik member."""
+        self._settle(memberid, trxid, COMMIT)
+
+    def refund(self, memberid: str, trxid: str) -> None:
+        """Lepas tahanan untuk trxid milik member tanpa memotong saldo."""
+        self._settle(memberid, trxid, REFUND)
+
+    def pending(self) -> int:
+        """Jumlah reservation yang belum di-commit/refund."""
+        return len(self._reservations)
+
+    def flush(self) -> None:
+        """Tulis dan `fsync` baris WAL yang masih di buffer."""
+        with self._flush_lock:
+            self._write_buffer()
+
+    def compact(self) -> None:
+        """Ganti WAL dengan snapshot state saat ini.
+
+        Semua lock diambil sehingga snapshot konsisten; file baru ditulis ke
+        `<wal>.tmp`, di-`fsync`, lalu menggantikan WAL lewat `os.replace`.
+        """
+        if self._wal is None:
+            return
+        with ExitStack() as stack:
+            stack.enter_context(self._slot_lock)
+            for lock in self._locks:
+                stack.enter_context(lock)
+            stack.enter_context(self._flush_lock)
+            self._write_buffer()
+            tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+            with tmp.open("w", encoding="utf-8") as fh:
+                for memberid, slot in self._slots.items():
+                    fh.write(f"{OPEN}\t{memberid}\t\t{self._balances[slot]}\n")
+                for (memberid, trxid), (_, amount) in self._reservations.items():
+                    fh.write(f"{RESERVE}\t{memberid}\t{trxid}\t{amount}\n")
+                fh.flush()
+                os.fsync(fh.fileno())
+            self._wal.close()
+            os.replace(tmp, self._path)
+            _fsync_dir(self._path.parent)
+            self._wal = self._path.open("a", encoding="utf-8")
+
+    def close(self) -> None:
+        """Tulis sisa buffer dan tutup WAL."""
+        with self._flush_lock:
+            if self._wal is not None:
+                self._write_buffer()
+                self._wal.close()
+                self._wal = None
+
+    def _settle(self, memberid: str, trxid: str, op: str) -> None:
+        memberid = memberid.upper()
+        key = (memberid, trxid)
+        reservation = self._reservations.get(key)
+        if reservation is None:
+            raise EntityNotFoundError(f"reservation {trxid} tidak ditemukan")
+        slot, amount = reservation
+        with self._lock(slot):
+            # cek ulang di dalam lock: settle paralel untuk trxid yang sama
+            if self._reservations.pop(key, None) is None:
+                raise EntityNotFoundError(f"reservation {trxid} tidak ditemukan")
+            self._held[slot] -= amount
+            if op == COMMIT:
+                self._balances[slot] -= amount
+            seq = self._log(op, memberid, trxid, amount)
+        self._sync(seq)
+
+    def _slot(self, memberid: str) -> int:
+        slot = self._slots.get(memberid.upper())
+        if slot is None:
+            raise EntityNotFoundError(f"member {memberid} tidak ada di ledger")
+        return slot
+
+    def _lock(self, slot: int) -> threading.Lock:
+        return self._locks[slot % len(self._locks)]
+
+    def _new_slot(self, memberid: str, balance: int) -> int:
+        slot = len(self._balances)
+        self._balances.append(balance)
+        self._held.append(0)
+        self._slots[memberid] = slot
+        return slot
+
+    @staticmethod
+    def _check_amount(amount: int) -> None:
+        if amount <= 0:
+            raise ValueError("amount must be positive")
+
+    def _log(self, op: str, memberid: str, trxid: str, amount: int) -> int:
+        """Tambah baris ke buffer WAL, kembalikan nomor urutnya (0 tanpa WAL)."""
+        if self._wal is None:
+            return 0
+        line = f"{op}\t{memberid}\t{trxid}\t{amount}\n"
+        with self._wal_lock:
+            self._wal_buffer.append(line)
+            self._logged += 1
+            return self._logged
+
+    def _sync(self, seq: int) -> None:
+        """Tunggu sampai baris `seq` durable; tulis sendiri jika belum ada yang menulis."""
+        if seq <= self._durable:
+            return
+        with self._flush_lock:
+            if seq <= self._durable:
+                # sudah ikut di-fsync oleh group commit thread lain
+                return
+            size = self._write_buffer()
+        if size >= self.compact_bytes:
+            self.compact()
+
+    def _write_buffer(self) -> int:
+        """Tulis + `fsync` buffer WAL; dipanggil dengan `_flush_lock` dipegang.
+
+        Returns:
+            ukuran file WAL setelah ditulis.
+        """
+        if self._wal is None:
+            return 0
+        with self._wal_lock:
+            lines, self._wal_buffer = self._wal_buffer, []
+            last = self._logged
+        if lines:
+            self._wal.write("".join(lines))
+            self._wal.flush()
+            os.fsync(self._wal.fileno())
+        self._durable = last
+        return self._wal.tell()
+
+    def _replay(self, path: Path) -> None:
+        """Bangun ulang state dari WAL tanpa menulis ulang."""
+        with path.open(encoding="utf-8") as fh:
+            for line in fh:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) != 4 or not parts[3].lstrip("-").isdigit():
+                    # baris terakhir bisa terpotong saat crash
+                    continue
+                op, memberid, trxid, raw_amount = parts
+                amount = int(raw_amount)
+                if op == OPEN:
+                    if memberid not in self._slots:
+                        self._new_slot(memberid, amount)
+                    continue
+                if op in (COMMIT, REFUND):
+                    self._replay_settle(op, memberid, trxid)
+                    continue
+                slot = self._slots.get(memberid)
+                if slot is None:
+                    logger.warning(
+                        "ledger WAL: {} untuk member {} tanpa OPEN, dilewati",
+                        op,
+                        memberid,
+                    )
+                elif op == CREDIT:
+                    self._balances[slot] += amount
+                elif op == RESERVE:
+                    self._held[slot] += amount
+                    self._reservations[memberid, trxid] = (slot, amount)
+
+    def _replay_settle(self, op: str, memberid: str, trxid: str) -> None:
+        reservation = self._reservations.pop((memberid, trxid), None)
+        if reservation is None:
+            logger.warning(
+                "ledger WAL: {} untuk reservation {} yang tidak ada, dilewati",
+                op,
+                trxid,
+            )
+            return
+        slot, amount = reservation
+        self._held[slot] -= amount
+        if op == COMMIT:
+            self._balances[slot] -= amount
+
+
+def _fsync_dir(path: Path) -> None:
+    """`fsync` direktori agar rename file di dalamnya ikut durable."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -18,6 +18,7 @@ class Member(BaseModel):
         pin (str): pin untuk autentikasi.
         password (str): password untuk autentikasi.
         ip_address (str): ip address terakhir member.
+        allowed_ips (list[str]): ip / CIDR tambahan yang diizinkan (NAT pool, IPv6).
         report_url (str): url untuk laporan member.
         allow_nosign (bool): status mengizinkan tanpa signature saat request.
         is_active (bool): status aktif member.
@@ -34,6 +35,10 @@ class Member(BaseModel):
     pin: str = Field(description="PIN untuk autentikasi")
     password: str = Field(description="Password untuk autentikasi")
     ip_address: str = Field(description="IP address terakhir member")
+    allowed_ips: list[str] = Field(
+        default_factory=list,
+        description="IP atau CIDR tambahan yang diizinkan",
+    )
     report_url: str = Field(description="URL untuk laporan member")
     allow_nosign: bool = Field(
         default=False,
@@ -0,0 +1,157 @@
+"""Provider registry member yang di-reload otomatis saat sumbernya berubah.
+
+Thread background mem-polling mtime `.env` dan file `MEMBER_SOURCE`. Saat ada
+perubahan, `Settings` dibaca ulang dan `MemberRegistry` baru dibangun di
+thread tersebut; jika berhasil, snapshot baru dipasang dengan satu assignment
+`self.current = registry`. Request yang sedang berjalan tetap memakai
+snapshot lama yang sudah dibacanya, request berikutnya memakai yang baru;
+jalur request tidak memakai lock sama sekali.
+
+Jika rebuild gagal (file setengah tertulis, JSON rusak, validasi gagal) atau
+callback `on_reload` melempar exception, error di-log, snapshot lama tetap
+dipakai dan fingerprint sumber tidak diperbarui, sehingga reload dicoba lagi
+pada polling berikutnya. Thread polling tidak pernah mati karena exception.
+
+Usage:
+    provider = RegistryProvider.from_settings()
+    provider.start()
+    AuthenticationService(OtomaxSignatureService, provider)
+    provider.stop()
+"""
+
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from loguru import logger
+from src.config.settings import Settings, get_settings
+from src.domain.member.registry import MemberRegistry, get_registry
+
+Fingerprint = tuple[tuple[str, int, int] | None, ...]
+
+
+def _stat(path: str | Path) -> tuple[str, int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return str(path), st.st_mtime_ns, st.st_size
+
+
+class RegistryProvider:
+    """Pemegang snapshot `MemberRegistry` terkini dengan hot reload.
+
+    Args:
+        loader: membangun `(registry, paths yang dipantau)` dari sumber terkini.
+        interval: interval polling mtime (detik).
+        on_reload: callback sebelum snapshot baru dipasang; jika melempar
+            exception, snapshot lama tetap dipakai.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], tuple[MemberRegistry, tuple[str, ...]]],
+        interval: float = 2.0,
+        on_reload: Callable[[MemberRegistry], None] | None = None,
+    ) -> None:
+        self.loader = loader
+        self.interval = interval
+        self.on_reload = on_reload
+        self.reloads = 0
+        self.failures = 0
+        registry, self._paths = loader()
+        self.current: MemberRegistry = registry
+        self._fingerprint = self._scan()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_settings(
+        cls, env_path: str | Path = ".env", interval: float = 2.0
+    ) -> "RegistryProvider":
+        """Provider yang membaca ulang `Settings` dari env + file `.env`."""
+
+        def load() -> tuple[MemberRegistry, tuple[str, ...]]:
+            settings = Settings(_env_file=env_path)  # type: ignore[call-arg]
+            registry = MemberRegistry.from_settings(settings)
+            paths = (str(env_path),)
+            if settings.MEMBER_SOURCE:
+                paths += (settings.MEMBER_SOURCE,)
+            return registry, paths
+
+        def publish(_registry: MemberRegistry) -> None:
+            # pemanggil lain get_settings()/get_registry() ikut melihat nilai baru
+            get_settings.cache_clear()
+            get_registry.cache_clear()
+
+        return cls(load, interval=interval, on_reload=publish)
+
+    def start(self) -> None:
+        """Mulai thread polling."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="registry-reload", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Hentikan thread polling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check(self) -> bool:
+        """Reload jika sumber berubah sejak pemeriksaan terakhir.
+
+        Fingerprint hanya diperbarui setelah reload berhasil; reload yang
+        gagal dicoba lagi pada pemeriksaan berikutnya.
+
+        Returns:
+            True jika snapshot baru dipasang.
+        """
+        fingerprint = self._scan()
+        if fingerprint == self._fingerprint:
+            return False
+        paths = self._paths
+        if not self.reload():
+            return False
+        if self._paths == paths:
+            # fingerprint diambil sebelum load: perubahan selama load tidak hilang
+            self._fingerprint = fingerprint
+        return True
+
+    def reload(self) -> bool:
+        """Bangun ulang snapshot sekarang; snapshot lama dipertahankan jika gagal."""
+        try:
+            registry, paths = self.loader()
+        except Exception:
+            self.failures += 1
+            logger.exception("Member registry reload failed, keeping previous snapshot")
+            return False
+        if self.on_reload is not None:
+            try:
+                self.on_reload(registry)
+            except Exception:
+                self.failures += 1
+                logger.exception(
+                    "Member registry reload callback failed, keeping previous snapshot"
+                )
+                return False
+        self.current = registry
+        self.reloads += 1
+        if paths != self._paths:
+            self._paths = paths
+            self._fingerprint = self._scan()
+        logger.info("Member registry reloaded: {} members", len(registry))
+        return True
+
+    def _scan(self) -> Fingerprint:
+        return tuple(_stat(path) for path in self._paths)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
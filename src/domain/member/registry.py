@@ -0,0 +1,229 @@
+"""Registry member yang sudah dinormalisasi untuk lookup O(1) saat autentikasi.
+
+Member divalidasi sekali lewat model pydantic `Member` saat load, lalu disimpan
+sebagai `MemberRecord` (slotted dataclass) di dalam dict dengan key memberid
+UPPERCASE. Sumber data bisa file JSON, database SQLite, atau blok `OTO` di
+settings (mode single member seperti sebelumnya).
+
+Model pydantic hanya dipakai di batas validasi: satu `Member` ~1,4 KB,
+sedangkan satu record di registry ~0,3 KB karena string yang kembar antar
+member (pin, report_url, allowed_ip) di-intern selama load dan allowlist satu
+IP disimpan sebagai string (lihat `compact_allowlist`).
+
+Usage:
+    registry = MemberRegistry.from_file("members.json")
+    member = registry.get("testok01")
+"""
+
+import sqlite3
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter
+from src.config.settings import Settings, get_settings
+from src.domain.member.allowlist import IpAllowlist, compact_allowlist, split_entries
+from src.domain.member.model import Member
+
+SQLITE_SUFFIXES = {".db", ".sqlite", ".sqlite3"}
+
+
+@dataclass(frozen=True, slots=True)
+class MemberRecord:
+    """Bentuk runtime member yang sudah dinormalisasi.
+
+    Attributes:
+        memberid (str): memberid UPPERCASE tanpa spasi.
+        pin (str): pin tanpa spasi.
+        password (str): password tanpa spasi.
+        allowed_ip (str): daftar IP/CIDR yang diizinkan dipisah koma, tanpa port.
+        report_url (str): url untuk laporan member.
+        allow_nosign (bool): status mengizinkan tanpa signature.
+        balance (int): saldo awal saat registry di-load.
+        allow_rule (IpAllowlist | str): `allowed_ip` yang sudah di-compile;
+            string jika allowlist hanya satu alamat. Di-compile otomatis
+            jika tidak diberikan.
+    """
+
+    memberid: str
+    pin: str
+    password: str
+    allowed_ip: str
+    report_url: str
+    allow_nosign: bool = False
+    balance: int = 0
+    allow_rule: IpAllowlist | str = field(default=None, repr=False, compare=False)  # type: ignore[assignment]
+
+    def __post_init__(self) -> None:
+        if self.allow_rule is None:
+            object.__setattr__(self, "allow_rule", compact_allowlist(self.allowed_ip))
+
+    @property
+    def allowlist(self) -> IpAllowlist:
+        """`allowed_ip` sebagai `IpAllowlist` (dibangun jika disimpan sebagai string)."""
+        rule = self.allow_rule
+        if isinstance(rule, str):
+            return IpAllowlist.compile((rule,))
+        return rule
+
+    def allows(self, ip: str) -> bool:
+        """True jika `ip` ada di allowlist member."""
+        rule = self.allow_rule
+        if rule.__class__ is str:
+            return ip == rule
+        return ip in rule
+
+    @classmethod
+    def from_member(cls, member: Member) -> "MemberRecord":
+        """Bangun record dari model `Member` yang sudah tervalidasi."""
+        return _Interner().record(member)
+
+
+class _Interner:
+    """Pool string dan allowlist yang dipakai bersama selama satu kali load."""
+
+    __slots__ = ("_rules", "_strings")
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+        self._rules: dict[str, IpAllowlist | str] = {}
+
+    def record(self, member: Member) -> MemberRecord:
+        """Normalisasi `Member` menjadi record yang berbagi objek dengan pool."""
+        intern = self._strings.setdefault
+        allowed_ip = normalize_allowed_ips(member.ip_address, *member.allowed_ips)
+        allowed_ip = intern(allowed_ip, allowed_ip)
+        rule = self._rules.get(allowed_ip)
+        if rule is None:
+            rule = self._rules[allowed_ip] = compact_allowlist(allowed_ip)
+        pin = member.pin.strip()
+        report_url = member.report_url.strip()
+        return MemberRecord(
+            memberid=member.memberid.strip().upper(),
+            pin=intern(pin, pin),
+            password=member.password.strip(),
+            allowed_ip=allowed_ip,
+            report_url=intern(report_url, report_url),
+            allow_nosign=member.allow_nosign,
+            balance=member.balance,
+            allow_rule=rule,
+        )
+
+
+def normalize_allowed_ips(*raw: str) -> str:
+    """Gabungkan daftar IP/CIDR (boleh dipisah koma, boleh ber-port) tanpa port."""
+    return ",".join(entry for item in raw for entry in split_entries(str(item or "")))
+
+
+class MemberRegistry:
+    """Kumpulan member aktif dengan lookup O(1) berdasarkan memberid.
+
+    Registry diperlakukan sebagai snapshot immutable. Konsumen membaca
+    `registry.current` sekali per validasi: untuk registry statis atribut ini
+    menunjuk ke dirinya sendiri, sedangkan `RegistryProvider` (hot reload)
+    menukar `current` dengan snapshot baru.
+
+    Args:
+        records: record member yang sudah dinormalisasi.
+        enable_ip_check: toggle validasi IP untuk seluruh member.
+    """
+
+    def __init__(
+        self, records: Iterable[MemberRecord] = (), enable_ip_check: bool = True
+    ) -> None:
+        self._members: dict[str, MemberRecord] = {r.memberid: r for r in records}
+        self.enable_ip_check = enable_ip_check
+        self.current = self
+
+    def get(self, memberid: str) -> MemberRecord | None:
+        """Cari member berdasarkan memberid (case-insensitive)."""
+        return self._members.get(str(memberid).strip().upper())
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, memberid: object) -> bool:
+        return self.get(str(memberid)) is not None
+
+    def __iter__(self) -> Iterator[MemberRecord]:
+        return iter(self._members.values())
+
+    @classmethod
+    def from_members(
+        cls, members: Iterable[Member], enable_ip_check: bool = True
+    ) -> "MemberRegistry":
+        """Bangun registry dari model `Member`, member non-aktif dilewati."""
+        interner = _Interner()
+        return cls(
+            (interner.record(m) for m in members if m.is_active),
+            enable_ip_check=enable_ip_check,
+        )
+
+    @classmethod
+    def from_file(
+        cls, path: str | Path, enable_ip_check: bool = True
+    ) -> "MemberRegistry":
+        """Load member dari file JSON (array of member) atau database SQLite."""
+        path = Path(path)
+        if path.suffix.lower() in SQLITE_SUFFIXES:
+            return cls.from_sqlite(path, enable_ip_check=enable_ip_check)
+        members = TypeAdapter(list[Member]).validate_json(path.read_bytes())
+        return cls.from_members(members, enable_ip_check=enable_ip_check)
+
+    @classmethod
+    def from_sqlite(
+        cls, path: str | Path, table: str = "members", enable_ip_check: bool = True
+    ) -> "MemberRegistry":
+        """Load member dari tabel SQLite dengan kolom sesuai field `Member`."""
+        if not table.isidentifier():
+            raise ValueError(f"invalid table name: {table!r}")
+        conn = sqlite3.connect(Path(path))
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute(f"SELECT * FROM {table}").fetchall()
+        finally:
+            conn.close()
+        members = (Member.model_validate(dict(row)) for row in rows)
+        return cls.from_members(members, enable_ip_check=enable_ip_check)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "MemberRegistry":
+        """Bangun registry dari settings.
+
+        Jika `MEMBER_SOURCE` di-set, member di-load dari file tersebut. Jika
+        tidak, registry berisi satu member dari blok `OTO`.
+        """
+        oto = settings.OTO
+        if settings.MEMBER_SOURCE:
+            return cls.from_file(
+                settings.MEMBER_SOURCE, enable_ip_check=oto.enable_ip_check
+            )
+        record = MemberRecord(
+            memberid=oto.memberid.strip().upper(),
+            pin=oto.pin.strip(),
+            password=oto.password.strip(),
+            allowed_ip=normalize_allowed_ips(oto.memberip),
+            report_url=oto.memberreporturl.strip(),
+        )
+        return cls([record], enable_ip_check=oto.enable_ip_check)
+
+
+@lru_cache
+def get_registry() -> MemberRegistry:
+    """Get cached registry built from application settings."""
+    return MemberRegistry.from_settings(get_settings())
+
+
+def resolve_registry(source: Any = None) -> Any:
+    """Terima registry, provider, settings, atau None (registry default aplikasi).
+
+    Returns:
+        objek dengan atribut `current` (snapshot `MemberRegistry`).
+    """
+    if isinstance(source, MemberRegistry) or hasattr(source, "current"):
+        return source
+    if source is None:
+        return get_registry()
+    return MemberRegistry.from_settings(source)
@@ -0,0 +1,78 @@
+"""Model aturan parsing balasan supplier (SMS / HTTP reply).
+
+Aturan ditulis di file TOML atau JSON lalu divalidasi dengan model di bawah
+sebelum dikompilasi oleh `src.domain.supplier.parser`.
+"""
+
+import re
+
+from pydantic import BaseModel, Field, field_validator
+
+FIELD_NAMES = ("sn", "balance", "price")
+
+
+def _compile(pattern: str) -> re.Pattern:
+    try:
+        return re.compile(pattern)
+    except re.error as exc:
+        raise ValueError(f"invalid regex {pattern!r}: {exc}") from exc
+
+
+class StatusRule(BaseModel):
+    """Satu pola keyword status transaksi.
+
+    Attributes:
+        status (str): status hasil jika pola cocok (success, failed, pending).
+        pattern (str): regex keyword, tanpa named group.
+    """
+
+    status: str = Field(description="Status hasil parsing")
+    pattern: str = Field(description="Regex keyword status")
+
+    @field_validator("pattern")
+    @classmethod
+    def check_pattern(cls, value: str) -> str:
+        """Pola harus valid dan tanpa named group (dipakai oleh parser)."""
+        if _compile(value).groupindex:
+            raise ValueError("status pattern must not define named groups")
+        return value
+
+
+class SupplierRules(BaseModel):
+    """Kumpulan aturan parsing untuk satu supplier.
+
+    Attributes:
+        ignore_case (bool): cocokkan pola tanpa membedakan huruf besar/kecil.
+        status (list[StatusRule]): pola status; keyword yang muncul paling
+            awal di balasan menentukan status.
+        fields (dict[str, str]): pola field (sn, balance, price); setiap pola
+            wajib punya named group dengan nama field tersebut.
+    """
+
+    ignore_case: bool = Field(default=True, description="Regex case-insensitive")
+    status: list[StatusRule] = Field(default_factory=list)
+    fields: dict[str, str] = Field(default_factory=dict)
+
+    @field_validator("fields")
+    @classmethod
+    def check_fields(cls, value: dict[str, str]) -> dict[str, str]:
+        """Field harus dikenal dan pola harus memuat named group yang sesuai."""
+        for name, pattern in value.items():
+            if name not in FIELD_NAMES:
+                raise ValueError(
+                    f"unknown field {name!r}, expected one of {FIELD_NAMES}"
+                )
+            if set(_compile(pattern).groupindex) != {name}:
+                raise ValueError(
+                    f"pattern for {name!r} must define only (?P<{name}>...)"
+                )
+        return value
+
+
+class ReplyRules(BaseModel):
+    """Isi file aturan: mapping nama supplier -> aturan.
+
+    Supplier bernama `default` dipakai untuk supplier yang tidak terdaftar.
+    """
+
+    suppliers: dict[str, SupplierRules]
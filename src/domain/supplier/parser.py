@@ -0,0 +1,182 @@
+"""Parser balasan supplier menjadi hasil terstruktur (status, SN, saldo, harga).
+
+Aturan per supplier (lihat `reply_rules.toml`) dikompilasi sekali menjadi dua
+regex gabungan:
+
+    - status: semua pola status digabung dalam satu alternation dengan named
+      group `_s<i>`; satu `search()` menemukan keyword paling awal
+    - fields: semua pola field digabung dalam satu alternation dengan group
+      pembungkus `_f_<field>`; satu `finditer()` mengambil kemunculan
+      pertama setiap field
+
+sehingga setiap balasan hanya dipindai dua kali berapa pun jumlah aturannya.
+Parser hasil kompilasi di-cache per path file aturan.
+
+Usage:
+    parser = get_reply_parser()
+    parser.parse("DIGI", "Trx 081xxx SUKSES. SN: 1234. Saldo 10.000")
+"""
+
+import json
+import re
+import tomllib
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from src.config.settings import get_parser_settings
+from src.core.exceptions.errorcases import EntityNotFoundError
+from src.domain.supplier.model import ReplyRules, SupplierRules
+
+DEFAULT_RULES_PATH = Path(__file__).with_name("reply_rules.toml")
+DEFAULT_SUPPLIER = "default"
+UNKNOWN_STATUS = "unknown"
+
+# pemisah desimal: 1-2 digit terakhir setelah '.' atau ',' (mis. 10250.00)
+_DECIMAL_TAIL = re.compile(r"[.,]\d{1,2}$")
+_NON_DIGIT = re.compile(r"\D")
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedReply:
+    """Hasil parsing satu balasan supplier.
+
+    Attributes:
+        supplier (str): nama supplier aturan yang dipakai.
+        status (str): success, failed, pending, atau unknown.
+        sn (str | None): serial number / referensi supplier.
+        balance (int | None): sisa saldo di supplier (rupiah).
+        price (int | None): harga transaksi (rupiah).
+    """
+
+    supplier: str
+    status: str
+    sn: str | None = None
+    balance: int | None = None
+    price: int | None = None
+
+
+def parse_amount(raw: str) -> int | None:
+    """Ubah nominal format Indonesia (10.250 / 10,250 / 10250.00) ke int."""
+    raw = raw.rstrip(".,")
+    raw = _DECIMAL_TAIL.sub("", raw)
+    digits = _NON_DIGIT.sub("", raw)
+    return int(digits) if digits else None
+
+
+class CompiledSupplier:
+    """Aturan satu supplier yang sudah dikompilasi ke regex gabungan."""
+
+    __slots__ = ("_field_count", "_fields", "_status", "_status_names", "name")
+
+    def __init__(self, name: str, rules: SupplierRules) -> None:
+        self.name = name
+        flags = re.IGNORECASE if rules.ignore_case else 0
+
+        self._status_names = {
+            f"_s{i}": rule.status for i, rule in enumerate(rules.status)
+        }
+        self._status = (
+            re.compile(
+                "|".join(
+                    f"(?P<_s{i}>{rule.pattern})" for i, rule in enumerate(rules.status)
+                ),
+                flags,
+            )
+            if rules.status
+            else None
+        )
+        self._fields = (
+            re.compile(
+                "|".join(
+                    f"(?P<_f_{name}>{pattern})"
+                    for name, pattern in rules.fields.items()
+                ),
+                flags,
+            )
+            if rules.fields
+            else None
+        )
+        self._field_count = len(rules.fields)
+
+    def parse(self, reply: str) -> ParsedReply:
+        """Parse satu balasan dengan dua kali scan regex."""
+        status = UNKNOWN_STATUS
+        if self._status is not None:
+            match = self._status.search(reply)
+            if match is not None:
+                status = self._status_names[match.lastgroup]
+
+        values: dict[str, str] = {}
+        if self._fields is not None:
+            for match in self._fields.finditer(reply):
+                # group pembungkus `_f_<field>` selalu group terluar yang cocok
+                field = match.lastgroup[3:]
+                if field not in values:
+                    values[field] = match.group(field)
+                    if len(values) == self._field_count:
+                        break
+
+        balance = values.get("balance")
+        price = values.get("price")
+        return ParsedReply(
+            supplier=self.name,
+            status=status,
+            sn=values.get("sn"),
+            balance=parse_amount(balance) if balance else None,
+            price=parse_amount(price) if price else None,
+        )
+
+
+class ReplyParser:
+    """Parser balasan untuk banyak supplier.
+
+    Args:
+        rules: aturan tervalidasi; setiap supplier dikompilasi sekali di sini.
+    """
+
+    def __init__(self, rules: ReplyRules) -> None:
+        self._suppliers = {
+            name.upper(): CompiledSupplier(name, supplier_rules)
+            for name, supplier_rules in rules.suppliers.items()
+        }
+        self._default = self._suppliers.get(DEFAULT_SUPPLIER.upper())
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "ReplyParser":
+        """Load aturan dari file TOML atau JSON (berdasarkan suffix)."""
+        path = Path(path)
+        if path.suffix.lower() == ".json":
+            data = json.loads(path.read_bytes())
+        else:
+            data = tomllib.loads(path.read_text(encoding="utf-8"))
+        return cls(ReplyRules.model_validate(data))
+
+    def __contains__(self, supplier: str) -> bool:
+        return supplier.upper() in self._suppliers
+
+    def supplier(self, supplier: str) -> CompiledSupplier:
+        """Ambil aturan terkompilasi supplier, fallback ke supplier `default`.
+
+        Raises:
+            EntityNotFoundError: supplier tidak terdaftar dan tidak ada default.
+        """
+        compiled = self._suppliers.get(supplier.upper(), self._default)
+        if compiled is None:
+            raise EntityNotFoundError(f"aturan parsing supplier {supplier!r} tidak ada")
+        return compiled
+
+    def parse(self, supplier: str, reply: str) -> ParsedReply:
+        """Parse balasan mentah dari supplier."""
+        return self.supplier(supplier).parse(reply)
+
+
+@lru_cache
+def load_parser(path: str | Path = DEFAULT_RULES_PATH) -> ReplyParser:
+    """Get cached parser untuk file aturan (dikompilasi sekali per path)."""
+    return ReplyParser.from_file(path)
+
+
+def get_reply_parser() -> ReplyParser:
+    """Parser dari file aturan di settings (`PARSER_RULES_PATH`)."""
+    return load_parser(get_parser_settings().rules_path or DEFAULT_RULES_PATH)
@@ -1,48 +1,156 @@
-"""main for testing simulation."""
+"""main for testing simulation.
 
+Import modul ini sengaja murah: logging (`mlog.yaml`), router API beserta
+dependency-nya, dan komponen app-scoped baru dimuat saat startup di
+`lifespan`. `src.server` memanggil `include_routers` sebelum fork agar modul
+router tetap dibagi copy-on-write oleh semua worker.
+"""
+
+import importlib
 from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from loguru import logger
 
+from src.api.responses import PongResponse
 from src.core.exceptions import (
     register_exception_handlers,
 )
-from src.core.middlewares import RequestContextMiddleware
-from src.core.mlogging.config import setup_logging
-
-setup_logging()
-dt_jakarta = datetime.now(ZoneInfo("Asia/Jakarta"))
+from src.core.metrics import metrics
+from src.core.middlewares import RateLimitMiddleware, RequestContextMiddleware
+from src.core.mlogging.config import setup_logging, shutdown_logging
+
+if TYPE_CHECKING:
+    from src.core.shared_state import SharedIdempotencyStore
+    from src.services.idempotency import IdempotencyStore
+    from src.services.report_dispatcher import ReportDispatcher
+    from src.services.store import SqliteStore
+
+# "modul:atribut" router yang di-include saat startup
+ROUTERS = ("src.api.api_trx:router", "src.api.stream:router")
+
+
+def include_routers(app: FastAPI) -> None:
+    """Import router di `ROUTERS` dan daftarkan ke `app` (sekali per app)."""
+    if getattr(app.state, "routers_included", False):
+        return
+    for target in ROUTERS:
+        module, _, name = target.partition(":")
+        app.include_router(getattr(importlib.import_module(module), name))
+    app.state.routers_included = True
+
+
+def _register_stats_gauges(
+    reports: "ReportDispatcher | None",
+    idempotency: "IdempotencyStore | SharedIdempotencyStore | None",
+    store: "SqliteStore | None",
+) -> None:
+    """Export `stats()` komponen app-scoped yang aktif sebagai gauge `/metrics`.
+
+    Setiap `stats()` dibaca sekali per scrape (`gauge_group`); versi shared
+    memory idempotency men-scan seluruh tabel.
+    """
+    if reports is not None:
+        metrics.gauge_group(
+            "report_dispatcher",
+            "Statistik dispatcher callback laporan member.",
+            reports.stats,
+            ("pending", "retry_queue", "sent", "retried", "failed", "dropped"),
+        )
+    if idempotency is not None:
+        metrics.gauge_group(
+            "idempotency_cache",
+            "Statistik cache idempotency trxid.",
+            idempotency.stats,
+            ("size", "hits", "misses", "evictions", "expirations"),
+        )
+    if store is not None:
+        metrics.gauge_group(
+            "sqlite_store",
+            "Statistik cache member dan writer store SQLite.",
+            store.stats,
+            ("hits", "misses", "writes", "commits", "failed"),
+        )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # noqa: D103
+    from src.api.dependencies import (  # noqa: PLC0415
+        build_auth_service,
+        build_registry_provider,
+        build_report_dispatcher,
+        build_store,
+    )
+
+    setup_logging()
+    include_routers(app)
     logger.info("Starting up the FastAPI application...")
+    # pipeline auth dibangun sekali dan dipakai ulang oleh semua request /trx
+    provider = app.state.registry_provider = build_registry_provider()
+    if provider is not None:
+        provider.start()
+    store = app.state.store = build_store()
+    app.state.auth_service = build_auth_service(provider, store)
+    reports = app.state.report_dispatcher = build_report_dispatcher()
+    if reports is not None:
+        await reports.start()
+    idempotency = app.state.auth_service.idempotency
+    _register_stats_gauges(reports, idempotency, store)
     yield
 
+    if reports is not None:
+        await reports.aclose()
+        logger.info(f"Report dispatcher stats: {reports.stats()}")
+    if idempotency is not None:
+        logger.info(f"Idempotency cache stats: {idempotency.stats()}")
+        idempotency.close()
+    if store is not None:
+        logger.info(f"SQLite store stats: {store.stats()}")
+        store.close()
+    journal = app.state.auth_service.journal
+    if journal is not None:
+        journal.close()
+    if provider is not None:
+        provider.stop()
+
     now: datetime = datetime.now(ZoneInfo("Asia/Jakarta"))
     logger.info(f"Shutting down @: {now.isoformat()}")
+    shutdown_logging()
 
 
 # Create the real FastAPI app
 app = FastAPI(lifespan=lifespan)
 
 
-# Register middleware and exception handlers on the real app
+# Register middleware and exception handlers on the real app.
+# RequestContextMiddleware is added last so it wraps the rate limiter: 429
+# rejections still get a trace id and an access log line.
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(RequestContextMiddleware)
 register_exception_handlers(app)
 
 
-@app.get("/ping")
+@app.get("/ping", response_class=PongResponse)
 async def ping():
     """Just a ping endpoint to check if the server is running."""
-    return {"message": "pong"}
+    return PongResponse()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """Metrics in-process dalam format teks Prometheus."""
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
 
 
 def main() -> None:
-    import uvicorn
+    """Jalankan server development (single process, reload)."""
+    import uvicorn  # noqa: PLC0415
 
     # Use the string import to enable reload functionality
     uvicorn.run(
@@ -0,0 +1,86 @@
+"""CLI rekonsiliasi: autentikasi ulang transaksi NDJSON dari file secara streaming.
+
+File dibaca per blok dan hasil ditulis per chunk sehingga memori tetap
+konstan berapa pun jumlah baris input. Replay tidak berasal dari jaringan,
+jadi IP check selalu dimatikan, baik member dimuat dari `--members` maupun
+dari settings.
+
+Usage:
+    python -m src.reconcile transaksi.ndjson -o hasil.ndjson --members members.json
+    cat transaksi.ndjson | python -m src.reconcile - > hasil.ndjson
+"""
+
+import argparse
+import sys
+from collections.abc import Iterator
+from typing import BinaryIO
+
+from src.api.stream import CHUNK_SIZE, authenticate_lines, iter_lines
+from src.domain.member.registry import MemberRegistry, get_registry
+from src.services.auth import AuthenticationService
+from src.services.siganture_auth import OtomaxSignatureService
+
+READ_SIZE = 64 * 1024
+# IP check selalu mati untuk replay; nilai ini hanya mengisi parameter service
+_REPLAY_IP = "127.0.0.1"
+
+
+def read_blocks(fh: BinaryIO, size: int = READ_SIZE) -> Iterator[bytes]:
+    """Baca file biner per blok `size` byte."""
+    while block := fh.read(size):
+        yield block
+
+
+def reconcile(
+    service: AuthenticationService,
+    source: BinaryIO,
+    target: BinaryIO,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """Autentikasi NDJSON dari `source`, tulis hasil NDJSON ke `target`.
+
+    Returns:
+        jumlah baris hasil yang ditulis.
+    """
+    written = 0
+    for chunk in authenticate_lines(
+        service, iter_lines(read_blocks(source)), _REPLAY_IP, chunk_size
+    ):
+        target.write(chunk)
+        written += chunk.count(b"\n")
+    target.flush()
+    return written
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point CLI `python -m src.reconcile`."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="file NDJSON, '-' untuk stdin")
+    parser.add_argument(
+        "-o", "--output", default="-", help="file hasil, '-' untuk stdout"
+    )
+    parser.add_argument("--members", help="file member JSON/SQLite (default: settings)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    registry = (
+        MemberRegistry.from_file(args.members, enable_ip_check=False)
+        if args.members
+        else MemberRegistry(get_registry(), enable_ip_check=False)
+    )
+    service = AuthenticationService(OtomaxSignatureService, registry)
+
+    source = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")  # noqa: SIM115
+    target = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")  # noqa: SIM115
+    try:
+        count = reconcile(service, source, target, args.chunk_size)
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if target is not sys.stdout.buffer:
+            target.close()
+    sys.stderr.write(f"{count} transaksi diproses\n")
+
+
+if __name__ == "__main__":
+    main()
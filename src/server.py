@@ -0,0 +1,192 @@
+"""Entry point produksi: server uvicorn pre-fork dengan N worker.
+
+Urutan startup di proses parent:
+
+    1. bind socket listen sekali (dibagi ke semua worker, kernel membagi
+       koneksi yang masuk)
+    2. import `src.main` dan load registry member, lalu `gc.freeze()` agar
+       halaman memori objek tersebut tetap copy-on-write shared setelah fork
+    3. alokasikan state bersama (rate limit, idempotency) di shared memory
+    4. fork N worker; worker yang mati di-respawn sampai SIGTERM/SIGINT
+
+Setiap worker menjalankan lifespan aplikasi sendiri. Komponen yang menulis
+file per proses (journal transaksi, retry queue report) diberi suffix
+`.w<index>`.
+
+`main()` di `src.main` tetap untuk development (single process, reload).
+
+Usage:
+    python -m src.server --workers 4 --host 0.0.0.0 --port 8000
+"""
+
+import argparse
+import contextlib
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from types import FrameType
+
+import uvicorn
+from fastapi import FastAPI
+from loguru import logger
+
+from src.config.settings import (
+    get_idempotency_settings,
+    get_journal_settings,
+    get_rate_limit_settings,
+    get_report_settings,
+)
+from src.core.mlogging.config import setup_logging, shutdown_logging
+from src.core.shared_state import SharedState, install_shared_state
+from src.domain.member.registry import get_registry
+from src.main import app, include_routers
+
+# worker yang mati lebih cepat dari ini dianggap crash loop, respawn ditunda
+_MIN_WORKER_LIFETIME = 1.0
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Buat socket listen yang diwariskan ke semua worker."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    # proto eksplisit: asyncio hanya memasang TCP_NODELAY pada koneksi yang
+    # proto-nya IPPROTO_TCP; tanpa ini setiap response tertahan Nagle ~40 ms
+    sock = socket.socket(family, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _per_worker_paths(index: int) -> None:
+    """Beri suffix worker pada file yang ditulis append oleh satu proses."""
+    journal = get_journal_settings()
+    journal.path = f"{journal.path}.w{index}"
+    report = get_report_settings()
+    if report.retry_path:
+        report.retry_path = f"{report.retry_path}.w{index}"
+
+
+def _reinit_logging_after_fork() -> None:
+    """Thread writer QueueSink milik parent tidak ikut ter-fork; lepas sink-nya.
+
+    Lifespan worker memanggil `setup_logging()` lagi dan memasang sink baru.
+    """
+    shutdown_logging()
+
+
+def run_worker(app: FastAPI, sock: socket.socket, index: int) -> None:
+    """Jalankan satu worker uvicorn di atas socket bersama (di proses anak)."""
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    _per_worker_paths(index)
+    _reinit_logging_after_fork()
+
+    config = uvicorn.Config(
+        app, lifespan="on", access_log=False, log_config=None, loop="auto"
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class _Supervisor:
+    """Fork worker dan respawn yang mati sampai `stop()` dipanggil."""
+
+    def __init__(self, app: FastAPI, sock: socket.socket) -> None:
+        self.app = app
+        self.sock = sock
+        # pid -> (index worker, waktu spawn)
+        self.children: dict[int, tuple[int, float]] = {}
+        self.stopping = False
+
+    def spawn(self, index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                run_worker(self.app, self.sock, index)
+            except BaseException:
+                logger.exception("worker {} crashed", index)
+                code = 1
+            finally:
+                os._exit(code)
+        self.children[pid] = (index, time.monotonic())
+
+    def stop(self, _signum: int, _frame: FrameType | None) -> None:
+        """Handler SIGTERM/SIGINT: teruskan SIGTERM ke semua worker."""
+        self.stopping = True
+        for pid in list(self.children):
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+    def run(self, workers: int) -> None:
+        """Spawn `workers` proses lalu tunggu sampai semuanya keluar."""
+        for index in range(workers):
+            self.spawn(index)
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            index, started = self.children.pop(pid, (None, 0.0))
+            if self.stopping or index is None:
+                continue
+            logger.warning(
+                "worker {} (pid {}) exited with {}, respawning",
+                index,
+                pid,
+                os.waitstatus_to_exitcode(status),
+            )
+            if time.monotonic() - started < _MIN_WORKER_LIFETIME:
+                time.sleep(_MIN_WORKER_LIFETIME)
+            if not self.stopping:
+                self.spawn(index)
+
+
+def serve(workers: int, host: str, port: int) -> None:
+    """Pre-fork `workers` proses dan supervisi sampai menerima SIGTERM/SIGINT."""
+    sock = bind_socket(host, port)
+
+    # dimuat sebelum fork: dibagi copy-on-write oleh semua worker
+    setup_logging()
+    include_routers(app)
+    registry = get_registry()
+    state = SharedState.create(get_rate_limit_settings(), get_idempotency_settings())
+    install_shared_state(state)
+    gc.freeze()
+    logger.info(
+        "Pre-fork server {}:{} with {} workers, {} members loaded",
+        host,
+        port,
+        workers,
+        len(registry),
+    )
+
+    supervisor = _Supervisor(app, sock)
+    signal.signal(signal.SIGTERM, supervisor.stop)
+    signal.signal(signal.SIGINT, supervisor.stop)
+    try:
+        supervisor.run(workers)
+    finally:
+        sock.close()
+        install_shared_state(None)
+        state.close(unlink=True)
+        logger.info("Pre-fork server stopped")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point CLI `python -m src.server`."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+    if sys.platform == "win32":
+        raise SystemExit("src.server membutuhkan os.fork (Linux/macOS)")
+    serve(max(1, args.workers), args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
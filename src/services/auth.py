@@ -1,60 +1,167 @@
+"""Pipeline autentikasi transaksi `/trx`: IP, kredensial/signature, idempotency."""
+
+import hmac
+import time
+from collections.abc import Callable, Iterable, Mapping
 from typing import Any
 
-from src.config.settings import get_settings
-from src.services.errors import AuthError
+from src.core.exceptions.base import AppBaseExceptionsError
+from src.core.metrics import Counter, MetricsRegistry
+from src.core.metrics import metrics as default_metrics
+from src.core.shared_state import SharedIdempotencyStore
+from src.domain.member.registry import resolve_registry
+from src.services.client_auth import ClientAuth
+from src.services.credential_auth import CredentialAuth
+from src.services.errors import AuthError, RateLimitError
+from src.services.idempotency import IdempotencyStore
+from src.services.journal import TransactionJournal
+from src.services.sign_auth import SignatureAuth
+from src.services.store import SqliteStore
 
 
 class AuthenticationService:
     """Service untuk autentikasi transaksi OtomaX API.
 
     Behavior:
-        - If `enable_ip_check` is True in settings, validate client IP matches stored member IP.
+        - If `enable_ip_check` is True in the registry, validate client IP matches stored member IP.
         - Accept either pin+password or sign.
         - On pin+password: check credentials, compute signature and compare when `sign` is provided.
         - On sign only: verify signature using stored credentials for the member.
         - Raise `AuthError` with appropriate message and status code on failures.
         - Return dict on success containing status, trxid, memberid, sign.
+
+    Instance ini dimaksudkan berumur panjang (app-scoped): komponen validasi
+    dibangun sekali di `__init__` lalu dipakai ulang untuk setiap request.
+    `registry` boleh berupa `RegistryProvider` (hot reload); snapshot member
+    dibaca lewat `registry.current` pada setiap validasi.
+
+    Jika `idempotency` diberikan, resend trxid dengan parameter identik dijawab
+    dari cache setelah IP check, tanpa validasi kredensial/signature ulang.
+
+    Latency tiap tahap (ip_check, credential_check, signature_generate,
+    signature_verify) dicatat di histogram `auth_stage_seconds` dan setiap
+    `AuthError` dihitung per status code di `auth_errors_total`.
+
+    Jika `journal` diberikan, setiap hasil sukses (bukan hit idempotency)
+    ditambahkan ke journal transaksi; fsync dilakukan oleh group commit di
+    thread journal sehingga request tidak menunggu disk. `SqliteStore` juga
+    bisa dipakai sebagai `journal` (dan sebagai `registry`).
     """
 
-    def __init__(self, signature_service: Any, settings: Any = None) -> None:
+    def __init__(
+        self,
+        signature_service: Any,
+        registry: Any = None,
+        idempotency: IdempotencyStore | SharedIdempotencyStore | None = None,
+        metrics: MetricsRegistry | None = None,
+        journal: TransactionJournal | SqliteStore | None = None,
+    ) -> None:
         self.signature = signature_service
-        self.settings = settings or get_settings()
+        self.registry = resolve_registry(registry)
+        self.idempotency = idempotency
+        self.journal = journal
+        self.client_auth = ClientAuth(self.registry)
+        self.credential_auth = CredentialAuth(self.registry)
+        self.signature_auth = SignatureAuth(signature_service)
+
+        self.metrics = metrics or default_metrics
+        stage = "Latency per tahap autentikasi transaksi."
+        self._ip_check = self.metrics.histogram(
+            "auth_stage_seconds", stage, stage="ip_check"
+        )
+        self._credential_check = self.metrics.histogram(
+            "auth_stage_seconds", stage, stage="credential_check"
+        )
+        self._sign_generate = self.metrics.histogram(
+            "auth_stage_seconds", stage, stage="signature_generate"
+        )
+        self._sign_verify = self.metrics.histogram(
+            "auth_stage_seconds", stage, stage="signature_verify"
+        )
+        self._sign_batch = self.metrics.histogram(
+            "auth_stage_seconds", stage, stage="signature_batch"
+        )
+        self._errors: dict[int, Counter] = {}
+
+    def _count_error(self, status_code: int) -> None:
+        counter = self._errors.get(status_code)
+        if counter is None:
+            counter = self._errors[status_code] = self.metrics.counter(
+                "auth_errors_total",
+                "Jumlah AuthError per status code.",
+                status=str(status_code),
+            )
+        counter.inc()
+
+    @staticmethod
+    def _read_fields(auth: Any) -> tuple:
+        """Ambil field transaksi dari model `Auth` atau dict.
+
+        Model pydantic sudah di-strip saat validasi sehingga atributnya dibaca
+        langsung; dict mentah tetap dinormalisasi di sini.
+        """
+        if isinstance(auth, Mapping):
+            return (
+                str(auth.get("memberid", "")).strip(),
+                str(auth.get("trxid", "")).strip(),
+                str(auth.get("product", "")).strip(),
+                str(auth.get("dest", "")).strip(),
+                auth.get("pin"),
+                auth.get("password"),
+                auth.get("sign"),
+            )
+        return (
+            auth.memberid,
+            auth.trxid,
+            auth.product,
+            auth.dest,
+            auth.pin,
+            auth.password,
+            auth.sign,
+        )
 
     def authenticate_transaction(self, auth: Any, client_ip: str) -> dict:
         """Orchestrate small auth components to validate a transaction request.
 
         Uses `ClientAuth`, `CredentialAuth`, and `SignatureAuth` to separate concerns.
         """
-        # lazy import to avoid circular imports at module import time
-        from src.services.client_auth import ClientAuth
-        from src.services.credential_auth import CredentialAuth
-        from src.services.sign_auth import SignatureAuth
-
-        # normalize input dict / pydantic model
-        data = auth.dict() if hasattr(auth, "dict") else dict(auth)
-
-        memberid = str(data.get("memberid", "")).strip()
-        trxid = str(data.get("trxid", "")).strip()
-        product = str(data.get("product", "")).strip()
-        dest = str(data.get("dest", "")).strip()
-        pin = data.get("pin")
-        password = data.get("password")
-        sign = data.get("sign")
+        try:
+            return self._authenticate(auth, client_ip)
+        except AuthError as exc:
+            self._count_error(exc.status_code)
+            raise
+
+    def _authenticate(self, auth: Any, client_ip: str) -> dict:
+        clock = time.perf_counter_ns
+        memberid, trxid, product, dest, pin, password, sign = self._read_fields(auth)
 
         # 1) Client auth (IP check)
-        ClientAuth(self.settings).validate(memberid, client_ip)
+        start = clock()
+        self.client_auth.validate(memberid, client_ip)
+        self._ip_check.observe_ns(clock() - start)
+
+        idempotency = self.idempotency
+        if idempotency is not None:
+            fingerprint = (product, dest, pin, password, sign)
+            cached = idempotency.get(memberid, trxid, fingerprint)
+            if cached is not None:
+                return cached
 
         has_pin_auth = pin is not None and password is not None
         has_sign_auth = sign is not None
 
         # 2) Credential / signature validation
         if has_pin_auth:
-            CredentialAuth(self.settings).validate(memberid, pin, password)
+            start = clock()
+            self.credential_auth.validate(memberid, pin, password)
+            self._credential_check.observe_ns(clock() - start)
 
             # generate expected sign using provided pin+password
+            start = clock()
             expected_sign = self.signature.generate_transaction_signature(
                 memberid, product, dest, trxid, pin, password
             )
+            self._sign_generate.observe_ns(clock() - start)
 
             if has_sign_auth and str(sign).upper() != expected_sign.upper():
                 raise AuthError("signature tidak valid", 401)
@@ -62,22 +169,201 @@ class AuthenticationService:
             final_sign = expected_sign
         elif has_sign_auth:
             # verify signature using stored credentials
-            SignatureAuth(self.signature).validate(
+            member = self.registry.current.get(memberid)
+            if member is None:
+                raise AuthError("signature tidak valid", 401)
+            start = clock()
+            self.signature_auth.validate(
                 memberid,
                 product,
                 dest,
                 trxid,
                 sign,
-                pin=self.settings.OTO.pin,
-                password=self.settings.OTO.password,
+                pin=member.pin,
+                password=member.password,
             )
+            self._sign_verify.observe_ns(clock() - start)
             final_sign = sign
         else:
             raise AuthError("Provide either 'pin' and 'password', or 'sign'.", 400)
 
-        return {
+        result = {
             "status": "success",
             "trxid": trxid,
             "memberid": memberid,
             "sign": final_sign,
         }
+        if idempotency is not None:
+            idempotency.put(memberid, trxid, fingerprint, result)
+        if self.journal is not None:
+            self.journal.append(result)
+        return result
+
+    def authenticate_many(
+        self,
+        auths: Iterable[Any],
+        client_ip: str,
+        admit: Callable[[str], float] | None = None,
+        seen: set[tuple[str, str]] | None = None,
+    ) -> list[dict]:
+        """Autentikasi banyak transaksi sekaligus (endpoint batch).
+
+        Aturan per item identik dengan `authenticate_transaction`, tetapi
+        semua signature (pin path maupun sign-only) dihitung dalam satu
+        panggilan `generate_many` sehingga state SHA1 prefix per member
+        dipakai ulang di seluruh batch.
+
+        Pasangan (memberid, trxid) yang muncul lagi di batch yang sama ditolak
+        dengan 409 agar transaksi tidak di-sign dan dicatat dua kali.
+
+        Args:
+            auths: item transaksi (model `Auth` atau mapping).
+            client_ip: IP client pengirim batch.
+            admit: pengambil token rate limit per item (lihat
+                `item_admission`); item yang ditolak berstatus error 429.
+            seen: pasangan (MEMBERID, trxid) yang sudah diproses; diisi
+                selama pemanggilan. Berikan set yang sama di setiap chunk
+                agar duplikat lintas chunk (stream) ikut ditolak.
+
+        Returns:
+            list hasil dengan urutan sama dengan input. Item gagal berisi
+            `{"status": "error", "trxid", "memberid", "rc", "message",
+            "status_code"}` dan tidak menggagalkan item lain.
+        """
+        results: list[dict | None] = []
+        # (index, memberid, trxid, sign, fingerprint, has_pin_auth)
+        pending: list[tuple] = []
+        rows: list[tuple] = []
+        idempotency = self.idempotency
+        ip_checked: dict[str, bool] = {}
+        if seen is None:
+            seen = set()
+
+        for index, auth in enumerate(auths):
+            memberid, trxid, product, dest, pin, password, sign = self._read_fields(
+                auth
+            )
+            rejected = self._admission_error(memberid, trxid, seen, admit)
+            if rejected is not None:
+                results.append(self._error_item(memberid, trxid, rejected))
+                continue
+            fingerprint = (product, dest, pin, password, sign)
+            try:
+                if memberid not in ip_checked:
+                    self.client_auth.validate(memberid, client_ip)
+                    ip_checked[memberid] = True
+                if idempotency is not None:
+                    cached = idempotency.get(memberid, trxid, fingerprint)
+                    if cached is not None:
+                        results.append(cached)
+                        continue
+                rows.append(
+                    self._signing_row(
+                        memberid, trxid, product, dest, pin, password, sign
+                    )
+                )
+            except AuthError as exc:
+                results.append(self._error_item(memberid, trxid, exc))
+                continue
+            has_pin_auth = pin is not None and password is not None
+            pending.append((index, memberid, trxid, sign, fingerprint, has_pin_auth))
+            results.append(None)
+
+        if rows:
+            start = time.perf_counter_ns()
+            signatures = self.signature.generate_many(rows)
+            self._sign_batch.observe_ns(time.perf_counter_ns() - start)
+        else:
+            signatures = []
+
+        self._finish_batch(pending, signatures, results)
+        return results
+
+    @staticmethod
+    def _admission_error(
+        memberid: str,
+        trxid: str,
+        seen: set[tuple[str, str]],
+        admit: Callable[[str], float] | None,
+    ) -> AppBaseExceptionsError | None:
+        """Tolak item duplikat (409) atau yang melebihi rate limit (429)."""
+        key = (memberid.upper(), trxid)
+        if key in seen:
+            return AuthError(f"trxid {trxid} duplikat dalam batch", 409)
+        seen.add(key)
+        if admit is not None:
+            retry_after = admit(memberid)
+            if retry_after:
+                return RateLimitError(retry_after)
+        return None
+
+    def _finish_batch(
+        self, pending: list[tuple], signatures: list[str], results: list[dict | None]
+    ) -> None:
+        """Cocokkan signature batch dan isi slot hasil yang masih kosong."""
+        idempotency = self.idempotency
+        journal = self.journal
+        for (index, memberid, trxid, sign, fingerprint, has_pin_auth), expected in zip(
+            pending, signatures, strict=True
+        ):
+            if has_pin_auth:
+                valid = sign is None or str(sign).upper() == expected.upper()
+                final_sign = expected
+            else:
+                valid = hmac.compare_digest(str(sign).encode(), expected.encode())
+                final_sign = sign
+            if not valid:
+                results[index] = self._error_item(
+                    memberid, trxid, AuthError("signature tidak valid", 401)
+                )
+                continue
+            result = {
+                "status": "success",
+                "trxid": trxid,
+                "memberid": memberid,
+                "sign": final_sign,
+            }
+            if idempotency is not None:
+                idempotency.put(memberid, trxid, fingerprint, result)
+            if journal is not None:
+                journal.append(result)
+            results[index] = result
+
+    def _signing_row(
+        self,
+        memberid: str,
+        trxid: str,
+        product: str,
+        dest: str,
+        pin: str | None,
+        password: str | None,
+        sign: str | None,
+    ) -> tuple:
+        """Validasi credential satu item batch, kembalikan baris `generate_many`.
+
+        Raises:
+            AuthError: pin/password salah, member tidak dikenal, atau tanpa
+                pin+password maupun sign.
+        """
+        if pin is not None and password is not None:
+            self.credential_auth.validate(memberid, pin, password)
+            return (memberid, product, dest, trxid, pin, password)
+        if sign is None:
+            raise AuthError("Provide either 'pin' and 'password', or 'sign'.", 400)
+        member = self.registry.current.get(memberid)
+        if member is None:
+            raise AuthError("signature tidak valid", 401)
+        return (memberid, product, dest, trxid, member.pin, member.password)
+
+    def _error_item(
+        self, memberid: str, trxid: str, exc: AppBaseExceptionsError
+    ) -> dict:
+        self._count_error(exc.status_code)
+        return {
+            "status": "error",
+            "trxid": trxid,
+            "memberid": memberid,
+            "rc": exc.__class__.__name__,
+            "message": str(exc),
+            "status_code": exc.status_code,
+        }
@@ -1,21 +1,23 @@
-from src.config.settings import get_settings
+"""Validasi IP client terhadap allowlist member di registry."""
+
+from typing import Any
+
+from src.domain.member.registry import resolve_registry
 from src.services.errors import AuthError
 
 
 class ClientAuth:
-    """Validate client IP and member id matches stored settings."""
+    """Validate client IP against the member registry."""
 
-    def __init__(self, settings=None):
-        self.settings = settings or get_settings()
+    def __init__(self, registry: Any = None) -> None:
+        self.registry = resolve_registry(registry)
 
     def validate(self, memberid: str, client_ip: str) -> None:
         """Raise AuthError("invalid IP", 403) when IP check enabled and mismatch."""
-        memberid = str(memberid).strip()
-        allowed_memberid = str(self.settings.OTO.memberid).strip().upper()
-        allowed_memberip = str(self.settings.OTO.memberip or "").split(":")[0]
-        enable_ip_check = bool(getattr(self.settings.OTO, "enable_ip_check", True))
+        registry = self.registry.current
+        if not registry.enable_ip_check:
+            return
 
-        if enable_ip_check and (
-            memberid.upper() != allowed_memberid or client_ip != allowed_memberip
-        ):
+        member = registry.get(memberid)
+        if member is None or not member.allows(client_ip):
             raise AuthError("invalid IP", 403)
@@ -1,16 +1,19 @@
-from src.config.settings import get_settings
+"""Validasi pin dan password terhadap member di registry."""
+
+from typing import Any
+
+from src.domain.member.registry import resolve_registry
 from src.services.errors import AuthError
 
 
 class CredentialAuth:
-    """Validate provided pin and password against settings."""
+    """Validate provided pin and password against the member registry."""
 
-    def __init__(self, settings=None):
-        self.settings = settings or get_settings()
+    def __init__(self, registry: Any = None) -> None:
+        self.registry = resolve_registry(registry)
 
     def validate(self, memberid: str, pin: str, password: str) -> None:
         """Raise AuthError("pin password salah", 401) on mismatch."""
-        if str(pin) != str(self.settings.OTO.pin) or str(password) != str(
-            self.settings.OTO.password
-        ):
+        member = self.registry.current.get(memberid)
+        if member is None or str(pin) != member.pin or str(password) != member.password:
             raise AuthError("pin password salah", 401)
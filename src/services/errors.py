@@ -1,7 +1,34 @@
-class AuthError(Exception):
-    """Exception untuk kegagalan autentikasi dengan code dan message."""
+"""Exception autentikasi dan admission control endpoint transaksi."""
+
+from src.core.exceptions.base import AppBaseExceptionsError
+
+
+class AuthError(AppBaseExceptionsError):
+    """Exception untuk kegagalan autentikasi dengan code dan message.
+
+    Ditangani langsung oleh `app_exception_handler` seperti exception aplikasi
+    lainnya, tanpa dibungkus ulang menjadi `HTTPException`.
+    """
+
+    DEFAULT_MESSAGE = "autentikasi gagal"
+    DEFAULT_STATUS_CODE = 401
 
     def __init__(self, detail: str, status_code: int = 401) -> None:
         self.detail = detail
-        self.status_code = status_code
-        super().__init__(detail)
+        super().__init__(detail, status_code=status_code)
+
+
+class RateLimitError(AppBaseExceptionsError):
+    """Request ditolak token bucket member/IP; dikirim dengan `Retry-After`."""
+
+    DEFAULT_MESSAGE = "terlalu banyak request"
+    DEFAULT_STATUS_CODE = 429
+
+    def __init__(self, retry_after: float, message: str | None = None) -> None:
+        self.retry_after = retry_after
+        super().__init__(message, status_code=self.DEFAULT_STATUS_CODE)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Header response tambahan untuk `app_exception_handler`."""
+        return {"retry-after": str(max(1, round(self.retry_after)))}
@@ -0,0 +1,263 @@
+"""Store idempotency untuk trxid yang dikirim ulang oleh Otomax.
+
+Otomax mengirim ulang trxid yang sama saat balasan supplier lambat. Store ini
+menyimpan hasil autentikasi per (memberid, trxid) sehingga resend dijawab
+langsung dengan hasil semula.
+
+Karakteristik:
+    - bounded: LRU eviction saat jumlah entry melebihi `max_size`
+    - TTL: entry kedaluwarsa setelah `ttl` detik
+    - fingerprint: hit hanya jika parameter request identik dengan request
+      semula (product, dest, pin, password, sign), sehingga trxid yang sama
+      dengan kredensial berbeda tetap melewati autentikasi penuh. Yang
+      disimpan hanya digest BLAKE2b ber-key dari fingerprint, jadi pin dan
+      password tidak pernah ada di memori cache maupun di disk
+    - opsional disk-backed: setiap entry ditulis ke journal JSON lines oleh
+      thread writer (group flush, tidak di event loop) dan di-replay saat
+      start; journal di-compact saat terlalu besar. Key digest disimpan di
+      `<path>.key` (mode 0600) agar digest tetap cocok setelah restart
+
+Usage:
+    store = IdempotencyStore(max_size=10_000, ttl=600)
+    store.put("M1", "TRX1", fingerprint, result)
+    store.get("M1", "TRX1", fingerprint)  # -> result
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from pathlib import Path
+
+from loguru import logger
+
+
+class IdempotencyStore:
+    """Cache hasil transaksi dengan TTL + LRU eviction.
+
+    Args:
+        max_size: jumlah entry maksimum.
+        ttl: umur entry dalam detik.
+        path: path journal; None berarti murni in-memory.
+        clock: sumber waktu (epoch detik), dapat diganti untuk test.
+        flush_interval_ms: interval thread writer menulis journal ke disk.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 100_000,
+        ttl: float = 600.0,
+        path: str | Path | None = None,
+        clock: Callable[[], float] = time.time,
+        flush_interval_ms: float = 10.0,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.flush_interval = flush_interval_ms / 1000.0
+        # key -> (expires_at, digest fingerprint, result)
+        self._entries: OrderedDict[tuple[str, str], tuple[float, str, dict]] = (
+            OrderedDict()
+        )
+        self._path = Path(path) if path else None
+        self._journal = None
+        self._journal_lines = 0
+        # baris journal yang belum ditulis, dan snapshot entry saat compaction
+        self._pending: list[str] = []
+        self._snapshot: list | None = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._key = self._load_key() if self._path is not None else os.urandom(32)
+        if self._path is not None:
+            self._load_journal()
+            self._write_compacted(list(self._entries.items()), [])
+            self._journal_lines = len(self._entries)
+            self._thread = threading.Thread(
+                target=self._flush_loop, name="idempotency-journal", daemon=True
+            )
+            self._thread.start()
+
+    def get(self, memberid: str, trxid: str, fingerprint: Hashable) -> dict | None:
+        """Kembalikan hasil semula untuk request identik, atau None."""
+        key = (memberid.upper(), trxid)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, stored_fingerprint, result = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        if stored_fingerprint != self._digest(fingerprint):
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(
+        self, memberid: str, trxid: str, fingerprint: Hashable, result: dict
+    ) -> None:
+        """Simpan hasil transaksi yang berhasil; journal ditulis di background."""
+        key = (memberid.upper(), trxid)
+        expires_at = self.clock() + self.ttl
+        digest = self._digest(fingerprint)
+        self._store(key, expires_at, digest, result)
+        if self._path is not None:
+            self._append_journal(key, expires_at, digest, result)
+
+    def stats(self) -> dict[str, int]:
+        """Counter untuk sizing cache di bawah beban nyata."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def flush(self) -> None:
+        """Tulis baris journal yang tertunda (dan compaction) ke disk sekarang."""
+        if self._path is None:
+            return
+        with self._flush_lock:
+            with self._lock:
+                lines, self._pending = self._pending, []
+                snapshot, self._snapshot = self._snapshot, None
+            if snapshot is not None:
+                self._write_compacted(snapshot, lines)
+            elif lines:
+                self._journal.write("".join(lines))
+                self._journal.flush()
+
+    def close(self) -> None:
+        """Hentikan thread writer, tulis sisa journal, tutup file."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            self.flush()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(
+        self,
+        key: tuple[str, str],
+        expires_at: float,
+        digest: str,
+        result: dict,
+    ) -> None:
+        entries = self._entries
+        entries[key] = (expires_at, digest, result)
+        entries.move_to_end(key)
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def _digest(self, fingerprint: Hashable) -> str:
+        """Digest BLAKE2b ber-key dari field fingerprint (`repr` tuple)."""
+        return hashlib.blake2b(
+            repr(fingerprint).encode("utf-8"), key=self._key, digest_size=16
+        ).hexdigest()
+
+    def _load_key(self) -> bytes:
+        """Baca key digest di `<path>.key`, buat baru (0600) jika belum ada."""
+        key_path = self._path.with_name(self._path.name + ".key")
+        if key_path.exists():
+            return key_path.read_bytes()
+        key_path.parent.mkdir(parents=True, exist_ok=True)
+        key = os.urandom(32)
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(key)
+        return key
+
+    def _append_journal(
+        self,
+        key: tuple[str, str],
+        expires_at: float,
+        digest: str,
+        result: dict,
+    ) -> None:
+        line = _encode_line(key, expires_at, digest, result)
+        with self._lock:
+            self._journal_lines += 1
+            if self._journal_lines > 2 * self.max_size:
+                # snapshot sudah memuat entry ini; baris tertunda tidak perlu
+                self._snapshot = list(self._entries.items())
+                self._pending = []
+                self._journal_lines = len(self._snapshot)
+            else:
+                self._pending.append(line)
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except OSError:
+                logger.exception("Idempotency journal write failed")
+
+    def _load_journal(self) -> None:
+        if not self._path.exists():
+            return
+        now = self.clock()
+        with self._path.open(encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                    key = tuple(record["k"])
+                    expires_at = float(record["e"])
+                    digest = record["f"]
+                except (ValueError, KeyError, TypeError):
+                    # baris terpotong saat crash, lewati
+                    logger.warning("Skipping corrupt idempotency journal line")
+                    continue
+                if expires_at > now:
+                    self._store(key, expires_at, digest, record["r"])
+
+    def _write_compacted(self, entries: list, lines: list[str]) -> None:
+        """Tulis ulang journal dari snapshot entry hidup + baris sesudahnya."""
+        if self._journal is not None:
+            self._journal.close()
+        tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        now = self.clock()
+        with tmp.open("w", encoding="utf-8") as fh:
+            fh.writelines(
+                _encode_line(key, expires_at, digest, result)
+                for key, (expires_at, digest, result) in entries
+                if expires_at > now
+            )
+            fh.writelines(lines)
+        tmp.replace(self._path)
+        self._journal = self._path.open("a", encoding="utf-8")
+
+
+def _encode_line(key: tuple, expires_at: float, digest: str, result: dict) -> str:
+    return (
+        json.dumps(
+            {"k": key, "e": expires_at, "f": digest, "r": result},
+            separators=(",", ":"),
+        )
+        + "\n"
+    )
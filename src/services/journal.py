@@ -0,0 +1,289 @@
+"""Journal transaksi biner append-only dengan group commit dan index trxid.
+
+Format record (little-endian):
+
+    header  : magic u16 | payload_len u32 | crc32 u32 | timestamp_ns u64
+    payload : 4 field (trxid, memberid, sign, status), masing-masing
+              panjang u32 + bytes UTF-8
+
+Writer menampung record di buffer memori; thread commit menulis buffer ke
+file lalu `fsync` setiap `commit_interval_ms` (group commit), sehingga
+request tidak pernah menunggu disk. Setelah data durable, entry
+(memberid, trxid, offset) ditambahkan ke file index samping (`<path>.idx`)
+agar lookup tidak perlu scan penuh; trxid hanya unik per member sehingga
+index dikunci dengan (memberid, trxid). Index yang tertinggal (mis. crash)
+dilengkapi saat dibuka dengan scan mulai dari record terakhir yang sudah
+ter-index, bukan dari awal journal.
+
+Pembacaan (rekonsiliasi, lookup trxid) memakai `mmap`.
+
+Usage:
+    journal = TransactionJournal("data/trx.journal")
+    journal.append({"trxid": "T1", "memberid": "M1", "sign": "...", "status": "success"})
+    journal.lookup("M1", "T1")
+    for offset, record in journal.scan(): ...
+    journal.close()
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+MAGIC = 0x4A54  # "TJ"
+HEADER = struct.Struct("<HIIQ")
+FIELD_LEN = struct.Struct("<I")
+INDEX_MAGIC = b"TJI2"
+INDEX_ENTRY = struct.Struct("<IIQ")  # memberid_len, trxid_len, offset
+FIELDS = ("trxid", "memberid", "sign", "status")
+
+
+def encode_record(record: dict, timestamp_ns: int | None = None) -> bytes:
+    """Encode satu hasil transaksi menjadi bytes record journal."""
+    parts = []
+    for name in FIELDS:
+        value = str(record.get(name) or "").encode("utf-8")
+        parts.append(FIELD_LEN.pack(len(value)))
+        parts.append(value)
+    payload = b"".join(parts)
+    ts = time.time_ns() if timestamp_ns is None else timestamp_ns
+    return HEADER.pack(MAGIC, len(payload), zlib.crc32(payload), ts) + payload
+
+
+def decode_record(buffer: bytes | mmap.mmap, offset: int) -> tuple[dict, int] | None:
+    """Decode record di `offset`; kembalikan (record, offset berikutnya).
+
+    None jika record tidak lengkap atau rusak (ekor journal setelah crash).
+    """
+    end_header = offset + HEADER.size
+    if end_header > len(buffer):
+        return None
+    magic, length, crc, ts = HEADER.unpack_from(buffer, offset)
+    end = end_header + length
+    if magic != MAGIC or end > len(buffer):
+        return None
+    payload = bytes(buffer[end_header:end])
+    if zlib.crc32(payload) != crc:
+        return None
+    record: dict = {"timestamp_ns": ts}
+    pos = 0
+    for name in FIELDS:
+        (size,) = FIELD_LEN.unpack_from(payload, pos)
+        pos += FIELD_LEN.size
+        record[name] = payload[pos : pos + size].decode("utf-8")
+        pos += size
+    return record, end
+
+
+class TransactionJournal:
+    """Writer + reader journal transaksi.
+
+    Args:
+        path: file journal.
+        commit_interval_ms: interval group commit (fsync).
+    """
+
+    def __init__(self, path: str | Path, commit_interval_ms: float = 5.0) -> None:
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + ".idx")
+        self.commit_interval = commit_interval_ms / 1000.0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._index: dict[tuple[str, str], int] = {}
+        self._buffer = bytearray()
+        self._pending_index: list[tuple[str, str, int]] = []
+        self._lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+        self._stop = threading.Event()
+
+        self._recover()
+        self._file = self.path.open("ab")
+        self._index_file = self.index_path.open("ab")
+        self._end = self._file.tell()
+        self._thread = threading.Thread(
+            target=self._commit_loop, name="trx-journal-commit", daemon=True
+        )
+        self._thread.start()
+
+    def append(self, record: dict) -> int:
+        """Tambahkan record ke buffer; durable pada group commit berikutnya.
+
+        Returns:
+            offset record di file journal.
+        """
+        data = encode_record(record)
+        memberid = str(record.get("memberid") or "")
+        trxid = str(record.get("trxid") or "")
+        with self._lock:
+            offset = self._end
+            self._buffer += data
+            self._end += len(data)
+            self._pending_index.append((memberid, trxid, offset))
+        return offset
+
+    def flush(self) -> None:
+        """Paksa group commit sekarang (write + fsync + index)."""
+        with self._commit_lock:
+            with self._lock:
+                if not self._buffer:
+                    return
+                data, self._buffer = bytes(self._buffer), bytearray()
+                entries, self._pending_index = self._pending_index, []
+            self._file.write(data)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            # index hanya berisi record yang sudah durable
+            self._index_file.write(
+                b"".join(_encode_index_entry(m, t, o) for m, t, o in entries)
+            )
+            self._index_file.flush()
+            with self._lock:
+                for memberid, trxid, offset in entries:
+                    self._index[_index_key(memberid, trxid)] = offset
+
+    def lookup(self, memberid: str, trxid: str) -> dict | None:
+        """Cari record terakhir milik member untuk trxid lewat index + mmap."""
+        offset = self._index.get(_index_key(memberid, trxid))
+        if offset is None:
+            return None
+        with self.path.open("rb") as fh, _MappedFile(fh) as mapped:
+            decoded = decode_record(mapped, offset) if mapped is not None else None
+        return decoded[0] if decoded else None
+
+    def scan(self) -> Iterator[tuple[int, dict]]:
+        """Iterasi semua record durable (offset, record) untuk rekonsiliasi."""
+        with self.path.open("rb") as fh, _MappedFile(fh) as mapped:
+            if mapped is None:
+                return
+            offset = 0
+            while True:
+                decoded = decode_record(mapped, offset)
+                if decoded is None:
+                    return
+                record, next_offset = decoded
+                yield offset, record
+                offset = next_offset
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def close(self) -> None:
+        """Hentikan thread commit, flush sisa buffer, tutup file."""
+        self._stop.set()
+        self._thread.join()
+        self.flush()
+        self._file.close()
+        self._index_file.close()
+
+    def _commit_loop(self) -> None:
+        while not self._stop.wait(self.commit_interval):
+            self.flush()
+
+    def _recover(self) -> None:
+        """Load index, lengkapi dari ekor journal, buang ekor yang rusak."""
+        last_offset = self._load_index()
+        if not self.path.exists():
+            return
+        missing, valid_end = self._scan_tail(last_offset)
+        if valid_end < self.path.stat().st_size:
+            # potong record setengah jadi agar append berikutnya tetap valid
+            os.truncate(self.path, valid_end)
+        if missing:
+            with self.index_path.open("ab") as fh:
+                fh.write(b"".join(_encode_index_entry(*entry) for entry in missing))
+            for memberid, trxid, offset in missing:
+                self._index[_index_key(memberid, trxid)] = offset
+
+    def _load_index(self) -> int:
+        """Baca file index; kembalikan offset record terakhir yang ter-index.
+
+        File index yang belum ada (atau header-nya belum selesai ditulis)
+        dibuat ulang kosong sehingga seluruh journal di-index ulang.
+
+        Raises:
+            ValueError: file index bukan index journal.
+        """
+        data = self.index_path.read_bytes() if self.index_path.exists() else b""
+        if len(data) < len(INDEX_MAGIC):
+            self.index_path.write_bytes(INDEX_MAGIC)
+            return -1
+        if not data.startswith(INDEX_MAGIC):
+            raise ValueError(f"{self.index_path} bukan file index journal")
+        last_offset = -1
+        pos = len(INDEX_MAGIC)
+        while pos + INDEX_ENTRY.size <= len(data):
+            member_size, trxid_size, offset = INDEX_ENTRY.unpack_from(data, pos)
+            start = pos + INDEX_ENTRY.size
+            end = start + member_size + trxid_size
+            if end > len(data):
+                break
+            memberid = data[start : start + member_size].decode("utf-8")
+            trxid = data[start + member_size : end].decode("utf-8")
+            self._index[_index_key(memberid, trxid)] = offset
+            last_offset = max(last_offset, offset)
+            pos = end
+        return last_offset
+
+    def _scan_tail(self, last_offset: int) -> tuple[list[tuple[str, str, int]], int]:
+        """Scan record setelah `last_offset`; kembalikan (entry baru, akhir valid).
+
+        Scan dimulai dari record terakhir yang sudah ter-index sehingga biaya
+        buka journal sebanding dengan ekor yang belum ter-index, bukan ukuran
+        journal. Jika record di `last_offset` tidak valid, scan mulai dari 0.
+        """
+        missing: list[tuple[str, str, int]] = []
+        valid_end = 0
+        with self.path.open("rb") as fh, _MappedFile(fh) as mapped:
+            if mapped is None:
+                return missing, valid_end
+            offset = 0
+            if last_offset >= 0:
+                decoded = decode_record(mapped, last_offset)
+                if decoded is not None:
+                    offset = valid_end = decoded[1]
+            while True:
+                decoded = decode_record(mapped, offset)
+                if decoded is None:
+                    break
+                record, next_offset = decoded
+                if offset > last_offset:
+                    missing.append((record["memberid"], record["trxid"], offset))
+                offset = valid_end = next_offset
+        return missing, valid_end
+
+
+def _index_key(memberid: str, trxid: str) -> tuple[str, str]:
+    return memberid.strip().upper(), trxid
+
+
+def _encode_index_entry(memberid: str, trxid: str, offset: int) -> bytes:
+    raw_member = memberid.encode("utf-8")
+    raw_trxid = trxid.encode("utf-8")
+    return (
+        INDEX_ENTRY.pack(len(raw_member), len(raw_trxid), offset)
+        + raw_member
+        + raw_trxid
+    )
+
+
+class _MappedFile:
+    """Context manager mmap read-only yang aman untuk file kosong."""
+
+    def __init__(self, fh: BinaryIO) -> None:
+        self._fh = fh
+        self._mapped: mmap.mmap | None = None
+
+    def __enter__(self) -> mmap.mmap | None:
+        if os.fstat(self._fh.fileno()).st_size == 0:
+            return None
+        self._mapped = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mapped
+
+    def __exit__(self, *exc: object) -> None:
+        if self._mapped is not None:
+            self._mapped.close()
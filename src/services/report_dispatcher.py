@@ -0,0 +1,385 @@
+"""Dispatcher callback laporan transaksi ke `report_url` member.
+
+`/trx` hanya memanggil `submit()` yang bersifat non-blocking (menaruh laporan
+di antrian memori); pengiriman HTTP berjalan di task background pada event
+loop yang sama sehingga tidak pernah menambah latency response.
+
+Karakteristik:
+    - satu `httpx.AsyncClient` bersama (pool koneksi + keep-alive), dengan
+      batas koneksi paralel per host lewat semaphore
+    - batching + coalescing: laporan pending dikelompokkan per URL dan
+      laporan untuk trxid yang sama hanya dikirim versi terakhirnya
+    - retry dengan exponential backoff + full jitter hingga `max_attempts`
+    - antrian pending dibatasi per URL dan total; laporan baru di atas batas
+      dibuang (counter `dropped`) agar member yang lambat tidak menghabiskan
+      memori
+    - antrian retry bounded; seluruh antrian (pending, batch yang sedang
+      dikirim, retry) di-checkpoint ke file JSON lines setiap
+      `persist_interval` detik bila berubah dan sekali lagi saat shutdown,
+      lalu dimuat ulang saat start berikutnya; crash paling banyak
+      kehilangan laporan satu interval terakhir
+
+Body callback adalah JSON array berisi laporan (dict hasil transaksi).
+
+Usage:
+    dispatcher = ReportDispatcher(retry_path="data/report_retry.jsonl")
+    await dispatcher.start()
+    dispatcher.submit(member.report_url, result)
+    await dispatcher.aclose()
+"""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import json
+import os
+import random
+import time
+from collections.abc import Callable
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+# status yang layak di-retry; 4xx lain dianggap ditolak permanen oleh member
+_RETRY_STATUS = frozenset({408, 425, 429})
+
+
+class ReportDispatcher:
+    """Kirim laporan transaksi ke URL member di background.
+
+    Args:
+        max_connections: total koneksi pool HTTP.
+        max_connections_per_host: koneksi paralel maksimum per host.
+        batch_size: jumlah laporan maksimum per request callback.
+        timeout: timeout request callback (detik).
+        max_attempts: jumlah percobaan sebelum laporan dibuang.
+        base_delay: delay backoff awal (detik).
+        max_delay: batas atas delay backoff (detik).
+        max_retry: kapasitas antrian retry.
+        max_pending_per_url: laporan pending maksimum per URL.
+        max_pending: laporan pending maksimum untuk semua URL.
+        retry_path: file persistensi antrian; None berarti in-memory.
+        persist_interval: interval checkpoint antrian ke `retry_path` (detik).
+        client: `httpx.AsyncClient` yang sudah ada (mis. untuk test).
+        clock: sumber waktu monotonic.
+        rng: sumber jitter [0, 1).
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_connections_per_host: int = 4,
+        batch_size: int = 50,
+        timeout: float = 5.0,
+        max_attempts: int = 8,
+        base_delay: float = 0.5,
+        max_delay: float = 60.0,
+        max_retry: int = 10_000,
+        max_pending_per_url: int = 1_000,
+        max_pending: int = 10_000,
+        retry_path: str | Path | None = None,
+        persist_interval: float = 1.0,
+        client: httpx.AsyncClient | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry = max_retry
+        self.max_pending_per_url = max_pending_per_url
+        self.max_pending = max_pending
+        self.retry_path = Path(retry_path) if retry_path else None
+        self.persist_interval = persist_interval
+        self.clock = clock
+        self.rng = rng
+
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+        self.dropped = 0
+
+        self._client = client
+        self._owns_client = client is None
+        # url -> trxid -> (report, attempt); dict menjaga urutan kedatangan
+        self._pending: dict[str, dict[str, tuple[dict, int]]] = {}
+        self._pending_count = 0
+        # url -> batch yang sedang di-POST; disimpan bila drainer dibatalkan
+        self._inflight: dict[str, list[tuple[dict, int]]] = {}
+        self._drainers: dict[str, asyncio.Task] = {}
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+        # heap (due, seq, url, report, attempt)
+        self._retry: list[tuple[float, int, str, dict, int]] = []
+        self._seq = itertools.count()
+        self._retry_wakeup: asyncio.Event | None = None
+        self._retry_task: asyncio.Task | None = None
+        self._checkpoint_task: asyncio.Task | None = None
+        self._closing: asyncio.Event | None = None
+        # antrian berubah sejak checkpoint terakhir
+        self._dirty = False
+        self._started = False
+
+    async def start(self) -> None:
+        """Buat HTTP client, muat antrian retry tersimpan, mulai task retry."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=30.0,
+                ),
+            )
+        self._retry_wakeup = asyncio.Event()
+        self._retry_task = asyncio.create_task(self._retry_loop())
+        self._started = True
+        self._load()
+        for url in list(self._pending):
+            self._ensure_drainer(url)
+        if self.retry_path is not None:
+            self._closing = asyncio.Event()
+            self._checkpoint_task = asyncio.create_task(self._checkpoint_loop())
+
+    def submit(self, url: str, report: dict) -> None:
+        """Antrikan laporan untuk dikirim; tidak pernah menunggu jaringan.
+
+        Harus dipanggil dari thread event loop (mis. endpoint `async def`).
+        """
+        if not url:
+            return
+        self._enqueue(url, report, 0)
+
+    def stats(self) -> dict[str, int]:
+        """Ringkasan counter dispatcher."""
+        return {
+            "pending": self._pending_count,
+            "retry_queue": len(self._retry),
+            "sent": self.sent,
+            "retried": self.retried,
+            "failed": self.failed,
+            "dropped": self.dropped,
+        }
+
+    async def drain(self) -> None:
+        """Tunggu sampai semua laporan pending selesai dikirim (bukan retry)."""
+        while self._drainers:
+            await asyncio.gather(*list(self._drainers.values()))
+
+    async def aclose(self, timeout: float = 5.0) -> None:
+        """Flush pending sebatas `timeout`, simpan sisa antrian, tutup client."""
+        if self._retry_task is not None:
+            self._retry_task.cancel()
+            await asyncio.gather(self._retry_task, return_exceptions=True)
+        try:
+            await asyncio.wait_for(self.drain(), timeout)
+        except TimeoutError:
+            for task in self._drainers.values():
+                task.cancel()
+            await asyncio.gather(*self._drainers.values(), return_exceptions=True)
+        self._started = False
+        if self._checkpoint_task is not None:
+            # tunggu checkpoint yang sedang menulis, jangan dibatalkan di tengah
+            self._closing.set()
+            await self._checkpoint_task
+            self._checkpoint_task = None
+        self._save()
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _enqueue(self, url: str, report: dict, attempt: int) -> None:
+        trxid = str(report.get("trxid", ""))
+        pending = self._pending.get(url)
+        if pending is None:
+            pending = self._pending[url] = {}
+        elif trxid in pending:
+            if not attempt:
+                # coalescing: versi terbaru menggantikan laporan lama
+                pending[trxid] = (report, attempt)
+            # retry diabaikan, sudah ada laporan yang lebih baru untuk trxid ini
+            return
+        if len(pending) >= self.max_pending_per_url or (
+            self._pending_count >= self.max_pending
+        ):
+            self.dropped += 1
+            logger.warning("report callback {} antrian penuh, laporan dibuang", url)
+            if not pending:
+                del self._pending[url]
+            return
+        pending[trxid] = (report, attempt)
+        self._pending_count += 1
+        self._dirty = True
+        if self._started:
+            self._ensure_drainer(url)
+
+    def _ensure_drainer(self, url: str) -> None:
+        if url not in self._drainers:
+            self._drainers[url] = asyncio.create_task(self._drain_url(url))
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        sem = self._hosts.get(host)
+        if sem is None:
+            sem = self._hosts[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return sem
+
+    async def _drain_url(self, url: str) -> None:
+        sem = self._host_limit(url)
+        try:
+            while pending := self._pending.get(url):
+                batch = [
+                    pending.pop(trxid)
+                    for trxid in itertools.islice(list(pending), self.batch_size)
+                ]
+                self._pending_count -= len(batch)
+                if not pending:
+                    del self._pending[url]
+                self._inflight[url] = batch
+                async with sem:
+                    outcome = await self._post(url, [report for report, _ in batch])
+                del self._inflight[url]
+                self._dirty = True
+                if outcome == "ok":
+                    self.sent += len(batch)
+                elif outcome == "retry":
+                    for report, attempt in batch:
+                        self._schedule_retry(url, report, attempt + 1)
+                else:
+                    self.failed += len(batch)
+        finally:
+            self._drainers.pop(url, None)
+
+    async def _post(self, url: str, reports: list[dict]) -> str:
+        try:
+            response = await self._client.post(url, json=reports)
+        except httpx.HTTPError as exc:
+            logger.warning("report callback {} gagal: {!r}", url, exc)
+            return "retry"
+        except Exception:
+            # error tak terduga (mis. URL tidak valid) tidak boleh menghentikan
+            # drainer; batch diperlakukan sebagai gagal sementara
+            logger.exception("report callback {} error tak terduga", url)
+            return "retry"
+        status = response.status_code
+        if status < 300:
+            return "ok"
+        if status >= 500 or status in _RETRY_STATUS:
+            logger.warning("report callback {} status {}", url, status)
+            return "retry"
+        logger.warning("report callback {} ditolak status {}", url, status)
+        return "drop"
+
+    def _schedule_retry(self, url: str, report: dict, attempt: int) -> None:
+        if attempt >= self.max_attempts:
+            self.failed += 1
+            return
+        if len(self._retry) >= self.max_retry:
+            self.dropped += 1
+            return
+        delay = self.rng() * min(self.max_delay, self.base_delay * 2**attempt)
+        heapq.heappush(
+            self._retry, (self.clock() + delay, next(self._seq), url, report, attempt)
+        )
+        self.retried += 1
+        if self._retry_wakeup is not None:
+            self._retry_wakeup.set()
+
+    async def _retry_loop(self) -> None:
+        wakeup = self._retry_wakeup
+        while True:
+            if not self._retry:
+                await wakeup.wait()
+                wakeup.clear()
+                continue
+            delay = self._retry[0][0] - self.clock()
+            if delay > 0:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(wakeup.wait(), delay)
+                wakeup.clear()
+                continue
+            _, _, url, report, attempt = heapq.heappop(self._retry)
+            self._enqueue(url, report, attempt)
+
+    async def _checkpoint_loop(self) -> None:
+        closing = self._closing
+        while not closing.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(closing.wait(), self.persist_interval)
+            if self._dirty and not closing.is_set():
+                self._dirty = False
+                try:
+                    await asyncio.to_thread(self._write, self._entries())
+                except OSError:
+                    self._dirty = True
+                    logger.exception("report dispatcher: checkpoint antrian gagal")
+
+    def _load(self) -> None:
+        if self.retry_path is None or not self.retry_path.exists():
+            return
+        loaded = 0
+        with self.retry_path.open(encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    url, report, attempt = json.loads(line)
+                except (ValueError, TypeError):
+                    continue
+                if loaded >= self.max_retry:
+                    self.dropped += 1
+                    continue
+                self._enqueue(url, report, attempt)
+                loaded += 1
+        # file tetap ada sampai checkpoint berikutnya menggantinya
+        if loaded:
+            logger.info("report dispatcher: {} laporan dimuat dari retry queue", loaded)
+
+    def _entries(self) -> list[tuple[str, dict, int]]:
+        """Semua laporan yang belum terkirim: pending, in-flight, dan retry."""
+        entries = [
+            (url, report, attempt)
+            for url, pending in self._pending.items()
+            for report, attempt in pending.values()
+        ]
+        entries += [
+            (url, report, attempt)
+            for url, batch in self._inflight.items()
+            for report, attempt in batch
+        ]
+        entries += [
+            (url, report, attempt) for _, _, url, report, attempt in self._retry
+        ]
+        return entries
+
+    def _save(self) -> None:
+        entries = self._entries()
+        self._pending.clear()
+        self._pending_count = 0
+        self._inflight.clear()
+        self._retry.clear()
+        if self.retry_path is None:
+            self.dropped += len(entries)
+            return
+        self._write(entries)
+        self.dropped += max(len(entries) - self.max_retry, 0)
+
+    def _write(self, entries: list[tuple[str, dict, int]]) -> None:
+        """Ganti file antrian secara atomik; file dihapus jika antrian kosong."""
+        if not entries:
+            self.retry_path.unlink(missing_ok=True)
+            return
+        self.retry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.retry_path.with_suffix(self.retry_path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            for entry in entries[: self.max_retry]:
+                fh.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+        tmp.replace(self.retry_path)
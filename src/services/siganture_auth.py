@@ -3,6 +3,13 @@
 import base64
 import hashlib
 import hmac
+from collections.abc import Iterable, Sequence
+
+# panjang signature tanpa padding: sha1 (20 byte) -> base64 28 char, 1 char '='
+_SIGNATURE_LENGTH = 27
+
+SignatureRow = Sequence[str]
+"""satu baris batch: (memberid, product, dest, refid, pin, password)."""
 
 
 class OtomaxSignatureService:
@@ -36,11 +43,8 @@ class OtomaxSignatureService:
         # Generate SHA1 digest
         sha1_digest = hashlib.sha1(raw.encode()).digest()
 
-        # Base64 encode dan URL-safe
-        signature = base64.b64encode(sha1_digest).decode().rstrip("=")
-        signature = signature.replace("+", "-").replace("/", "_")
-
-        return signature
+        # urlsafe_b64encode sudah memetakan '+' -> '-' dan '/' -> '_' sekaligus
+        return base64.urlsafe_b64encode(sha1_digest)[:_SIGNATURE_LENGTH].decode()
 
     @staticmethod
     def verify_signature(expected_data: dict, received_signature: str) -> bool:
@@ -48,4 +52,81 @@ class OtomaxSignatureService:
         expected_signature = OtomaxSignatureService.generate_transaction_signature(
             **expected_data
         )
-        return hmac.compare_digest(str(received_signature), str(expected_signature))
+        return hmac.compare_digest(
+            str(received_signature).encode(), str(expected_signature).encode()
+        )
+
+    @staticmethod
+    def generate_many(rows: Iterable[SignatureRow]) -> list[str]:
+        """Generate signature untuk banyak transaksi sekaligus.
+
+        Hasil identik dengan `generate_transaction_signature` per baris. State
+        SHA1 untuk prefix konstan `OtomaX|MEMBERID|` dibangun sekali per member
+        lalu di-`copy()` untuk setiap baris milik member tersebut.
+
+        Args:
+            rows: iterable berisi tuple (memberid, product, dest, refid, pin, password).
+
+        Returns:
+            list signature dengan urutan yang sama dengan `rows`.
+        """
+        prefixes: dict = {}
+        encode = base64.urlsafe_b64encode
+        signatures: list[str] = []
+        append = signatures.append
+
+        for memberid, product, dest, refid, pin, password in rows:
+            memberid = str(memberid).strip()
+            prefix = prefixes.get(memberid)
+            if prefix is None:
+                prefix = hashlib.sha1(f"OtomaX|{memberid.upper()}|".encode())
+                prefixes[memberid] = prefix
+
+            digest = prefix.copy()
+            digest.update(
+                f"{str(product).strip().upper()}|{str(dest).strip()}|"
+                f"{str(refid).strip()}|{str(pin).strip()}|{str(password).strip()}".encode()
+            )
+            append(encode(digest.digest())[:_SIGNATURE_LENGTH].decode())
+
+        return signatures
+
+    @staticmethod
+    def generate_columns(
+        memberid: Sequence[str],
+        product: Sequence[str],
+        dest: Sequence[str],
+        refid: Sequence[str],
+        pin: Sequence[str],
+        password: Sequence[str],
+    ) -> list[str]:
+        """Versi kolumnar dari `generate_many`.
+
+        Raises:
+            ValueError: jika panjang kolom tidak sama.
+        """
+        return OtomaxSignatureService.generate_many(
+            zip(memberid, product, dest, refid, pin, password, strict=True)
+        )
+
+    @staticmethod
+    def verify_many(
+        rows: Iterable[SignatureRow], received_signatures: Iterable[str]
+    ) -> list[bool]:
+        """Verifikasi banyak signature sekaligus secara timing-attack safe.
+
+        Args:
+            rows: iterable tuple (memberid, product, dest, refid, pin, password).
+            received_signatures: signature yang diterima, urut sesuai `rows`.
+
+        Returns:
+            list bool, True untuk signature yang cocok.
+
+        Raises:
+            ValueError: jika jumlah signature tidak sama dengan jumlah baris.
+        """
+        expected = OtomaxSignatureService.generate_many(rows)
+        return [
+            hmac.compare_digest(str(received).encode(), sign.encode())
+            for sign, received in zip(expected, received_signatures, strict=True)
+        ]
@@ -0,0 +1,30 @@
+"""Validasi signature transaksi terhadap pin dan password member."""
+
+import hmac
+from typing import Any
+
+from src.services.errors import AuthError
+
+
+class SignatureAuth:
+    """Validate signature against stored pin and password."""
+
+    def __init__(self, signature_service: Any):
+        self.signature = signature_service
+
+    def validate(
+        self,
+        memberid: str,
+        product: str,
+        dest: str,
+        refid: str,
+        sign: str,
+        pin: str,
+        password: str,
+    ) -> None:
+        """Raise AuthError("signature tidak valid", 401) on mismatch."""
+        expected_sign = self.signature.generate_transaction_signature(
+            memberid, product, dest, refid, pin, password
+        )
+        if not hmac.compare_digest(str(sign).encode(), expected_sign.encode()):
+            raise AuthError("signature tidak valid", 401)
@@ -0,0 +1,486 @@
+"""Store SQLite (mode WAL) untuk member dan transaksi, dengan cache LRU.
+
+Satu file database berisi dua tabel:
+
+    members      : kolom sesuai field `Member` (bisa juga dibaca
+                   `MemberRegistry.from_sqlite`), `ip_address` berisi
+                   allowlist yang sudah dinormalisasi
+    transactions : hasil transaksi sukses (trxid, memberid, sign, status)
+
+Semua penulisan lewat satu thread writer dengan koneksi sendiri: operasi
+diantrikan, lalu writer mengambil sampai `batch_size` operasi dan menjalankan
+`executemany` per jenis statement dalam satu transaksi. Dengan hanya satu
+writer tidak ada kontensi lock tulis SQLite, dan request tidak menunggu disk.
+Jika batch gagal, operasinya diulang satu per satu (SAVEPOINT per operasi)
+sehingga hanya operasi yang error yang dibuang.
+
+Pembacaan memakai koneksi read-only per thread; di mode WAL pembaca tidak
+pernah diblok writer dan pemanggil tidak pernah menunggu koneksi pool. Lookup
+member dilayani cache LRU read-through; `aget`/`aget_many` menjalankan query
+cache miss di thread executor agar event loop tidak terblok, sehingga endpoint
+async mengisi cache lewat `aget` sebelum service memanggil `get`. Member yang
+tidak ada disimpan di cache negatif kecil yang terpisah agar tidak mendesak
+member aktif keluar dari LRU. Update member meng-invalidate kedua cache saat
+diantrikan dan lagi setelah commit.
+
+Semua SQL berupa konstanta modul sehingga statement-nya disiapkan sekali per
+koneksi oleh cache statement `sqlite3`.
+
+`SqliteStore` bisa dipasang langsung di `AuthenticationService` sebagai
+`registry` (atribut `current`, `get`, `enable_ip_check`) dan `journal`
+(`append`).
+
+Usage:
+    store = SqliteStore("data/otomax.db")
+    store.upsert_member(record)
+    store.get("M1")
+    await store.aget("M1")
+    store.append({"trxid": "T1", "memberid": "M1", "sign": "...", "status": "success"})
+    store.flush()
+    store.lookup("M1", "T1")
+    store.close()
+"""
+
+import asyncio
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from loguru import logger
+
+from src.domain.member.registry import MemberRecord, MemberRegistry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS members (
+    memberid TEXT PRIMARY KEY,
+    pin TEXT NOT NULL,
+    password TEXT NOT NULL,
+    ip_address TEXT NOT NULL,
+    report_url TEXT NOT NULL,
+    allow_nosign INTEGER NOT NULL DEFAULT 0,
+    balance INTEGER NOT NULL DEFAULT 0,
+    is_active INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    trxid TEXT NOT NULL,
+    memberid TEXT NOT NULL,
+    sign TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_member_trxid
+    ON transactions (memberid, trxid);
+"""
+
+_SELECT_MEMBER = (
+    "SELECT memberid, pin, password, ip_address, report_url, allow_nosign, balance"
+    " FROM members WHERE memberid = ? AND is_active"
+)
+_UPSERT_MEMBER = (
+    "INSERT INTO members"
+    " (memberid, pin, password, ip_address, report_url, allow_nosign, balance)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT (memberid) DO UPDATE SET"
+    " pin = excluded.pin, password = excluded.password,"
+    " ip_address = excluded.ip_address, report_url = excluded.report_url,"
+    " allow_nosign = excluded.allow_nosign, balance = excluded.balance,"
+    " is_active = 1"
+)
+_DEACTIVATE_MEMBER = "UPDATE members SET is_active = 0 WHERE memberid = ?"
+_INSERT_TRX = (
+    "INSERT INTO transactions (trxid, memberid, sign, status, created_ns)"
+    " VALUES (?, ?, ?, ?, ?)"
+)
+_SELECT_TRX = (
+    "SELECT trxid, memberid, sign, status FROM transactions"
+    " WHERE memberid = ? AND trxid = ? ORDER BY id DESC LIMIT 1"
+)
+_COUNT_MEMBERS = "SELECT COUNT(*) FROM members WHERE is_active"
+_ACTIVE_MEMBERIDS = "SELECT memberid FROM members WHERE is_active"
+
+# penanda berhenti di antrian writer; `threading.Event` dipakai untuk flush
+_STOP = None
+
+
+class SqliteStore:
+    """Store member + transaksi dengan satu writer, pool pembaca, dan cache LRU.
+
+    Args:
+        path: file database SQLite.
+        read_pool_size: jumlah thread executor pembaca (satu koneksi per thread).
+        cache_size: jumlah member maksimum di cache LRU.
+        negative_cache_size: jumlah memberid tidak dikenal yang di-cache.
+        batch_size: operasi tulis maksimum per transaksi SQLite.
+        synchronous: `PRAGMA synchronous` koneksi writer (NORMAL aman di WAL).
+        enable_ip_check: toggle validasi IP, dibaca `ClientAuth`.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        read_pool_size: int = 4,
+        cache_size: int = 10_000,
+        negative_cache_size: int = 1_024,
+        batch_size: int = 512,
+        synchronous: str = "NORMAL",
+        enable_ip_check: bool = True,
+    ) -> None:
+        if read_pool_size <= 0:
+            raise ValueError("read_pool_size must be positive")
+        if synchronous.upper() not in {"OFF", "NORMAL", "FULL", "EXTRA"}:
+            raise ValueError(f"invalid synchronous mode: {synchronous!r}")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_size = cache_size
+        self.negative_cache_size = negative_cache_size
+        self.batch_size = batch_size
+        self.enable_ip_check = enable_ip_check
+        self.current = self
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.commits = 0
+        self.failed = 0
+
+        self._writer = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute(f"PRAGMA synchronous={synchronous.upper()}")
+        self._writer.executescript(_SCHEMA)
+
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._executor = ThreadPoolExecutor(
+            read_pool_size, thread_name_prefix="sqlite-store-read"
+        )
+
+        self._cache: OrderedDict[str, MemberRecord] = OrderedDict()
+        self._negative: OrderedDict[str, None] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # jumlah query cache miss yang sedang berjalan per memberid; member yang
+        # di-invalidate selama query berjalan ditandai stale agar hasil query
+        # lama tidak masuk cache
+        self._loading: dict[str, int] = {}
+        self._stale: set[str] = set()
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._write_loop, name="sqlite-store-writer", daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def from_registry(
+        cls, registry: MemberRegistry, path: str | Path, **kwargs
+    ) -> "SqliteStore":
+        """Buka store dan seed member dari registry jika tabel masih kosong.
+
+        Args:
+            registry: sumber member awal (credential `.env` / MEMBER_SOURCE).
+            path: file database SQLite.
+            **kwargs: diteruskan ke `SqliteStore`.
+        """
+        store = cls(path, enable_ip_check=registry.enable_ip_check, **kwargs)
+        if len(store) == 0:
+            store.upsert_members(registry)
+            store.flush()
+        return store
+
+    def get(self, memberid: str) -> MemberRecord | None:
+        """Cari member aktif (case-insensitive), lewat cache lalu database.
+
+        Cache miss menjalankan query di thread pemanggil; dari event loop
+        panggil `aget` lebih dulu agar `get` selalu kena cache.
+        """
+        key = str(memberid).strip().upper()
+        found, record = self._cached(key)
+        if found:
+            return record
+        return self._load(key)
+
+    async def aget(self, memberid: str) -> MemberRecord | None:
+        """Versi async `get`: cache miss di-query di thread executor."""
+        key = str(memberid).strip().upper()
+        found, record = self._cached(key)
+        if found:
+            return record
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._load, key)
+
+    async def aget_many(self, memberids: Iterable[str]) -> None:
+        """Isi cache untuk banyak member sekaligus (mis. sebelum batch)."""
+        keys = {str(memberid).strip().upper() for memberid in memberids}
+        await asyncio.gather(*(self.aget(key) for key in keys))
+
+    def upsert_member(self, record: MemberRecord) -> None:
+        """Antrikan insert/update member; entry cache-nya langsung dibuang."""
+        params = (
+            record.memberid,
+            record.pin,
+            record.password,
+            record.allowed_ip,
+            record.report_url,
+            int(record.allow_nosign),
+            record.balance,
+        )
+        self._submit(_UPSERT_MEMBER, params, record.memberid)
+
+    def upsert_members(self, records: Iterable[MemberRecord]) -> None:
+        """Antrikan banyak member sekaligus (mis. seed dari registry)."""
+        for record in records:
+            self.upsert_member(record)
+
+    def deactivate_member(self, memberid: str) -> None:
+        """Antrikan penonaktifan member; `get` mengembalikan None setelahnya."""
+        key = str(memberid).strip().upper()
+        self._submit(_DEACTIVATE_MEMBER, (key,), key)
+
+    def sync_members(
+        self, records: Iterable[MemberRecord], previous: Iterable[MemberRecord] = ()
+    ) -> None:
+        """Terapkan snapshot registry (hot reload) ke tabel member.
+
+        Member yang baru atau berubah dibanding `previous` di-upsert; member
+        yang ada di `previous` tetapi hilang dari snapshot dinonaktifkan.
+        Member yang hanya ada di database tidak disentuh.
+        """
+        old = {record.memberid: record for record in previous}
+        seen = set()
+        for record in records:
+            seen.add(record.memberid)
+            if old.get(record.memberid) != record:
+                self.upsert_member(record)
+        for memberid in old.keys() - seen:
+            self.deactivate_member(memberid)
+
+    def __len__(self) -> int:
+        """Jumlah member aktif di database (query, bukan ukuran cache)."""
+        return self._reader().execute(_COUNT_MEMBERS).fetchone()[0]
+
+    def append(self, record: dict) -> None:
+        """Antrikan hasil transaksi; durable pada commit writer berikutnya."""
+        params = (
+            str(record.get("trxid") or ""),
+            str(record.get("memberid") or "").strip().upper(),
+            str(record.get("sign") or ""),
+            str(record.get("status") or ""),
+            time.time_ns(),
+        )
+        self._submit(_INSERT_TRX, params)
+
+    def lookup(self, memberid: str, trxid: str) -> dict | None:
+        """Cari transaksi terakhir milik member untuk trxid yang sudah di-commit."""
+        key = str(memberid).strip().upper()
+        row = self._reader().execute(_SELECT_TRX, (key, trxid)).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("trxid", "memberid", "sign", "status"), row, strict=True))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Tunggu sampai semua operasi yang sudah diantrikan di-commit."""
+        if self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def stats(self) -> dict[str, int]:
+        """Counter cache dan writer."""
+        return {
+            "cached": len(self._cache),
+            "negative": len(self._negative),
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "commits": self.commits,
+            "failed": self.failed,
+        }
+
+    def close(self) -> None:
+        """Commit sisa antrian, hentikan writer, tutup semua koneksi."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+        with self._cache_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._writer.close()
+
+    def _submit(self, sql: str, params: tuple, memberid: str | None = None) -> None:
+        if self._closed:
+            raise RuntimeError("store is closed")
+        if memberid is not None:
+            self._invalidate(memberid)
+        self._queue.put((sql, params, memberid))
+
+    def _invalidate(self, memberid: str) -> None:
+        with self._cache_lock:
+            self._cache.pop(memberid, None)
+            self._negative.pop(memberid, None)
+            if memberid in self._loading:
+                self._stale.add(memberid)
+
+    def _cached(self, key: str) -> tuple[bool, MemberRecord | None]:
+        """Cek cache; saat miss, tandai query untuk key sedang berjalan."""
+        with self._cache_lock:
+            record = self._cache.get(key)
+            if record is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return True, record
+            if key in self._negative:
+                self._negative.move_to_end(key)
+                self.hits += 1
+                return True, None
+            self.misses += 1
+            self._loading[key] = self._loading.get(key, 0) + 1
+        return False, None
+
+    def _reader(self) -> sqlite3.Connection:
+        """Koneksi read-only milik thread pemanggil (dibuat saat pertama dipakai)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA query_only=ON")
+            self._local.conn = conn
+            with self._cache_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _load(self, key: str) -> MemberRecord | None:
+        record = None
+        try:
+            row = self._reader().execute(_SELECT_MEMBER, (key,)).fetchone()
+            if row is not None:
+                memberid, pin, password, allowed_ip, report_url, nosign, balance = row
+                record = MemberRecord(
+                    memberid=memberid,
+                    pin=pin,
+                    password=password,
+                    allowed_ip=allowed_ip,
+                    report_url=report_url,
+                    allow_nosign=bool(nosign),
+                    balance=balance,
+                )
+        except BaseException:
+            self._finish_load(key, None, cache=False)
+            raise
+        self._finish_load(key, record)
+        return record
+
+    def _finish_load(
+        self, key: str, record: MemberRecord | None, cache: bool = True
+    ) -> None:
+        """Tutup satu query miss dan simpan hasilnya jika tidak stale."""
+        with self._cache_lock:
+            remaining = self._loading[key] - 1
+            stale = key in self._stale
+            if remaining:
+                self._loading[key] = remaining
+            else:
+                del self._loading[key]
+                self._stale.discard(key)
+            if not cache or stale:
+                return
+            if record is None:
+                # cache negatif terpisah: memberid acak tidak mengusir member aktif
+                self._negative[key] = None
+                if len(self._negative) > self.negative_cache_size:
+                    self._negative.popitem(last=False)
+            else:
+                self._cache[key] = record
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+    def _write_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            ops: list[tuple[str, tuple, str | None]] = []
+            waiters: list[threading.Event] = []
+            for item in batch:
+                if item is _STOP:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    ops.append(item)
+            if ops:
+                try:
+                    self._commit(ops)
+                except sqlite3.Error:
+                    logger.warning(
+                        "SQLite store batch of {} writes failed, retrying one by one",
+                        len(ops),
+                    )
+                    self._commit_each(ops)
+            for done in waiters:
+                done.set()
+
+    def _commit(self, ops: list[tuple[str, tuple, str | None]]) -> None:
+        conn = self._writer
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # executemany per run statement yang sama, urutan operasi dijaga
+            start = 0
+            for end in range(1, len(ops) + 1):
+                if end == len(ops) or ops[end][0] != ops[start][0]:
+                    conn.executemany(ops[start][0], [op[1] for op in ops[start:end]])
+                    start = end
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        self._committed(ops)
+
+    def _commit_each(self, ops: list[tuple[str, tuple, str | None]]) -> None:
+        """Ulang batch yang gagal dengan SAVEPOINT per operasi."""
+        conn = self._writer
+        done: list[tuple[str, tuple, str | None]] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for op in ops:
+                conn.execute("SAVEPOINT op")
+                try:
+                    conn.execute(op[0], op[1])
+                except sqlite3.Error:
+                    conn.execute("ROLLBACK TO op")
+                    logger.exception("SQLite store write dropped: {}", op[0])
+                else:
+                    done.append(op)
+                conn.execute("RELEASE op")
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            self.failed += len(ops)
+            logger.exception("SQLite store batch of {} writes failed", len(ops))
+            return
+        self.failed += len(ops) - len(done)
+        self._committed(done)
+
+    def _committed(self, ops: list[tuple[str, tuple, str | None]]) -> None:
+        self.writes += len(ops)
+        self.commits += 1
+        for _, _, memberid in ops:
+            if memberid is not None:
+                self._invalidate(memberid)
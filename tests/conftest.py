@@ -0,0 +1,16 @@
+import pytest
+
+
+class FakeClock:
+    """Sumber waktu monotonic yang dimajukan manual lewat `now`."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
@@ -0,0 +1,195 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.api import api_trx
+from src.api.api_trx import router
+from src.core.exceptions import register_exception_handlers
+from src.domain.member.registry import MemberRecord, MemberRegistry
+from src.services.auth import AuthenticationService
+from src.services.report_dispatcher import ReportDispatcher
+from src.services.siganture_auth import OtomaxSignatureService
+
+
+def make_client() -> tuple[TestClient, AuthenticationService]:
+    registry = MemberRegistry(
+        [
+            MemberRecord(
+                memberid="TESTOK01",
+                pin="1111",
+                password="TESTOK01",
+                allowed_ip="testclient",
+                report_url="http://example/report",
+            )
+        ]
+    )
+    app = FastAPI()
+    app.include_router(router)
+    register_exception_handlers(app)
+    service = AuthenticationService(OtomaxSignatureService, registry)
+    app.state.auth_service = service
+    return TestClient(app), service
+
+
+def test_trx_uses_app_scoped_service():
+    client, service = make_client()
+    params = {
+        "trxid": "trx-1",
+        "memberid": "TESTOK01",
+        "product": "PROD",
+        "dest": "081",
+        "pin": "1111",
+        "password": "TESTOK01",
+    }
+
+    first = client.get("/trx", params=params)
+    second = client.get("/trx", params={**params, "trxid": "trx-2"})
+
+    assert first.status_code == 200
+    assert first.json()["trxid"] == "trx-1"
+    assert second.json()["trxid"] == "trx-2"
+    assert client.app.state.auth_service is service
+
+
+def test_trx_rejects_bad_credentials():
+    client, _ = make_client()
+    response = client.get(
+        "/trx",
+        params={
+            "trxid": "trx-3",
+            "memberid": "TESTOK01",
+            "product": "PROD",
+            "dest": "081",
+            "pin": "bad",
+            "password": "bad",
+        },
+    )
+    assert response.status_code == 401
+    assert response.json() == {
+        "success": False,
+        "rc": "AuthError",
+        "message": "pin password salah",
+        "trace_id": "unknown",
+    }
+
+
+def test_trx_requires_pin_or_sign():
+    client, _ = make_client()
+    response = client.get(
+        "/trx",
+        params={"trxid": "trx-4", "memberid": "TESTOK01", "product": "P", "dest": "1"},
+    )
+    assert response.status_code == 422
+
+
+def test_trx_queues_member_report_without_sending():
+    client, _ = make_client()
+    dispatcher = ReportDispatcher()  # belum di-start: submit hanya mengantri
+    client.app.state.report_dispatcher = dispatcher
+    response = client.get(
+        "/trx",
+        params={
+            "trxid": "trx-9",
+            "memberid": "TESTOK01",
+            "product": "PROD",
+            "dest": "081",
+            "pin": "1111",
+            "password": "TESTOK01",
+        },
+    )
+
+    assert response.status_code == 200
+    assert dispatcher.stats()["pending"] == 1
+
+
+def _batch_item(i: int, **extra) -> dict:
+    item = {
+        "trxid": f"b-{i}",
+        "memberid": "TESTOK01",
+        "product": "PROD",
+        "dest": "081",
+        "pin": "1111",
+        "password": "TESTOK01",
+    }
+    item.update(extra)
+    return item
+
+
+def test_trx_batch_json_array_keeps_order_and_per_item_errors():
+    client, service = make_client()
+    sign = OtomaxSignatureService.generate_transaction_signature(
+        "TESTOK01", "PROD", "081", "b-2", "1111", "TESTOK01"
+    )
+    items = [
+        _batch_item(0),
+        _batch_item(1, pin="bad"),
+        {
+            k: v
+            for k, v in _batch_item(2, sign=sign).items()
+            if k not in ("pin", "password")
+        },
+        {
+            k: v
+            for k, v in _batch_item(3, sign="x").items()
+            if k not in ("pin", "password")
+        },
+    ]
+
+    response = client.post("/trx/batch", json=items)
+
+    results = response.json()["results"]
+    assert response.status_code == 200
+    assert [r["trxid"] for r in results] == ["b-0", "b-1", "b-2", "b-3"]
+    assert [r["status"] for r in results] == ["success", "error", "success", "error"]
+    assert results[0] == service.authenticate_transaction(_batch_item(0), "testclient")
+    assert results[1]["status_code"] == 401
+    assert results[2]["sign"] == sign
+
+
+def test_trx_batch_accepts_ndjson_and_rejects_invalid_items():
+    client, _ = make_client()
+    body = "\n".join(json.dumps(_batch_item(i)) for i in range(3)) + "\n"
+
+    response = client.post(
+        "/trx/batch", content=body, headers={"content-type": "application/x-ndjson"}
+    )
+    assert [r["trxid"] for r in response.json()["results"]] == ["b-0", "b-1", "b-2"]
+
+    bad = client.post("/trx/batch", json=[{"trxid": "x", "memberid": "TESTOK01"}])
+    assert bad.status_code == 422
+
+
+def test_trx_batch_rejects_duplicate_trxid_in_batch():
+    client, _ = make_client()
+    items = [_batch_item(0), _batch_item(1), _batch_item(0, memberid="testok01")]
+
+    results = client.post("/trx/batch", json=items).json()["results"]
+    assert [r["status"] for r in results] == ["success", "success", "error"]
+    assert results[2]["status_code"] == 409
+
+
+def test_trx_batch_limits_body_and_item_count(monkeypatch):
+    client, _ = make_client()
+    monkeypatch.setattr(api_trx, "MAX_BATCH_SIZE", 3)
+    monkeypatch.setattr(api_trx, "MAX_BATCH_BYTES", 2_000)
+
+    too_many = [_batch_item(i) for i in range(4)]
+    response = client.post("/trx/batch", json=too_many)
+    assert response.status_code == 413
+    assert "transaksi" in response.json()["message"]
+    ndjson = "\n".join(json.dumps(item) for item in too_many)
+    assert client.post("/trx/batch", content=ndjson).status_code == 413
+    # item non-objek tetap dihitung sebelum validasi model
+    assert client.post("/trx/batch", content=b"[1,1,1,1,1]").status_code == 413
+
+    big = [_batch_item(0, dest="0" * 3_000)]
+    response = client.post("/trx/batch", json=big)
+    assert response.status_code == 413
+    assert "byte" in response.json()["message"]
+
+    def chunks():
+        yield b"["
+        yield json.dumps(big[0]).encode()
+        yield b"]"
+
+    assert client.post("/trx/batch", content=chunks()).status_code == 413
@@ -102,3 +102,23 @@ def test_sign_only_verification_with_stored_credentials():
     result = svc.authenticate_transaction(auth, client_ip="9.9.9.9")
     assert result["status"] == "success"
     assert result["sign"] == expected_sign
+
+
+def test_non_ascii_sign_is_rejected_with_401():
+    svc = AuthenticationService(OtomaxSignatureService, make_settings(False))
+    auth = {
+        "trxid": "trx-5",
+        "memberid": "TESTOK01",
+        "product": "PROD",
+        "dest": "08123456789",
+        "sign": "sïgnatüre",
+    }
+
+    try:
+        svc.authenticate_transaction(auth, client_ip="9.9.9.9")
+    except AuthError as exc:
+        assert exc.status_code == 401
+    else:
+        raise AssertionError("AuthError not raised")
+    [result] = svc.authenticate_many([auth], client_ip="9.9.9.9")
+    assert result["status_code"] == 401
@@ -0,0 +1,65 @@
+import asyncio
+import json
+
+from fastapi.responses import JSONResponse
+from src.core.exceptions.errorcases import EntityNotFoundError
+from src.core.exceptions.handlers import (
+    app_exception_handler,
+    render_error,
+    unexpected_exception_handler,
+)
+from src.services.errors import AuthError
+from starlette.requests import Request
+
+
+def make_request(trace_id=None) -> Request:
+    scope = {"type": "http", "headers": [], "state": {}}
+    if trace_id is not None:
+        scope["state"]["trace_id"] = trace_id
+    return Request(scope)
+
+
+def expected_body(rc, message, trace_id) -> bytes:
+    return JSONResponse(
+        {"success": False, "rc": rc, "message": message, "trace_id": trace_id}
+    ).body
+
+
+def test_render_error_matches_json_response():
+    cases = [
+        ("AuthError", "invalid IP", "abc123def456"),
+        ("AuthError", 'quote " and \\ backslash', "unknown"),
+        ("EntityNotFoundError", "tidak ditemukan \u2013 ü", "trace-with-dash"),
+    ]
+    for rc, message, trace_id in cases:
+        assert render_error(rc, message, trace_id) == expected_body(
+            rc, message, trace_id
+        )
+
+
+def test_app_exception_handler_uses_exception_status():
+    response = asyncio.run(
+        app_exception_handler(make_request("abc12345"), AuthError("invalid IP", 403))
+    )
+    assert response.status_code == 403
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body) == {
+        "success": False,
+        "rc": "AuthError",
+        "message": "invalid IP",
+        "trace_id": "abc12345",
+    }
+
+    response = asyncio.run(app_exception_handler(make_request(), EntityNotFoundError()))
+    assert response.status_code == 404
+    assert json.loads(response.body)["trace_id"] == "unknown"
+
+
+def test_unexpected_exception_handler_hides_details():
+    response = asyncio.run(
+        unexpected_exception_handler(make_request("abc12345"), RuntimeError("boom"))
+    )
+    body = json.loads(response.body)
+    assert response.status_code == 500
+    assert body["rc"] == "INTERNAL_SERVER_ERROR"
+    assert "boom" not in response.body.decode()
@@ -0,0 +1,96 @@
+from src.domain.member.registry import MemberRecord, MemberRegistry
+from src.services.auth import AuthenticationService
+from src.services.idempotency import IdempotencyStore
+from src.services.siganture_auth import OtomaxSignatureService
+
+FP = ("PROD", "081", "1111", "pwd", None)
+
+
+def test_hit_returns_original_result():
+    store = IdempotencyStore(max_size=10, ttl=60)
+    result = {"status": "success", "trxid": "T1"}
+    store.put("m1", "T1", FP, result)
+
+    assert store.get("M1", "T1", FP) is result
+    assert store.get("M1", "T2", FP) is None
+    assert store.stats()["hits"] == 1
+    assert store.stats()["misses"] == 1
+
+
+def test_fingerprint_mismatch_is_a_miss():
+    store = IdempotencyStore(max_size=10, ttl=60)
+    store.put("M1", "T1", FP, {"trxid": "T1"})
+
+    assert store.get("M1", "T1", ("PROD", "081", "9999", "pwd", None)) is None
+
+
+def test_ttl_expiry_and_lru_eviction(clock):
+    store = IdempotencyStore(max_size=2, ttl=10, clock=clock)
+    store.put("M1", "T1", FP, {"trxid": "T1"})
+    store.put("M1", "T2", FP, {"trxid": "T2"})
+    assert store.get("M1", "T1", FP) is not None  # T1 jadi most recent
+
+    store.put("M1", "T3", FP, {"trxid": "T3"})  # evict T2
+    assert store.get("M1", "T2", FP) is None
+    assert store.stats()["evictions"] == 1
+
+    clock.now += 11
+    assert store.get("M1", "T3", FP) is None
+    assert store.stats()["expirations"] == 1
+
+
+def test_disk_backed_store_survives_restart(tmp_path, clock):
+    path = tmp_path / "idem.jsonl"
+    store = IdempotencyStore(max_size=10, ttl=60, path=path, clock=clock)
+    store.put("M1", "T1", FP, {"trxid": "T1"})
+    store.put("M1", "T2", FP, {"trxid": "T2"})
+    store.close()
+
+    clock.now += 30
+    reloaded = IdempotencyStore(max_size=10, ttl=60, path=path, clock=clock)
+    assert reloaded.get("M1", "T1", FP) == {"trxid": "T1"}
+
+    clock.now += 31
+    again = IdempotencyStore(max_size=10, ttl=60, path=path, clock=clock)
+    assert len(again) == 0
+
+
+def test_journal_stores_only_fingerprint_digest(tmp_path):
+    path = tmp_path / "idem.jsonl"
+    store = IdempotencyStore(max_size=2, ttl=60, path=path, flush_interval_ms=1000)
+    fingerprint = ("PROD", "081", "pin-8642", "pw-secret", None)
+    for i in range(10):  # melewati batas compaction
+        store.put("M1", f"T{i}", fingerprint, {"trxid": f"T{i}"})
+    assert store.get("M1", "T9", fingerprint) is not None
+    store.close()
+
+    content = path.read_text()
+    assert "pin-8642" not in content and "pw-secret" not in content
+    assert (tmp_path / "idem.jsonl.key").stat().st_mode & 0o777 == 0o600
+    reloaded = IdempotencyStore(max_size=2, ttl=60, path=path)
+    assert reloaded.get("M1", "T9", fingerprint) == {"trxid": "T9"}
+    assert reloaded.get("M1", "T9", ("PROD", "081", "x", "y", None)) is None
+    reloaded.close()
+
+
+def test_service_answers_resend_from_cache():
+    registry = MemberRegistry(
+        [MemberRecord("TESTOK01", "1111", "TESTOK01", "10.0.0.2", "")],
+        enable_ip_check=False,
+    )
+    store = IdempotencyStore(max_size=10, ttl=60)
+    svc = AuthenticationService(OtomaxSignatureService, registry, idempotency=store)
+    auth = {
+        "trxid": "trx-1",
+        "memberid": "TESTOK01",
+        "product": "PROD",
+        "dest": "081",
+        "pin": "1111",
+        "password": "TESTOK01",
+    }
+
+    first = svc.authenticate_transaction(auth, client_ip="9.9.9.9")
+    second = svc.authenticate_transaction(auth, client_ip="9.9.9.9")
+
+    assert second is first
+    assert store.stats()["hits"] == 1
@@ -0,0 +1,31 @@
+import pytest
+from scripts.bench_import_time import (
+    DEFERRED_MODULES,
+    IMPORT_BUDGET_MS,
+    deferred_imported,
+    measure,
+    parse_importtime,
+)
+
+REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2953 |     424415 | src.main
+import time:       335 |     359079 |   fastapi
+"""
+
+
+def test_parse_importtime_report():
+    entries = parse_importtime(REPORT)
+    assert [(e.module, e.self_us, e.cumulative_us, e.depth) for e in entries] == [
+        ("_io", 120, 120, 1),
+        ("src.main", 2953, 424415, 0),
+        ("fastapi", 335, 359079, 1),
+    ]
+
+
+@pytest.mark.performance
+def test_import_src_main_within_budget():
+    total, entries = measure(runs=3)
+    assert deferred_imported(entries) == [], DEFERRED_MODULES
+    assert total <= IMPORT_BUDGET_MS
@@ -0,0 +1,67 @@
+from src.domain.member.allowlist import IpAllowlist, split_entries
+from src.domain.member.model import Member
+from src.domain.member.registry import MemberRegistry
+from src.services.client_auth import ClientAuth
+from src.services.errors import AuthError
+
+
+def test_split_entries_strips_ports():
+    assert split_entries("10.0.0.2:9000, 10.1.0.0/16 [2001:db8::1]:443 ::1") == [
+        "10.0.0.2",
+        "10.1.0.0/16",
+        "2001:db8::1",
+        "::1",
+    ]
+
+
+def test_ipv4_and_ipv6_ranges():
+    allowlist = IpAllowlist.compile(
+        [
+            "10.0.0.0/24",
+            "10.0.1.0/24",
+            "192.168.1.5",
+            "2001:db8::/32",
+        ]
+    )
+
+    assert "10.0.0.0" in allowlist
+    assert "10.0.1.255" in allowlist
+    assert "10.0.2.0" not in allowlist
+    assert "192.168.1.5" in allowlist
+    assert "192.168.1.6" not in allowlist
+    assert "2001:db8:ffff::1" in allowlist
+    assert "2001:0db8::0001" in allowlist  # bentuk non-kanonik
+    assert "2001:db9::1" not in allowlist
+    assert "not-an-ip" not in allowlist
+
+
+def test_non_ip_entries_match_exactly():
+    allowlist = IpAllowlist.compile(["testclient"])
+    assert "testclient" in allowlist
+    assert "10.0.0.1" not in allowlist
+    assert not IpAllowlist.compile([])
+
+
+def test_client_auth_with_member_cidr_allowlist():
+    registry = MemberRegistry.from_members(
+        [
+            Member(
+                memberid="NAT01",
+                pin="1",
+                password="p",
+                ip_address="203.0.113.10:8080",
+                allowed_ips=["198.51.100.0/24", "2001:db8:1::/48"],
+                report_url="",
+            )
+        ]
+    )
+    client_auth = ClientAuth(registry)
+
+    for ip in ("203.0.113.10", "198.51.100.77", "2001:db8:1:2::3"):
+        client_auth.validate("nat01", ip)
+
+    try:
+        client_auth.validate("NAT01", "198.51.101.1")
+        raise AssertionError("Expected AuthError due to invalid IP")
+    except AuthError as exc:
+        assert exc.status_code == 403
@@ -0,0 +1,134 @@
+from src.domain.member.registry import MemberRecord, MemberRegistry
+from src.services import journal as journal_module
+from src.services.auth import AuthenticationService
+from src.services.idempotency import IdempotencyStore
+from src.services.journal import TransactionJournal
+from src.services.siganture_auth import OtomaxSignatureService
+
+
+def _result(i: int) -> dict:
+    return {"status": "success", "trxid": f"T{i}", "memberid": "M1", "sign": f"S{i}"}
+
+
+def test_append_flush_lookup_and_scan(tmp_path):
+    journal = TransactionJournal(tmp_path / "trx.journal", commit_interval_ms=1000)
+    offsets = [journal.append(_result(i)) for i in range(3)]
+    assert journal.lookup("M1", "T1") is None  # belum durable
+
+    journal.flush()
+    record = journal.lookup("m1", "T1")
+    assert record["trxid"] == "T1" and record["sign"] == "S1"
+    assert record["status"] == "success"
+    assert [offset for offset, _ in journal.scan()] == offsets
+    journal.close()
+
+
+def test_reopen_rebuilds_missing_index_and_truncates_torn_tail(tmp_path):
+    path = tmp_path / "trx.journal"
+    journal = TransactionJournal(path, commit_interval_ms=1000)
+    journal.append(_result(1))
+    journal.close()
+
+    # simulasi crash: index tidak lengkap dan record terakhir setengah jadi
+    journal = TransactionJournal(path, commit_interval_ms=1000)
+    journal.append(_result(2))
+    journal.close()
+    (tmp_path / "trx.journal.idx").write_bytes(b"")
+    with path.open("ab") as fh:
+        fh.write(b"\x54\x4a\xff")
+
+    journal = TransactionJournal(path, commit_interval_ms=1000)
+    assert len(journal) == 2
+    assert journal.lookup("M1", "T2")["sign"] == "S2"
+    journal.append(_result(3))
+    journal.close()
+
+    journal = TransactionJournal(path, commit_interval_ms=1000)
+    assert [r["trxid"] for _, r in journal.scan()] == ["T1", "T2", "T3"]
+    journal.close()
+
+
+def test_index_is_keyed_by_member_and_trxid(tmp_path):
+    path = tmp_path / "trx.journal"
+    journal = TransactionJournal(path, commit_interval_ms=1000)
+    journal.append(_result(1))
+    journal.append({**_result(1), "memberid": "M2", "sign": "other"})
+    journal.close()
+
+    journal = TransactionJournal(path, commit_interval_ms=1000)
+    assert journal.lookup("M1", "T1")["sign"] == "S1"
+    assert journal.lookup("M2", "T1")["sign"] == "other"
+    assert journal.lookup("M3", "T1") is None
+    journal.close()
+
+
+def test_reopen_scans_only_unindexed_tail(tmp_path, monkeypatch):
+    path = tmp_path / "trx.journal"
+    journal = TransactionJournal(path, commit_interval_ms=1000)
+    for i in range(100):
+        journal.append(_result(i))
+    journal.close()
+
+    decoded = []
+    original = journal_module.decode_record
+    monkeypatch.setattr(
+        journal_module,
+        "decode_record",
+        lambda buffer, offset: decoded.append(offset) or original(buffer, offset),
+    )
+    journal = TransactionJournal(path, commit_interval_ms=1000)
+    assert len(journal) == 100
+    # record terakhir yang ter-index + satu percobaan di akhir file
+    assert len(decoded) == 2
+    journal.close()
+
+
+def test_group_commit_thread_flushes(tmp_path):
+    journal = TransactionJournal(tmp_path / "trx.journal", commit_interval_ms=1)
+    journal.append(_result(7))
+    journal.close()
+    reopened = TransactionJournal(tmp_path / "trx.journal")
+    assert reopened.lookup("M1", "T7") is not None
+    reopened.close()
+
+
+def test_auth_service_journals_success_once(tmp_path):
+    registry = MemberRegistry(
+        [MemberRecord("TESTOK01", "1111", "TESTOK01", "10.0.0.2", "")],
+        enable_ip_check=False,
+    )
+    journal = TransactionJournal(tmp_path / "trx.journal", commit_interval_ms=1000)
+    svc = AuthenticationService(
+        OtomaxSignatureService,
+        registry,
+        idempotency=IdempotencyStore(max_size=10, ttl=60),
+        journal=journal,
+    )
+    auth = {
+        "trxid": "trx-1",
+        "memberid": "TESTOK01",
+        "product": "PROD",
+        "dest": "081",
+        "pin": "1111",
+        "password": "TESTOK01",
+    }
+    result = svc.authenticate_transaction(auth, client_ip="9.9.9.9")
+    svc.authenticate_transaction(auth, client_ip="9.9.9.9")  # hit idempotency
+    journal.close()
+
+    records = [r for _, r in journal.scan()]
+    assert len(records) == 1
+    assert records[0]["sign"] == result["sign"]
+
+
+def test_fields_longer_than_u16_round_trip(tmp_path):
+    path = tmp_path / "trx.journal"
+    journal = TransactionJournal(path, commit_interval_ms=1000)
+    trxid = "T" * 70_000
+    journal.append({"trxid": trxid, "memberid": "M1", "sign": "S" * 70_000})
+    journal.close()
+
+    reopened = TransactionJournal(path, commit_interval_ms=1000)
+    record = reopened.lookup("M1", trxid)
+    assert record["sign"] == "S" * 70_000
+    reopened.close()
@@ -0,0 +1,168 @@
+import asyncio
+import threading
+
+import pytest
+from src.core.exceptions.errorcases import (
+    EntityNotFoundError,
+    InsufficientBalanceError,
+    ResourceConflictError,
+)
+from src.domain.member.ledger import BalanceLedger
+from src.domain.member.registry import MemberRecord
+
+
+def test_reserve_commit_refund():
+    ledger = BalanceLedger()
+    ledger.open_account("m1", 10_000)
+
+    ledger.reserve("M1", "T1", 3_000)
+    ledger.reserve("M1", "T2", 2_000)
+    assert ledger.available("M1") == 5_000
+    assert ledger.balance("M1") == 10_000
+
+    ledger.commit("M1", "T1")
+    ledger.refund("m1", "T2")
+    assert ledger.balance("M1") == 7_000
+    assert ledger.available("M1") == 7_000
+    assert ledger.pending() == 0
+
+
+def test_reserve_rejects_insufficient_and_duplicate():
+    ledger = BalanceLedger()
+    ledger.open_account("M1", 1_000)
+
+    with pytest.raises(InsufficientBalanceError):
+        ledger.reserve("M1", "T1", 1_001)
+    ledger.reserve("M1", "T1", 500)
+    with pytest.raises(ResourceConflictError):
+        ledger.reserve("M1", "T1", 100)
+    with pytest.raises(EntityNotFoundError):
+        ledger.commit("M1", "T404")
+    with pytest.raises(EntityNotFoundError):
+        ledger.credit("NOPE", 1)
+
+
+def test_same_trxid_is_independent_per_member():
+    ledger = BalanceLedger()
+    ledger.open_account("M1", 1_000)
+    ledger.open_account("M2", 1_000)
+
+    ledger.reserve("M1", "T1", 100)
+    ledger.reserve("M2", "T1", 200)
+    with pytest.raises(EntityNotFoundError):
+        ledger.commit("M3", "T1")
+    ledger.commit("M2", "T1")
+    ledger.refund("M1", "T1")
+    assert ledger.balance("M1") == 1_000
+    assert ledger.balance("M2") == 800
+    assert ledger.pending() == 0
+
+
+def test_wal_replay_rebuilds_state(tmp_path):
+    wal = tmp_path / "ledger.wal"
+    members = [MemberRecord("M1", "1", "p", "", "", balance=5_000)]
+    ledger = BalanceLedger.from_registry(members, wal_path=wal)
+    ledger.credit("M1", 1_000)
+    ledger.reserve("M1", "T1", 2_000)
+    ledger.reserve("M1", "T2", 500)
+    ledger.commit("M1", "T1")
+    ledger.close()
+
+    # saldo registry diabaikan karena member sudah ada di WAL
+    members = [MemberRecord("M1", "1", "p", "", "", balance=999)]
+    rebuilt = BalanceLedger.from_registry(members, wal_path=wal)
+    assert rebuilt.balance("M1") == 4_000
+    assert rebuilt.available("M1") == 3_500
+    rebuilt.refund("M1", "T2")
+    assert rebuilt.available("M1") == 4_000
+    rebuilt.close()
+
+
+def test_wal_replay_skips_orphan_settlements(tmp_path):
+    wal = tmp_path / "ledger.wal"
+    wal.write_text(
+        "O\tM1\t\t1000\n"
+        "R\tM1\tT1\t300\n"
+        "K\tM1\tT404\t300\n"  # reservation tidak ada
+        "F\tM2\tT1\t300\n"  # member lain
+        "C\tNOPE\t\t10\n"  # member tanpa OPEN
+    )
+    ledger = BalanceLedger(wal_path=wal)
+    assert ledger.balance("M1") == 1_000
+    assert ledger.pending() == 1
+    ledger.close()
+
+
+def test_concurrent_asyncio_tasks_on_hot_member():
+    ledger = BalanceLedger()
+    ledger.open_account("HOT", 10_000)
+
+    async def trx(i: int) -> bool:
+        await asyncio.sleep(0)
+        try:
+            ledger.reserve("HOT", f"T{i}", 3)
+        except InsufficientBalanceError:
+            return False
+        await asyncio.sleep(0)
+        ledger.commit("HOT", f"T{i}")
+        return True
+
+    async def run():
+        return await asyncio.gather(*(trx(i) for i in range(5_000)))
+
+    results = asyncio.run(run())
+    assert sum(results) == 3_333
+    assert ledger.balance("HOT") == 10_000 - 3_333 * 3
+
+
+def test_concurrent_threads_keep_balance_consistent():
+    ledger = BalanceLedger(stripes=4)
+    for m in range(8):
+        ledger.open_account(f"M{m}", 1_000_000)
+
+    def worker(t: int) -> None:
+        for i in range(2_000):
+            memberid = f"M{i % 8}"
+            ledger.reserve(memberid, f"{t}-{i}", 1)
+            ledger.commit(memberid, f"{t}-{i}")
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sum(ledger.balance(f"M{m}") for m in range(8)) == 8_000_000 - 16_000
+
+
+def test_mutations_are_on_disk_before_returning(tmp_path):
+    wal = tmp_path / "ledger.wal"
+    ledger = BalanceLedger(wal_path=wal)
+    ledger.open_account("M1", 1_000)
+    ledger.reserve("M1", "T1", 300)
+
+    # tanpa flush/close: baris sudah ditulis saat reserve kembali
+    assert wal.read_text().splitlines()[-1] == "R\tM1\tT1\t300"
+    ledger.commit("M1", "T1")
+    assert wal.read_text().splitlines()[-1] == "K\tM1\tT1\t300"
+    ledger.close()
+
+
+def test_compaction_keeps_state_and_shrinks_wal(tmp_path):
+    wal = tmp_path / "ledger.wal"
+    ledger = BalanceLedger(wal_path=wal, compact_bytes=2_000)
+    ledger.open_account("M1", 1_000_000)
+    for i in range(200):
+        ledger.reserve("M1", f"T{i}", 10)
+        ledger.commit("M1", f"T{i}")
+    ledger.reserve("M1", "OPEN", 5)
+    assert wal.stat().st_size < 2_000
+    ledger.close()
+
+    rebuilt = BalanceLedger(wal_path=wal)
+    # dibuka ulang: WAL langsung dipadatkan menjadi snapshot
+    assert wal.read_text() == "O\tM1\t\t998000\nR\tM1\tOPEN\t5\n"
+    assert rebuilt.balance("M1") == 998_000
+    assert rebuilt.available("M1") == 997_995
+    rebuilt.commit("M1", "OPEN")
+    rebuilt.close()
@@ -0,0 +1,81 @@
+import os
+
+import pytest
+from loadtests.baseline import ScenarioResult, find_regressions, load_baseline
+from loadtests.run import SCENARIOS, run_suite
+
+STATS_HEADER = (
+    "Type,Name,Request Count,Failure Count,Median Response Time,"
+    "Average Response Time,Min Response Time,Max Response Time,"
+    "Average Content Size,Requests/s,Failures/s,50%,66%,75%,80%,90%,95%,98%,"
+    "99%,99.9%,99.99%,100%\n"
+)
+
+
+def result(rps=500.0, p95=40.0, p99=60.0, failures=0) -> ScenarioResult:
+    return ScenarioResult(
+        rps=rps, p50=20.0, p95=p95, p99=p99, requests=1000, failures=failures
+    )
+
+
+BASELINE = {
+    "config": {},
+    "scenarios": {
+        "trx_pin": {
+            "rps": 500.0,
+            "p50": 20.0,
+            "p95": 40.0,
+            "p99": 60.0,
+            "requests": 1000,
+            "failures": 0,
+        }
+    },
+}
+
+
+def test_reads_aggregated_row_from_locust_csv(tmp_path):
+    path = tmp_path / "trx_pin_stats.csv"
+    path.write_text(
+        STATS_HEADER
+        + "GET,/trx [pin],900,0,30,31.5,9,90,51,450.2,0,30,34,37,39,44,48,55,60,88,90,90\n"
+        + ",Aggregated,900,2,30,31.5,9,90,51,450.24,0.1,30,34,37,39,44,48,55,61,88,90,90\n"
+    )
+    assert ScenarioResult.from_stats_csv(path) == ScenarioResult(
+        rps=450.2, p50=30.0, p95=48.0, p99=61.0, requests=900, failures=2
+    )
+
+
+def test_within_tolerance_is_not_a_regression():
+    assert find_regressions({"trx_pin": result(rps=400.0, p95=60.0)}, BASELINE) == []
+
+
+def test_rps_drop_and_latency_rise_are_reported():
+    problems = find_regressions({"trx_pin": result(rps=300.0, p99=120.0)}, BASELINE)
+    assert len(problems) == 2
+    assert problems[0].startswith("trx_pin: rps")
+    assert problems[1].startswith("trx_pin: p99")
+
+
+def test_failures_fail_even_without_baseline():
+    problems = find_regressions({"ping": result(failures=3)}, {"scenarios": {}})
+    assert problems == ["ping: 3 request gagal"]
+
+
+def test_committed_baseline_covers_all_scenarios():
+    baseline = load_baseline()
+    assert set(baseline["scenarios"]) == set(SCENARIOS)
+    assert {"users", "spawn_rate", "duration", "workers"} <= set(baseline["config"])
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not os.environ.get("LOADTEST"),
+    reason="jalankan dengan LOADTEST=1 pytest -m performance",
+)
+def test_load_scenarios_do_not_regress(tmp_path):
+    pytest.importorskip("locust")
+    baseline = load_baseline()
+    config = baseline["config"]
+    results = run_suite(config, list(SCENARIOS), tmp_path)
+    assert find_regressions(results, baseline) == []
@@ -0,0 +1,170 @@
+import json
+import sqlite3
+
+from src.config.settings import Settings, UserCred
+from src.domain.member.allowlist import IpAllowlist
+from src.domain.member.model import Member
+from src.domain.member.registry import MemberRecord, MemberRegistry
+from src.services.auth import AuthenticationService, AuthError
+from src.services.client_auth import ClientAuth
+from src.services.credential_auth import CredentialAuth
+from src.services.siganture_auth import OtomaxSignatureService
+
+MEMBERS = [
+    {
+        "memberid": " ab001 ",
+        "pin": " 1111 ",
+        "password": "secret1",
+        "ip_address": "10.0.0.1:8080",
+        "report_url": "http://a/report",
+    },
+    {
+        "memberid": "AB002",
+        "pin": "2222",
+        "password": "secret2",
+        "ip_address": "10.0.0.2",
+        "report_url": "http://b/report",
+    },
+    {
+        "memberid": "AB003",
+        "pin": "3333",
+        "password": "secret3",
+        "ip_address": "10.0.0.3",
+        "report_url": "http://c/report",
+        "is_active": False,
+    },
+]
+
+
+def test_registry_from_json_normalizes_fields(tmp_path):
+    path = tmp_path / "members.json"
+    path.write_text(json.dumps(MEMBERS))
+
+    registry = MemberRegistry.from_file(path)
+
+    assert len(registry) == 2
+    member = registry.get("Ab001")
+    assert member.memberid == "AB001"
+    assert member.pin == "1111"
+    assert member.allowed_ip == "10.0.0.1"
+    assert "AB003" not in registry
+
+
+def test_registry_from_sqlite(tmp_path):
+    path = tmp_path / "members.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE members (memberid, pin, password, ip_address, report_url, is_active)"
+    )
+    conn.executemany(
+        "INSERT INTO members VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (
+                m["memberid"],
+                m["pin"],
+                m["password"],
+                m["ip_address"],
+                m["report_url"],
+                m.get("is_active", True),
+            )
+            for m in MEMBERS
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    registry = MemberRegistry.from_file(path)
+
+    assert len(registry) == 2
+    assert registry.get("ab002").password == "secret2"
+
+
+def test_registry_from_settings_uses_member_source(tmp_path):
+    path = tmp_path / "members.json"
+    path.write_text(json.dumps(MEMBERS))
+    oto = UserCred(
+        memberid="TESTOK01",
+        password="TESTOK01",
+        pin="1111",
+        memberip="10.0.0.9:9000",
+        memberreporturl="http://example/report",
+        enable_ip_check=False,
+    )
+
+    single = MemberRegistry.from_settings(Settings(OTO=oto))
+    multi = MemberRegistry.from_settings(Settings(OTO=oto, MEMBER_SOURCE=str(path)))
+
+    assert [m.memberid for m in single] == ["TESTOK01"]
+    assert single.get("testok01").allowed_ip == "10.0.0.9"
+    assert len(multi) == 2
+    assert multi.enable_ip_check is False
+
+
+def test_auth_components_use_registry_per_member():
+    registry = MemberRegistry.from_members([Member(**m) for m in MEMBERS])
+
+    ClientAuth(registry).validate("AB001", "10.0.0.1")
+    ClientAuth(registry).validate("ab002", "10.0.0.2")
+    CredentialAuth(registry).validate("AB002", "2222", "secret2")
+
+    for memberid, ip in [("AB001", "10.0.0.2"), ("AB003", "10.0.0.3")]:
+        try:
+            ClientAuth(registry).validate(memberid, ip)
+            raise AssertionError("Expected AuthError due to invalid IP")
+        except AuthError as exc:
+            assert exc.status_code == 403
+
+    try:
+        CredentialAuth(registry).validate("AB001", "2222", "secret2")
+        raise AssertionError("Expected AuthError for other member's credentials")
+    except AuthError as exc:
+        assert exc.status_code == 401
+
+
+def test_sign_only_unknown_member_is_rejected():
+    registry = MemberRegistry(enable_ip_check=False)
+    svc = AuthenticationService(OtomaxSignatureService, registry)
+
+    try:
+        svc.authenticate_transaction(
+            {
+                "trxid": "t1",
+                "memberid": "NOPE",
+                "product": "P",
+                "dest": "081",
+                "sign": "abc",
+            },
+            client_ip="1.1.1.1",
+        )
+        raise AssertionError("Expected AuthError for unknown member")
+    except AuthError as exc:
+        assert exc.status_code == 401
+
+
+def test_registry_interns_shared_strings_and_single_ip_rule():
+    members = [
+        Member(
+            memberid=f"m{i}",
+            pin="1111",
+            password=f"pwd{i}",
+            ip_address="10.0.0.1",
+            report_url="http://h2h/report",
+        )
+        for i in range(2)
+    ]
+    registry = MemberRegistry.from_members(members)
+    a, b = registry.get("M0"), registry.get("M1")
+
+    assert a.pin is b.pin
+    assert a.report_url is b.report_url
+    assert a.allow_rule == "10.0.0.1"
+    assert a.allow_rule is b.allow_rule is a.allowed_ip
+
+
+def test_single_ip_rule_matches_compiled_allowlist():
+    for raw in ("10.0.0.1", "gateway.local", "2001:db8::1", "10.0.0.0/30", ""):
+        record = MemberRecord("M1", "1", "p", raw, "")
+        compiled = IpAllowlist.compile([raw] if raw else [])
+        for ip in ("10.0.0.1", "10.0.0.2", "gateway.local", "2001:DB8::1", "::1"):
+            assert record.allows(ip) is (ip in compiled), (raw, ip)
+            assert (ip in record.allowlist) is (ip in compiled), (raw, ip)
@@ -0,0 +1,73 @@
+import contextlib
+
+from src.core.metrics import MetricsRegistry
+from src.domain.member.registry import MemberRecord, MemberRegistry
+from src.services.auth import AuthenticationService, AuthError
+from src.services.siganture_auth import OtomaxSignatureService
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    hist = registry.histogram("latency_seconds", "test", stage="a")
+    for value in (300, 1_000, 1_000_000):
+        hist.observe_ns(value)
+
+    text = registry.render()
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{stage="a",le="5.12e-07"} 1' in text
+    assert 'latency_seconds_bucket{stage="a",le="1.024e-06"} 2' in text
+    assert 'latency_seconds_bucket{stage="a",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{stage="a"} 3' in text
+
+
+def test_counter_and_gauge_render():
+    registry = MetricsRegistry()
+    registry.counter("errors_total", "test", status="401").inc(2)
+    registry.gauge("cache_size", "test", lambda: 7)
+
+    text = registry.render()
+    assert 'errors_total{status="401"} 2' in text
+    assert "cache_size 7" in text
+
+
+def test_gauge_group_reads_snapshot_once_per_render():
+    registry = MetricsRegistry()
+    calls = []
+
+    def stats():
+        calls.append(1)
+        return {"size": 3, "hits": 5, "misses": 1}
+
+    registry.gauge_group("cache", "test", stats, ("size", "hits"))
+
+    text = registry.render()
+    assert 'cache{stat="size"} 3' in text
+    assert 'cache{stat="hits"} 5' in text
+    assert "misses" not in text
+    assert len(calls) == 1
+
+
+def test_auth_service_records_stages_and_errors():
+    registry = MetricsRegistry()
+    members = MemberRegistry(
+        [MemberRecord("TESTOK01", "1111", "TESTOK01", "10.0.0.2", "")]
+    )
+    svc = AuthenticationService(OtomaxSignatureService, members, metrics=registry)
+    auth = {
+        "trxid": "trx-1",
+        "memberid": "TESTOK01",
+        "product": "PROD",
+        "dest": "081",
+        "pin": "1111",
+        "password": "TESTOK01",
+    }
+    svc.authenticate_transaction(auth, client_ip="10.0.0.2")
+    for _ in range(3):
+        with contextlib.suppress(AuthError):
+            svc.authenticate_transaction(auth, client_ip="1.1.1.1")
+
+    text = registry.render()
+    assert 'auth_stage_seconds_count{stage="ip_check"} 1' in text
+    assert 'auth_stage_seconds_count{stage="credential_check"} 1' in text
+    assert 'auth_stage_seconds_count{stage="signature_generate"} 1' in text
+    assert 'auth_errors_total{status="403"} 3' in text
@@ -0,0 +1,95 @@
+import io
+import threading
+
+from src.config.settings import LogSettings
+from src.core.mlogging.config import queue_handlers, shutdown_logging
+from src.core.mlogging.queue_sink import _STOP, QueueSink
+
+
+def test_queue_sink_writes_in_background(tmp_path):
+    path = tmp_path / "app.log"
+    sink = QueueSink(path, maxsize=100, batch_size=3)
+    sink.start()
+    for i in range(10):
+        sink(f"line {i}\n")
+    sink.stop()
+
+    assert path.read_text().splitlines() == [f"line {i}" for i in range(10)]
+    assert sink.written == 10
+    assert sink.dropped == 0
+
+
+def test_queue_sink_drop_mode_counts_overflow(tmp_path):
+    path = tmp_path / "app.log"
+    sink = QueueSink(path, maxsize=2, overflow="drop")
+    for i in range(5):
+        sink(f"line {i}\n")  # writer belum jalan, queue penuh setelah 2
+
+    assert sink.dropped == 3
+    sink.start()
+    sink.stop()
+    assert path.read_text().splitlines() == ["line 0", "line 1"]
+
+
+def test_queue_sink_block_mode_waits_for_space(tmp_path):
+    path = tmp_path / "app.log"
+    sink = QueueSink(path, maxsize=1, overflow="block")
+    sink("first\n")
+
+    producer = threading.Thread(target=sink, args=("second\n",))
+    producer.start()
+    producer.join(0.05)
+    assert producer.is_alive()  # masih menunggu ruang di queue
+
+    sink.start()
+    producer.join(2)
+    sink.stop()
+    assert not producer.is_alive()
+    assert sink.dropped == 0
+    assert path.read_text().splitlines() == ["first", "second"]
+
+
+def test_queue_sink_block_mode_falls_back_to_drop_when_writer_dies(tmp_path):
+    sink = QueueSink(
+        tmp_path / "app.log", maxsize=1, overflow="block", block_timeout=0.05
+    )
+    sink.start()
+    sink._queue.put(_STOP)  # writer berhenti seperti thread yang mati
+    sink._thread.join(1)
+    sink("first\n")
+
+    sink("second\n")  # queue penuh dan tidak ada yang mengosongkan
+    assert sink.dropped == 1
+    assert sink.overflow == "drop"
+    sink("third\n")
+    assert sink.dropped == 2
+    sink.stop(timeout=0.05)
+
+
+def test_queue_sink_writes_to_stream():
+    stream = io.StringIO()
+    sink = QueueSink(stream)
+    sink.start()
+    sink("to stream\n")
+    sink.stop()
+    assert stream.getvalue() == "to stream\n"
+
+
+def test_configured_handlers_are_routed_through_queue(tmp_path):
+    settings = LogSettings(queue_enabled=True)
+    handlers = queue_handlers(
+        [
+            {"sink": tmp_path / "plain.log", "level": "INFO"},
+            {"sink": tmp_path / "rotated.log", "rotation": "10 MB"},
+            {"sink": print},
+        ],
+        settings,
+    )
+    try:
+        assert isinstance(handlers[0]["sink"], QueueSink)
+        assert handlers[0]["level"] == "INFO"
+        # opsi khusus file sink Loguru: pakai antrian bawaan Loguru
+        assert handlers[1]["enqueue"] is True
+        assert handlers[2] == {"sink": print, "enqueue": True}
+    finally:
+        shutdown_logging()
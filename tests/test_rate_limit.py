@@ -0,0 +1,175 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.api.api_trx import router
+from src.config.settings import RateLimitSettings
+from src.core.exceptions import register_exception_handlers
+from src.core.middlewares import RateLimitMiddleware, RequestContextMiddleware
+from src.core.middlewares.rate_limit import TokenBucketLimiter, _memberid_from_query
+from src.domain.member.registry import MemberRecord, MemberRegistry
+from src.services.auth import AuthenticationService
+from src.services.siganture_auth import OtomaxSignatureService
+
+
+def test_token_bucket_burst_and_refill(clock):
+    limiter = TokenBucketLimiter(burst=2, refill_rate=1, clock=clock)
+
+    assert limiter.acquire("k") == 0.0
+    assert limiter.acquire("k") == 0.0
+    assert limiter.acquire("k") > 0
+
+    clock.now += 1.0
+    assert limiter.acquire("k") == 0.0
+    assert limiter.rejected == 1
+
+
+def test_idle_buckets_are_evicted(clock):
+    limiter = TokenBucketLimiter(burst=1, refill_rate=1, idle_ttl=10, clock=clock)
+    for i in range(100):
+        limiter.acquire(f"ip-{i}")
+    assert len(limiter) == 100
+
+    clock.now += 11
+    limiter.acquire("fresh")
+    assert len(limiter) == 1
+
+
+def test_max_keys_bounds_memory():
+    limiter = TokenBucketLimiter(burst=1, refill_rate=1, max_keys=10)
+    for i in range(1000):
+        limiter.acquire(i)
+    assert len(limiter) == 10
+
+
+def test_memberid_from_query():
+    assert _memberid_from_query(b"trxid=1&memberid=ab%2001&pin=1") == "AB 01"
+    assert _memberid_from_query(b"trxid=1") is None
+    # aturan sama dengan /trx: nilai terakhir menang, key ikut di-decode
+    assert _memberid_from_query(b"memberid=VICTIM&memberid=me") == "ME"
+    assert _memberid_from_query(b"memberid=VICTIM&%6Demberid=me") == "ME"
+
+
+def make_client(**overrides) -> TestClient:
+    app = FastAPI()
+    options = {"member_burst": 2, "member_refill": 0.001, "ip_burst": 100}
+    app.add_middleware(
+        RateLimitMiddleware, settings=RateLimitSettings(**{**options, **overrides})
+    )
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/trx")
+    async def trx():
+        return {"ok": True}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_middleware_rejects_member_over_limit():
+    client = make_client()
+
+    codes = [client.get("/trx?memberid=M1").status_code for _ in range(3)]
+    assert codes == [200, 200, 429]
+
+    rejected = client.get("/trx?memberid=m1")
+    assert rejected.status_code == 429
+    assert rejected.json()["rc"] == "RateLimitError"
+    assert rejected.json()["trace_id"] == rejected.headers["x-trace-id"]
+    assert int(rejected.headers["retry-after"]) >= 1
+
+    # member lain dan path lain tidak terpengaruh
+    assert client.get("/trx?memberid=M2").status_code == 200
+    assert client.get("/ping").status_code == 200
+
+
+def test_middleware_rejects_ip_over_limit():
+    client = make_client(ip_burst=1, ip_refill=0.001)
+
+    assert client.get("/trx?memberid=A").status_code == 200
+    assert client.get("/trx?memberid=B").status_code == 429
+
+
+def test_member_reject_does_not_consume_ip_token():
+    client = make_client(member_burst=1, ip_burst=3, ip_refill=0.001)
+
+    assert client.get("/trx?memberid=A").status_code == 200
+    for _ in range(5):
+        assert client.get("/trx?memberid=A").status_code == 429
+    # token IP masih tersisa dua karena penolakan member dikembalikan
+    assert client.get("/trx?memberid=B").status_code == 200
+    assert client.get("/trx?memberid=C").status_code == 200
+    assert client.get("/trx?memberid=D").status_code == 429
+
+
+def test_rotating_forwarded_header_does_not_bypass_ip_limit():
+    client = make_client(ip_burst=1, ip_refill=0.001)
+
+    # peer bukan proxy tepercaya: X-Forwarded-For tidak membuat bucket baru
+    first = client.get("/trx?memberid=A", headers={"x-forwarded-for": "1.1.1.1"})
+    second = client.get("/trx?memberid=B", headers={"x-forwarded-for": "2.2.2.2"})
+    assert first.status_code == 200
+    assert second.status_code == 429
+
+
+def make_batch_client(**overrides) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    register_exception_handlers(app)
+    options = {"member_refill": 0.001, "ip_refill": 0.001}
+    app.add_middleware(
+        RateLimitMiddleware, settings=RateLimitSettings(**{**options, **overrides})
+    )
+    app.add_middleware(RequestContextMiddleware)
+    members = [
+        MemberRecord(
+            memberid=memberid,
+            pin="1111",
+            password="PASS",
+            allowed_ip="",
+            report_url="",
+        )
+        for memberid in ("M1", "M2")
+    ]
+    registry = MemberRegistry(members, enable_ip_check=False)
+    app.state.auth_service = AuthenticationService(OtomaxSignatureService, registry)
+    return TestClient(app)
+
+
+def _batch(memberid: str, count: int, start: int = 0) -> list[dict]:
+    return [
+        {
+            "trxid": f"{memberid}-{i}",
+            "memberid": memberid,
+            "product": "P",
+            "dest": "081",
+            "pin": "1111",
+            "password": "PASS",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def test_batch_is_charged_per_item():
+    client = make_batch_client(member_burst=3, ip_burst=100)
+
+    results = client.post("/trx/batch", json=_batch("m1", 5)).json()["results"]
+    assert [r["status"] for r in results] == ["success"] * 3 + ["error"] * 2
+    assert results[3]["rc"] == "RateLimitError"
+    assert results[3]["status_code"] == 429
+
+    # bucket yang sama dipakai /trx: member M1 sudah habis
+    assert client.get("/trx?memberid=M1").status_code == 429
+    results = client.post("/trx/batch", json=_batch("M2", 1)).json()["results"]
+    assert results[0]["status"] == "success"
+
+
+def test_batch_items_consume_ip_tokens():
+    client = make_batch_client(member_burst=100, ip_burst=4)
+
+    # satu token untuk request batch, tiga untuk item
+    items = _batch("M1", 2) + _batch("M2", 2)
+    results = client.post("/trx/batch", json=items).json()["results"]
+    assert [r["status"] for r in results] == ["success"] * 3 + ["error"]
+    assert client.post("/trx/batch", json=_batch("M2", 1)).status_code == 429
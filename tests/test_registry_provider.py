@@ -0,0 +1,125 @@
+import json
+import os
+
+import pytest
+from src.domain.member.provider import RegistryProvider
+from src.domain.member.registry import MemberRegistry
+from src.services.auth import AuthenticationService, AuthError
+from src.services.siganture_auth import OtomaxSignatureService
+
+
+def write_members(path, pin="1111"):
+    path.write_text(
+        json.dumps(
+            [
+                {
+                    "memberid": "TESTOK01",
+                    "pin": pin,
+                    "password": "TESTOK01",
+                    "ip_address": "10.0.0.2",
+                    "report_url": "",
+                }
+            ]
+        )
+    )
+    # mtime dinaikkan eksplisit agar perubahan terdeteksi walau dalam detik yang sama
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def file_provider(path) -> RegistryProvider:
+    return RegistryProvider(
+        lambda: (MemberRegistry.from_file(path, enable_ip_check=False), (str(path),))
+    )
+
+
+AUTH = {
+    "trxid": "T1",
+    "memberid": "TESTOK01",
+    "product": "PROD",
+    "dest": "081",
+    "pin": "1111",
+    "password": "TESTOK01",
+}
+
+
+def test_pin_rotation_is_picked_up_without_rebuilding_service(tmp_path):
+    path = tmp_path / "members.json"
+    write_members(path)
+    provider = file_provider(path)
+    svc = AuthenticationService(OtomaxSignatureService, provider)
+    assert svc.authenticate_transaction(AUTH, "9.9.9.9")["status"] == "success"
+
+    assert provider.check() is False
+    write_members(path, pin="2222")
+    assert provider.check() is True
+
+    with pytest.raises(AuthError):
+        svc.authenticate_transaction({**AUTH, "trxid": "T2"}, "9.9.9.9")
+    assert svc.authenticate_transaction(
+        {**AUTH, "trxid": "T3", "pin": "2222"}, "9.9.9.9"
+    )
+
+
+def test_broken_source_keeps_previous_snapshot(tmp_path):
+    path = tmp_path / "members.json"
+    write_members(path)
+    provider = file_provider(path)
+    before = provider.current
+
+    path.write_text("[{not json")
+    os.utime(path, ns=(0, 10**18))
+    assert provider.check() is False
+    assert provider.current is before
+    assert provider.failures == 1
+
+    # fingerprint belum diperbarui: polling berikutnya mencoba lagi
+    assert provider.check() is False
+    assert provider.failures == 2
+    write_members(path, pin="2222")
+    assert provider.check() is True
+    assert provider.current.get("TESTOK01").pin == "2222"
+    assert provider.check() is False
+
+
+def test_failing_on_reload_keeps_snapshot_and_retries(tmp_path):
+    path = tmp_path / "members.json"
+    write_members(path)
+    provider = file_provider(path)
+    before = provider.current
+    calls = []
+
+    def on_reload(registry: MemberRegistry) -> None:
+        calls.append(registry)
+        if len(calls) == 1:
+            raise RuntimeError("sync gagal")
+
+    provider.on_reload = on_reload
+    write_members(path, pin="2222")
+    assert provider.check() is False
+    assert provider.current is before
+    assert provider.failures == 1
+
+    assert provider.check() is True
+    assert provider.current is calls[-1]
+    assert len(calls) == 2
+
+
+def test_from_settings_reloads_env_file(tmp_path, monkeypatch):
+    monkeypatch.delenv("OTO", raising=False)
+    env = tmp_path / ".env"
+    oto = {
+        "memberid": "TESTOK01",
+        "password": "TESTOK01",
+        "pin": "1111",
+        "memberip": "10.0.0.2",
+        "memberreporturl": "",
+    }
+    env.write_text(f"OTO='{json.dumps(oto)}'\n")
+    provider = RegistryProvider.from_settings(env)
+    assert provider.current.enable_ip_check is True
+
+    env.write_text(f"OTO='{json.dumps({**oto, 'enable_ip_check': False})}'\n")
+    os.utime(env, ns=(0, 10**18))
+    assert provider.check() is True
+    assert provider.current.enable_ip_check is False
@@ -0,0 +1,72 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+from src.core.exceptions.errorcases import EntityNotFoundError
+from src.domain.supplier.model import ReplyRules
+from src.domain.supplier.parser import ReplyParser, load_parser, parse_amount
+
+REPLIES = json.loads(
+    (Path(__file__).parent / "data" / "supplier_replies.json").read_text()
+)
+
+
+@pytest.mark.parametrize("case", REPLIES, ids=lambda c: c["reply"][:30])
+def test_recorded_replies(case):
+    parsed = load_parser().parse(case["supplier"], case["reply"])
+
+    assert parsed.status == case["status"]
+    assert parsed.sn == case["sn"]
+    assert parsed.balance == case["balance"]
+    assert parsed.price == case["price"]
+
+
+def test_parse_amount_formats():
+    assert parse_amount("10.250") == 10250
+    assert parse_amount("1,234,567") == 1234567
+    assert parse_amount("250.000,00") == 250000
+    assert parse_amount("10250.00.") == 10250
+
+
+def test_earliest_status_keyword_wins_and_unknown_supplier():
+    parser = ReplyParser(
+        ReplyRules.model_validate(
+            {
+                "suppliers": {
+                    "A": {
+                        "status": [
+                            {"status": "success", "pattern": "SUKSES"},
+                            {"status": "failed", "pattern": "GAGAL"},
+                        ]
+                    }
+                }
+            }
+        )
+    )
+    assert parser.parse("a", "GAGAL, bukan SUKSES").status == "failed"
+    with pytest.raises(EntityNotFoundError):
+        parser.parse("B", "SUKSES")
+
+
+def test_rules_validation():
+    with pytest.raises(ValueError):
+        ReplyRules.model_validate({"suppliers": {"A": {"fields": {"sn": "SN (\\d+)"}}}})
+    with pytest.raises(ValueError):
+        ReplyRules.model_validate({"suppliers": {"A": {"fields": {"x": "(?P<x>1)"}}}})
+    with pytest.raises(ValueError):
+        ReplyRules.model_validate(
+            {"suppliers": {"A": {"status": [{"status": "ok", "pattern": "("}]}}}
+        )
+
+
+@pytest.mark.performance
+def test_parse_throughput_regression_guard():
+    # batas longgar: jauh di bawah angka bench agar tidak flaky di CI lambat
+    parser = load_parser()
+    cases = [(c["supplier"], c["reply"]) for c in REPLIES] * 500
+    start = time.perf_counter()
+    for supplier, reply in cases:
+        parser.parse(supplier, reply)
+    rate = len(cases) / (time.perf_counter() - start)
+    assert rate > 10_000, f"{rate:,.0f} parses/sec"
@@ -0,0 +1,191 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from src.services.report_dispatcher import ReportDispatcher
+
+
+class StubServer:
+    """HTTP server lokal yang mencatat body callback."""
+
+    def __init__(self, fail_first: int = 0, status: int = 500):
+        self.bodies: list[list[dict]] = []
+        self.fail_first = fail_first
+        self.status = status
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if stub.fail_first > 0:
+                    stub.fail_first -= 1
+                    self.send_response(stub.status)
+                else:
+                    stub.bodies.append(json.loads(body))
+                    self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/report"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub():
+    server = StubServer()
+    yield server
+    server.close()
+
+
+def _report(trxid: str, status: str = "success") -> dict:
+    return {"trxid": trxid, "memberid": "M1", "status": status}
+
+
+async def test_batches_and_coalesces_per_url(stub):
+    dispatcher = ReportDispatcher(batch_size=2)
+    dispatcher.submit(stub.url, _report("T1", "pending"))
+    dispatcher.submit(stub.url, _report("T2"))
+    dispatcher.submit(stub.url, _report("T1"))  # menggantikan laporan T1 lama
+    dispatcher.submit(stub.url, _report("T3"))
+
+    await dispatcher.start()
+    await dispatcher.drain()
+    await dispatcher.aclose()
+
+    sent = [r for body in stub.bodies for r in body]
+    assert [len(body) for body in stub.bodies] == [2, 1]
+    assert sorted(r["trxid"] for r in sent) == ["T1", "T2", "T3"]
+    assert next(r for r in sent if r["trxid"] == "T1")["status"] == "success"
+    assert dispatcher.stats()["sent"] == 3
+
+
+async def test_retries_with_backoff_until_success(stub):
+    stub.fail_first = 2
+    dispatcher = ReportDispatcher(base_delay=0.001, max_delay=0.01)
+    await dispatcher.start()
+    dispatcher.submit(stub.url, _report("T1"))
+
+    for _ in range(200):
+        await dispatcher.drain()
+        if stub.bodies:
+            break
+        await asyncio.sleep(0.005)
+    await dispatcher.aclose()
+
+    assert stub.bodies == [[_report("T1")]]
+    assert dispatcher.retried == 2
+    assert dispatcher.failed == 0
+
+
+async def test_client_error_is_not_retried(stub):
+    stub.fail_first, stub.status = 1, 400
+    dispatcher = ReportDispatcher()
+    await dispatcher.start()
+    dispatcher.submit(stub.url, _report("T1"))
+    await dispatcher.drain()
+    await dispatcher.aclose()
+
+    assert dispatcher.failed == 1
+    assert dispatcher.retried == 0
+
+
+async def test_retry_queue_persists_across_restart(stub, tmp_path):
+    path = tmp_path / "retry.jsonl"
+    stub.fail_first = 1
+    dispatcher = ReportDispatcher(base_delay=60, retry_path=path, rng=lambda: 1.0)
+    await dispatcher.start()
+    dispatcher.submit(stub.url, _report("T1"))
+    await dispatcher.drain()
+    await dispatcher.aclose()
+    assert path.exists() and not stub.bodies
+
+    restarted = ReportDispatcher(retry_path=path)
+    await restarted.start()
+    await restarted.drain()
+    await restarted.aclose()
+    assert stub.bodies == [[_report("T1")]]
+    assert not path.exists()
+
+
+async def test_pending_is_bounded_per_url_and_total():
+    dispatcher = ReportDispatcher(max_pending_per_url=2, max_pending=3)
+    for i in range(3):
+        dispatcher.submit("http://a/report", _report(f"A{i}"))
+    dispatcher.submit("http://a/report", _report("A0", "failed"))  # coalescing
+    dispatcher.submit("http://b/report", _report("B0"))
+    dispatcher.submit("http://c/report", _report("C0"))
+
+    assert dispatcher.stats()["pending"] == 3
+    assert dispatcher.dropped == 2
+    assert "http://c/report" not in dispatcher._pending
+    assert dispatcher._pending["http://a/report"]["A0"][0]["status"] == "failed"
+
+
+async def test_unexpected_error_keeps_draining(stub):
+    dispatcher = ReportDispatcher(max_attempts=1)
+    await dispatcher.start()
+    dispatcher.submit("ftp://invalid/report", _report("T1"))
+    dispatcher.submit(stub.url, _report("T2"))
+    await dispatcher.drain()
+    dispatcher.submit("ftp://invalid/report", _report("T3"))
+    await dispatcher.drain()
+    await dispatcher.aclose()
+
+    assert dispatcher.failed == 2
+    assert stub.bodies == [[_report("T2")]]
+
+
+async def test_cancelled_inflight_batch_is_persisted(tmp_path):
+    path = tmp_path / "retry.jsonl"
+    release = asyncio.Event()
+
+    class HangingClient:
+        async def post(self, *_args, **_kwargs):
+            await release.wait()
+
+    dispatcher = ReportDispatcher(retry_path=path, client=HangingClient())
+    await dispatcher.start()
+    dispatcher.submit("http://slow/report", _report("T1"))
+    await asyncio.sleep(0)
+    await dispatcher.aclose(timeout=0.01)
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        ["http://slow/report", _report("T1"), 0]
+    ]
+
+
+async def test_queue_is_checkpointed_without_shutdown(tmp_path):
+    path = tmp_path / "retry.jsonl"
+    release = asyncio.Event()
+
+    class HangingClient:
+        async def post(self, *_args, **_kwargs):
+            await release.wait()
+
+    dispatcher = ReportDispatcher(
+        retry_path=path, persist_interval=0.01, client=HangingClient()
+    )
+    await dispatcher.start()
+    dispatcher.submit("http://slow/report", _report("T1"))
+    for _ in range(100):
+        await asyncio.sleep(0.01)
+        if path.exists():
+            break
+
+    # proses mati tanpa aclose: laporan in-flight tetap ada di file
+    lines = path.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        ["http://slow/report", _report("T1"), 0]
+    ]
+    await dispatcher.aclose(timeout=0.01)
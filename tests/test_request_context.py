@@ -0,0 +1,185 @@
+import time
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+from loguru import logger
+from src.config.settings import AccessLogSettings
+from src.core.middlewares import RequestContextMiddleware
+from src.core.middlewares.access_stats import RouteStats
+from src.core.middlewares.request_context import fast_trace_id
+
+
+def make_client(
+    trusted_proxies: str = "10.0.0.0/8", peer: str = "10.0.0.2"
+) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware, trusted_proxies=trusted_proxies)
+
+    @app.get("/ctx")
+    async def ctx(request: Request):
+        return {
+            "trace_id": request.state.trace_id,
+            "client_ip": request.state.client_ip,
+            "user_agent": request.state.user_agent,
+        }
+
+    return TestClient(app, client=(peer, 50000))
+
+
+def test_fast_trace_ids_are_unique_and_valid():
+    ids = {fast_trace_id() for _ in range(1000)}
+    assert len(ids) == 1000
+    assert all(tid.isalnum() and 8 <= len(tid) <= 64 for tid in ids)
+
+
+def test_incoming_trace_id_is_propagated():
+    client = make_client()
+    response = client.get("/ctx", headers={"x-trace-id": "abcDEF123456"})
+
+    assert response.json()["trace_id"] == "abcDEF123456"
+    assert response.headers["x-trace-id"] == "abcDEF123456"
+    assert response.headers["x-process-time"].endswith("ms")
+
+
+def test_invalid_trace_id_is_replaced():
+    client = make_client()
+    response = client.get("/ctx", headers={"x-trace-id": "bad id!"})
+
+    trace_id = response.json()["trace_id"]
+    assert trace_id != "bad id!"
+    assert response.headers["x-trace-id"] == trace_id
+
+
+def test_client_ip_prefers_forwarded_header():
+    client = make_client()
+    body = client.get(
+        "/ctx",
+        headers={
+            "x-forwarded-for": "1.2.3.4, 10.0.0.1",
+            "x-real-ip": "5.6.7.8",
+            "user-agent": "otomax",
+        },
+    ).json()
+
+    assert body["client_ip"] == "1.2.3.4"
+    assert body["user_agent"] == "otomax"
+
+    body = client.get("/ctx", headers={"x-real-ip": "5.6.7.8"}).json()
+    assert body["client_ip"] == "5.6.7.8"
+
+
+def test_forwarded_header_ignored_from_untrusted_peer():
+    client = make_client(peer="203.0.113.7")
+    body = client.get(
+        "/ctx", headers={"x-forwarded-for": "1.2.3.4", "x-real-ip": "5.6.7.8"}
+    ).json()
+
+    assert body["client_ip"] == "203.0.113.7"
+
+
+def test_spoofed_forwarded_hops_are_skipped():
+    client = make_client()
+    # klien menulis "6.6.6.6"; proxy menambahkan IP asli klien di kanan
+    body = client.get(
+        "/ctx", headers={"x-forwarded-for": "6.6.6.6, 1.2.3.4, 10.0.0.1"}
+    ).json()
+
+    assert body["client_ip"] == "1.2.3.4"
+
+
+def capture_access_log(options: AccessLogSettings, paths: list[str]) -> list[str]:
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware, access_log=options)
+
+    @app.get("/ok")
+    async def ok():
+        return {}
+
+    @app.get("/fail")
+    async def fail():
+        raise HTTPException(status_code=403)
+
+    messages: list[str] = []
+    handler = logger.add(lambda m: messages.append(m.record["message"]), level="INFO")
+    try:
+        client = TestClient(app)
+        for path in paths:
+            client.get(path)
+    finally:
+        logger.remove(handler)
+    return messages
+
+
+def test_access_log_samples_successes_but_keeps_errors():
+    options = AccessLogSettings(sample_rate=5, slow_ms=10_000)
+    messages = capture_access_log(options, ["/ok"] * 10 + ["/fail"] * 3)
+
+    assert sum("/ok" in m for m in messages) == 2
+    assert sum("/fail" in m for m in messages) == 3
+
+
+def test_route_stats_summary():
+    clock = iter([0.0, 1.0, 11.0, 11.0, 12.0]).__next__
+    stats = RouteStats(interval=10, clock=clock)
+    stats.record("GET", "/trx", 200, 3.0)
+    stats.record("GET", "/trx", 200, 7.0)
+    assert not stats.due()
+    stats.record("GET", "/trx", 401, 0.5)
+    assert stats.due()
+
+    summary = stats.flush()
+    assert "GET /trx 200 n=2 avg=5.00ms max=7.00ms" in summary
+    assert "GET /trx 401 n=1" in summary
+    assert stats.flush() is None
+
+
+def _summary_app(interval: float) -> tuple[FastAPI, list[str], int]:
+    app = FastAPI()
+    options = AccessLogSettings(sample_rate=1000, summary_interval=interval)
+    app.add_middleware(RequestContextMiddleware, access_log=options)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"id": item_id}
+
+    summaries: list[str] = []
+    handler = logger.add(
+        lambda m: summaries.append(m.record["message"]),
+        level="INFO",
+        filter=lambda r: r["extra"].get("access_summary"),
+    )
+    return app, summaries, handler
+
+
+def test_summary_buckets_unmatched_paths_and_flushes_on_shutdown():
+    app, summaries, handler = _summary_app(3600)
+    try:
+        with TestClient(app) as client:
+            client.get("/items/1")
+            client.get("/items/2")
+            for i in range(5):
+                client.get(f"/scan-{i}.php")
+            assert summaries == []
+    finally:
+        logger.remove(handler)
+
+    assert len(summaries) == 1
+    assert "GET /items/{item_id} 200 n=2" in summaries[0]
+    assert "GET <unmatched> 404 n=5" in summaries[0]
+    assert "scan-" not in summaries[0]
+
+
+def test_summary_is_flushed_by_timer_while_idle():
+    app, summaries, handler = _summary_app(0.05)
+    try:
+        with TestClient(app) as client:
+            client.get("/items/1")
+            deadline = time.monotonic() + 2
+            while not summaries and time.monotonic() < deadline:
+                time.sleep(0.01)
+            flushed = list(summaries)
+    finally:
+        logger.remove(handler)
+
+    assert len(flushed) == 1
+    assert "GET /items/{item_id} 200 n=1" in flushed[0]
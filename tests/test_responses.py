@@ -0,0 +1,41 @@
+import pytest
+from fastapi.responses import JSONResponse
+from src.api.responses import PongResponse, TrxResponse, render_trx
+from src.main import app, include_routers
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        {"status": "success", "trxid": "T1", "memberid": "TESTOK01", "sign": "abc-_"},
+        {"status": "success", "trxid": 'T"1\\\n\t\x01', "memberid": "M", "sign": "s"},
+        {"status": "success", "trxid": "ñ日本\u2028😀", "memberid": "M", "sign": "s"},
+        # bukan bentuk sukses: fallback ke json.dumps
+        {"trxid": "T1", "status": "success", "memberid": "M", "sign": "s"},
+        {"status": "success", "trxid": "T1", "memberid": "M", "sign": None},
+        {"status": "error", "trxid": "T1", "memberid": "M", "rc": "AuthError"},
+        {"status": "success", "trxid": "T1", "memberid": "M", "sign": "s", "x": 1},
+    ],
+)
+def test_render_trx_matches_json_response(result):
+    assert render_trx(result) == JSONResponse(result).body
+    response = TrxResponse(result)
+    assert response.body == JSONResponse(result).body
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_pong_response_matches_json_response():
+    expected = JSONResponse({"message": "pong"})
+    first, second = PongResponse(), PongResponse()
+    assert first.body == expected.body
+    assert first.raw_headers == expected.raw_headers
+    first.headers["x-trace-id"] = "abc"
+    assert second.raw_headers == expected.raw_headers
+
+
+def test_openapi_schema_builds_with_custom_responses():
+    include_routers(app)
+    app.openapi_schema = None
+    paths = app.openapi()["paths"]
+    assert "200" in paths["/ping"]["get"]["responses"]
+    assert "200" in paths["/trx"]["get"]["responses"]
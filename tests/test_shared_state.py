@@ -0,0 +1,76 @@
+import multiprocessing
+
+from src.config.settings import IdempotencySettings, RateLimitSettings
+from src.core.shared_state import (
+    SharedIdempotencyStore,
+    SharedState,
+    SharedTable,
+    SharedTokenBucketLimiter,
+)
+
+FP = ("PROD", "081", "1111", "pwd", None)
+
+
+def test_shared_token_bucket_matches_in_process_semantics(clock):
+    table = SharedTable(64, 24)
+    limiter = SharedTokenBucketLimiter(table, burst=2, refill_rate=1, clock=clock)
+    try:
+        assert limiter.acquire("k") == 0.0
+        assert limiter.acquire("k") == 0.0
+        assert limiter.acquire("k") > 0
+        clock.now += 1.0
+        assert limiter.acquire("k") == 0.0
+        assert limiter.rejected == 1
+        limiter.refund("k")
+        assert limiter.acquire("k") == 0.0
+        assert limiter.acquire("k") > 0
+    finally:
+        table.close(unlink=True)
+
+
+def test_shared_idempotency_ttl_fingerprint_and_eviction(clock):
+    store = SharedIdempotencyStore(max_size=8, ttl=10, clock=clock)
+    try:
+        store.put("m1", "T1", FP, {"status": "success", "trxid": "T1"})
+        assert store.get("M1", "T1", FP) == {"status": "success", "trxid": "T1"}
+        assert store.get("M1", "T1", ("other",)) is None
+
+        for i in range(50):
+            store.put("M1", f"X{i}", FP, {"trxid": f"X{i}"})
+        assert len(store) == store.max_size
+        assert store.evictions > 0
+
+        clock.now += 11
+        assert store.get("M1", "X49", FP) is None
+        assert store.expirations == 1
+    finally:
+        store.table.close(unlink=True)
+
+
+def _worker(state: SharedState, results) -> None:
+    allowed = sum(state.member_limiter.acquire("M1") == 0.0 for _ in range(50))
+    cached = state.idempotency.get("M1", "T1", FP)
+    results.put((allowed, cached))
+
+
+def test_state_is_shared_across_forked_processes():
+    state = SharedState.create(
+        RateLimitSettings(member_burst=20, member_refill=0.001),
+        IdempotencySettings(max_size=64),
+    )
+    try:
+        state.idempotency.put("M1", "T1", FP, {"trxid": "T1", "sign": "abc"})
+        ctx = multiprocessing.get_context("fork")
+        results = ctx.Queue()
+        procs = [ctx.Process(target=_worker, args=(state, results)) for _ in range(4)]
+        for proc in procs:
+            proc.start()
+        outcomes = [results.get(timeout=10) for _ in procs]
+        for proc in procs:
+            proc.join()
+
+        # burst dibagi semua worker, bukan per worker
+        assert sum(allowed for allowed, _ in outcomes) == 20
+        assert all(cached == {"trxid": "T1", "sign": "abc"} for _, cached in outcomes)
+    finally:
+        state.close()
@@ -0,0 +1,63 @@
+import base64
+import hashlib
+
+import pytest
+from src.services.siganture_auth import OtomaxSignatureService
+
+
+def legacy_signature(memberid, product, dest, refid, pin, password):
+    raw = f"OtomaX|{memberid.strip().upper()}|{product.strip().upper()}|{dest.strip()}|{refid.strip()}|{pin.strip()}|{password.strip()}"
+    sig = base64.b64encode(hashlib.sha1(raw.encode()).digest()).decode().rstrip("=")
+    return sig.replace("+", "-").replace("/", "_")
+
+
+ROWS = [("M1", "p1", "081", f"R{i}", "111", "pwd") for i in range(50)] + [
+    (" m2 ", " xl5 ", " 0877 ", " R-x ", " 2222 ", " secret "),
+    ("M1", "P2", "082", "R-last", "111", "pwd"),
+]
+
+
+def test_single_signature_matches_legacy_algorithm():
+    for row in ROWS:
+        assert OtomaxSignatureService.generate_transaction_signature(
+            *row
+        ) == legacy_signature(*row)
+
+
+def test_generate_many_matches_per_call_path():
+    expected = [
+        OtomaxSignatureService.generate_transaction_signature(*row) for row in ROWS
+    ]
+    assert OtomaxSignatureService.generate_many(ROWS) == expected
+    assert OtomaxSignatureService.generate_many(iter(ROWS)) == expected
+
+
+def test_generate_columns_matches_rows():
+    columns = list(zip(*ROWS, strict=True))
+    assert OtomaxSignatureService.generate_columns(
+        *columns
+    ) == OtomaxSignatureService.generate_many(ROWS)
+
+
+def test_generate_columns_rejects_uneven_columns():
+    with pytest.raises(ValueError):
+        OtomaxSignatureService.generate_columns(
+            ["M1", "M2"], ["P"], ["D"], ["R"], ["1"], ["p"]
+        )
+
+
+def test_verify_many_flags_bad_signatures():
+    signatures = OtomaxSignatureService.generate_many(ROWS)
+    signatures[3] = "bad-sig"
+    result = OtomaxSignatureService.verify_many(ROWS, signatures)
+    assert result[3] is False
+    assert result.count(True) == len(ROWS) - 1
+
+
+def test_non_ascii_signature_is_rejected_not_raised():
+    signatures = OtomaxSignatureService.generate_many(ROWS)
+    signatures[0] = "sïgnatüre"
+    assert OtomaxSignatureService.verify_many(ROWS, signatures)[0] is False
+    keys = ("memberid", "product", "dest", "refid", "pin", "password")
+    expected_data = dict(zip(keys, ROWS[0], strict=True))
+    assert not OtomaxSignatureService.verify_signature(expected_data, "sïgnatüre")
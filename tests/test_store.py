@@ -0,0 +1,286 @@
+import asyncio
+import json
+import sqlite3
+import threading
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.api.api_trx import router
+from src.api.dependencies import build_auth_service
+from src.api.stream import router as stream_router
+from src.domain.member.provider import RegistryProvider
+from src.domain.member.registry import MemberRecord, MemberRegistry
+from src.services.auth import AuthenticationService
+from src.services.siganture_auth import OtomaxSignatureService
+from src.services.store import SqliteStore
+
+
+def _member(memberid: str = "M1", pin: str = "1111") -> MemberRecord:
+    return MemberRecord(memberid, pin, "PW", "10.0.0.1,10.1.0.0/16", "http://r")
+
+
+def _result(i: int) -> dict:
+    return {"status": "success", "trxid": f"T{i}", "memberid": "M1", "sign": f"S{i}"}
+
+
+def test_wal_mode_and_member_roundtrip(tmp_path):
+    store = SqliteStore(tmp_path / "store.db")
+    store.upsert_member(_member())
+    store.flush()
+
+    record = store.get(" m1 ")
+    assert record == _member()
+    assert record.allows("10.1.2.3")
+    assert store.get("M1") is record  # dari cache
+    assert store.get("NOPE") is None
+    assert store.get("NOPE") is None  # cache negatif
+    assert store.stats()["hits"] == 2
+    assert store.stats()["cached"] == 1
+    assert store.stats()["negative"] == 1
+    assert len(store) == 1
+    store.close()
+
+    conn = sqlite3.connect(tmp_path / "store.db")
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    conn.close()
+    # tabel member tetap bisa dibaca loader registry biasa
+    assert MemberRegistry.from_sqlite(tmp_path / "store.db").get("M1").pin == "1111"
+
+
+def test_member_write_invalidates_cache(tmp_path):
+    store = SqliteStore(tmp_path / "store.db")
+    store.upsert_member(_member(pin="1111"))
+    store.flush()
+    assert store.get("M1").pin == "1111"
+
+    store.upsert_member(_member(pin="2222"))
+    store.flush()
+    assert store.get("M1").pin == "2222"
+
+    store.deactivate_member("m1")
+    store.flush()
+    assert store.get("M1") is None
+    store.close()
+
+
+def test_negative_cache_is_separate_and_invalidated(tmp_path):
+    store = SqliteStore(tmp_path / "store.db", cache_size=2, negative_cache_size=2)
+    store.upsert_members(_member(f"M{i}") for i in range(2))
+    store.flush()
+    store.get("M0")
+    store.get("M1")
+    for i in range(10):
+        assert store.get(f"UNKNOWN{i}") is None
+    # member tidak dikenal tidak mengusir member aktif dari LRU
+    misses = store.misses
+    store.get("M0")
+    store.get("M1")
+    assert store.misses == misses
+    assert store.stats()["negative"] == 2
+
+    store.upsert_member(_member("UNKNOWN9"))
+    store.flush()
+    assert store.get("UNKNOWN9") == _member("UNKNOWN9")
+    store.close()
+
+
+def test_failed_write_does_not_roll_back_batch(tmp_path):
+    store = SqliteStore(tmp_path / "store.db")
+    store.flush()
+    store._queue.put(("INSERT INTO missing_table VALUES (?)", (1,), None))
+    for i in range(10):
+        store.append(_result(i))
+    store.flush()
+    assert store.failed == 1
+    assert store.writes == 10
+    assert store.lookup("M1", "T9") == _result(9)
+    store.close()
+
+
+def test_sync_members_applies_registry_snapshot(tmp_path):
+    store = SqliteStore(tmp_path / "store.db")
+    old = [_member("M1"), _member("M2")]
+    store.sync_members(old)
+    store.flush()
+    assert store.get("M2") is not None
+
+    store.sync_members([_member("M1", pin="9999"), _member("M3")], previous=old)
+    store.flush()
+    assert store.get("M1").pin == "9999"
+    assert store.get("M2") is None
+    assert store.get("M3") is not None
+    store.close()
+
+
+def test_invalidation_during_load_is_not_cached(tmp_path):
+    store = SqliteStore(tmp_path / "store.db")
+    # query miss untuk M1 sedang berjalan saat update member diantrikan
+    store._loading["M1"] = 1
+    store.upsert_member(_member(pin="2222"))
+    store._finish_load("M1", _member(pin="1111"))
+    store.flush()
+    assert store.get("M1").pin == "2222"
+    store.close()
+
+
+def test_cache_is_bounded_lru(tmp_path):
+    store = SqliteStore(tmp_path / "store.db", cache_size=2)
+    store.upsert_members(_member(f"M{i}") for i in range(3))
+    store.flush()
+    store.get("M0")
+    store.get("M1")
+    store.get("M0")
+    store.get("M2")  # M1 yang paling lama tidak dipakai dibuang
+
+    misses = store.misses
+    store.get("M0")
+    assert store.misses == misses
+    store.get("M1")
+    assert store.misses == misses + 1
+    assert store.stats()["cached"] == 2
+    store.close()
+
+
+def test_aget_reads_through_executor(tmp_path):
+    store = SqliteStore(tmp_path / "store.db", read_pool_size=2)
+    store.upsert_members(_member(f"M{i}") for i in range(50))
+    store.flush()
+
+    async def run():
+        return await asyncio.gather(*(store.aget(f"m{i}") for i in range(50)))
+
+    records = asyncio.run(run())
+    assert [r.memberid for r in records] == [f"M{i}" for i in range(50)]
+    assert store.get("M7") is records[7]
+
+    asyncio.run(store.aget_many(["m60", "M49", "m49"]))
+    misses = store.misses
+    assert store.get("M60") is None
+    assert store.get("M49") is records[49]
+    assert store.misses == misses
+    store.close()
+
+
+def test_transactions_are_batched_by_single_writer(tmp_path):
+    store = SqliteStore(tmp_path / "store.db", batch_size=256)
+    for i in range(1000):
+        store.append(_result(i))
+    store.flush()
+    assert store.writes == 1000
+    assert store.commits < 1000
+    store.close()
+
+    store = SqliteStore(tmp_path / "store.db")
+    assert store.lookup("m1", "T999") == _result(999)
+    assert store.lookup("M1", "missing") is None
+    assert store.lookup("M2", "T999") is None
+    store.close()
+
+
+def test_auth_service_uses_store_as_registry_and_journal(tmp_path):
+    registry = MemberRegistry(
+        [MemberRecord("TESTOK01", "1111", "TESTOK01", "10.0.0.2", "")],
+        enable_ip_check=False,
+    )
+    store = SqliteStore.from_registry(registry, tmp_path / "store.db")
+    svc = AuthenticationService(OtomaxSignatureService, store, journal=store)
+    result = svc.authenticate_transaction(
+        {
+            "trxid": "trx-1",
+            "memberid": "testok01",
+            "product": "PROD",
+            "dest": "081",
+            "pin": "1111",
+            "password": "TESTOK01",
+        },
+        client_ip="9.9.9.9",
+    )
+    store.flush()
+    assert store.lookup("TESTOK01", "trx-1")["sign"] == result["sign"]
+    store.close()
+
+
+def test_trx_endpoint_with_store(tmp_path):
+    registry = MemberRegistry(
+        [MemberRecord("TESTOK01", "1111", "TESTOK01", "testclient", "")]
+    )
+    store = SqliteStore.from_registry(registry, tmp_path / "store.db")
+    app = FastAPI()
+    app.include_router(router)
+    app.state.auth_service = AuthenticationService(
+        OtomaxSignatureService, store, journal=store
+    )
+    params = {
+        "trxid": "trx-1",
+        "memberid": "TESTOK01",
+        "product": "PROD",
+        "dest": "081",
+        "pin": "1111",
+        "password": "TESTOK01",
+    }
+    response = TestClient(app).get("/trx", params=params)
+    assert response.status_code == 200
+    assert store.stats()["misses"] == 1  # diisi oleh aget, service membaca cache
+    store.flush()
+    assert store.lookup("TESTOK01", "trx-1")["sign"] == response.json()["sign"]
+    store.close()
+
+
+def test_batch_and_stream_prewarm_store_cache(tmp_path):
+    registry = MemberRegistry(
+        [MemberRecord("TESTOK01", "1111", "TESTOK01", "testclient", "")]
+    )
+    store = SqliteStore.from_registry(registry, tmp_path / "store.db")
+    app = FastAPI()
+    app.include_router(router)
+    app.include_router(stream_router)
+    app.state.auth_service = AuthenticationService(
+        OtomaxSignatureService, store, journal=store
+    )
+    item = {
+        "trxid": "trx-1",
+        "memberid": "TESTOK01",
+        "product": "PROD",
+        "dest": "081",
+        "pin": "1111",
+        "password": "TESTOK01",
+    }
+    client = TestClient(app)
+    loads = []
+    load = store._load
+    store._load = lambda key: loads.append(threading.current_thread()) or load(key)
+
+    assert client.post("/trx/batch", json=[item]).status_code == 200
+    store._invalidate("TESTOK01")
+    body = json.dumps({**item, "trxid": "trx-2"})
+    assert client.post("/trx/stream", content=body).status_code == 200
+    # semua query miss berjalan di thread executor store, bukan event loop
+    assert len(loads) == 2
+    assert all(t.name.startswith("sqlite-store-read") for t in loads)
+    store.close()
+
+
+def test_registry_reload_is_synced_into_store(tmp_path):
+    snapshots = [
+        MemberRegistry([_member("M1")]),
+        MemberRegistry(
+            [_member("M1", pin="2222"), _member("M2")], enable_ip_check=False
+        ),
+    ]
+
+    def load():
+        return snapshots.pop(0), ()
+
+    provider = RegistryProvider(load)
+    store = SqliteStore(tmp_path / "store.db")
+    service = build_auth_service(provider, store)
+    assert service.registry is store
+    store.flush()
+    assert store.get("M1").pin == "1111"
+
+    assert provider.reload()
+    store.flush()
+    assert store.get("M1").pin == "2222"
+    assert store.get("M2") is not None
+    assert store.enable_ip_check is False
+    store.close()
@@ -0,0 +1,136 @@
+import io
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src import reconcile as reconcile_cli
+from src.api import stream
+from src.api.stream import iter_lines, router
+from src.config.settings import RateLimitSettings
+from src.core.middlewares import RateLimitMiddleware, RequestContextMiddleware
+from src.domain.member.registry import MemberRecord, MemberRegistry
+from src.reconcile import reconcile
+from src.services.auth import AuthenticationService
+from src.services.siganture_auth import OtomaxSignatureService
+
+
+def make_service() -> AuthenticationService:
+    registry = MemberRegistry(
+        [MemberRecord("TESTOK01", "1111", "TESTOK01", "testclient", "")],
+        enable_ip_check=False,
+    )
+    return AuthenticationService(OtomaxSignatureService, registry)
+
+
+def line(i: int, pin: str = "1111") -> bytes:
+    item = {
+        "trxid": f"s-{i}",
+        "memberid": "TESTOK01",
+        "product": "PROD",
+        "dest": "081",
+        "pin": pin,
+        "password": "TESTOK01",
+    }
+    return json.dumps(item).encode() + b"\n"
+
+
+def test_iter_lines_handles_split_blank_and_overlong_lines():
+    chunks = [b'{"a":', b"1}\n\n", b"x" * 20, b"y\n", b"tail"]
+
+    assert list(iter_lines(chunks, max_line=10)) == [
+        (1, b'{"a":1}'),
+        (3, None),
+        (4, b"tail"),
+    ]
+
+
+def test_reconcile_streams_results_in_order():
+    source = io.BytesIO(line(0) + line(1, pin="bad") + b"{broken\n" + line(3))
+    target = io.BytesIO()
+
+    count = reconcile(make_service(), source, target, chunk_size=2)
+
+    results = [json.loads(row) for row in target.getvalue().splitlines()]
+    assert count == 4
+    assert [r["status"] for r in results] == ["success", "error", "error", "success"]
+    assert results[2]["line"] == 3 and results[2]["rc"] == "ValidationError"
+    assert results[3]["trxid"] == "s-3"
+
+
+def test_reconcile_rejects_duplicates_across_chunks():
+    source = io.BytesIO(line(0) + line(1) + line(0))
+    target = io.BytesIO()
+
+    reconcile(make_service(), source, target, chunk_size=2)
+
+    results = [json.loads(row) for row in target.getvalue().splitlines()]
+    assert [r["status"] for r in results] == ["success", "success", "error"]
+    assert results[2]["status_code"] == 409
+
+
+def test_reconcile_cli_skips_ip_check_for_settings_registry(
+    monkeypatch, tmp_path, capsys
+):
+    registry = MemberRegistry(
+        [MemberRecord("TESTOK01", "1111", "TESTOK01", "10.0.0.1", "")]
+    )
+    monkeypatch.setattr(reconcile_cli, "get_registry", lambda: registry)
+    source = tmp_path / "trx.ndjson"
+    source.write_bytes(line(0))
+    output = tmp_path / "out.ndjson"
+
+    reconcile_cli.main([str(source), "-o", str(output)])
+
+    assert json.loads(output.read_bytes())["status"] == "success"
+    assert registry.enable_ip_check  # registry settings bersama tidak diubah
+    assert capsys.readouterr().err == "1 transaksi diproses\n"
+
+
+def test_stream_endpoint_reads_body_incrementally():
+    app = FastAPI()
+    app.include_router(router)
+    app.state.auth_service = make_service()
+    client = TestClient(app)
+
+    def body():
+        for i in range(1200):
+            yield line(i)
+
+    response = client.post("/trx/stream", content=body())
+
+    rows = response.text.splitlines()
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert len(rows) == 1200
+    assert json.loads(rows[-1])["trxid"] == "s-1199"
+
+
+def make_stream_client(**limits) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    if limits:
+        app.add_middleware(RateLimitMiddleware, settings=RateLimitSettings(**limits))
+        app.add_middleware(RequestContextMiddleware)
+    app.state.auth_service = make_service()
+    return TestClient(app)
+
+
+def test_stream_endpoint_stops_after_max_lines(monkeypatch):
+    monkeypatch.setattr(stream, "MAX_STREAM_LINES", 3)
+    client = make_stream_client()
+
+    rows = client.post("/trx/stream", content=b"".join(map(line, range(5))))
+    results = [json.loads(row) for row in rows.text.splitlines()]
+
+    assert [r["status"] for r in results] == ["success"] * 3 + ["error"]
+    assert results[3]["line"] == 4 and results[3]["rc"] == "InvalidInputError"
+
+
+def test_stream_endpoint_charges_rate_limit_per_line():
+    client = make_stream_client(member_burst=2, member_refill=0.001)
+
+    rows = client.post("/trx/stream", content=b"".join(map(line, range(4))))
+    results = [json.loads(row) for row in rows.text.splitlines()]
+
+    assert [r["status"] for r in results] == ["success"] * 2 + ["error"] * 2
+    assert {r["rc"] for r in results[2:]} == {"RateLimitError"}
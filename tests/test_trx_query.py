@@ -0,0 +1,128 @@
+import asyncio
+import json
+import random
+from dataclasses import asdict
+from typing import Annotated
+
+import pytest
+from fastapi import FastAPI, Query, Request
+from src.api.api_trx import Auth, TrxQuery, decode_trx_query
+from src.core.exceptions import register_exception_handlers
+
+VALID = b"trxid=T1&memberid=M1&dest=081&product=P5&pin=1111&password=PW"
+
+EDGE_CASES = [
+    VALID,
+    b"trxid=T1&memberid=M1&dest=081&product=P5&sign=abc-_",
+    b"",
+    b"&&&",
+    b"trxid=T1",
+    b"trxid&memberid=M1&dest=081&product=P5&sign=s",
+    b"trxid=&memberid=&dest=&product=&pin=&password=",
+    b"trxid=T1&memberid=M1&dest=081&product=P5",
+    b"trxid=T1&memberid=M1&dest=081&product=P5&pin=1",
+    b"trxid=T1&memberid=M1&dest=081&product=P5&sign=s&foo=1",
+    b"foo=1&foo=2&trxid=T1&bar&memberid=M1",
+    b"trxid=1&trxid=2&memberid=M1&dest=081&product=P5&sign=s",
+    b"trxid=+T+1+&memberid=%20M1%09&dest=0%2B81&product=P%3D5&sign=a%26b",
+    b"trxid=%ZZ&memberid=%ff&dest=%C3%A9&product=%e6%97%a5&sign=%",
+    b"trxid=\xe9&memberid=M1&dest=081&product=P5&sign=s",
+    b"trxid=T1;memberid=M1&dest=081&product=P5&sign=s",
+    b"%74rxid=T1&memberid=M1&dest=081&product=P5&sign=s",
+    b"trxid=%1cT1%1f&memberid=%C2%A0M1%E3%80%80&dest=081&product=P5&sign=s",
+    b"trxid=a=b=c&memberid=M1&dest=081&product=P5&sign=s",
+    b"trxid=T1&memberid=M1&dest=081&product=P5&pin=1&password=2&sign=3",
+]
+
+_TOKENS = [
+    "trxid", "memberid", "dest", "product", "pin", "password", "sign", "foo",
+    "=", "=", "&", "&", "+", "%", "%2", "%20", "%ZZ", "%ff", "%C3%A9", "%1c",
+    "%C2%A0", "a", "T1", " ", "\t", "\xe9", ";",
+]  # fmt: skip
+
+
+def _random_query(rng: random.Random) -> bytes:
+    parts = []
+    for name in Auth.model_fields:
+        if rng.random() < 0.85:
+            value = "".join(rng.choices(_TOKENS, k=rng.randint(0, 3)))
+            parts.append(f"{name}={value}")
+    parts.extend(rng.choices(_TOKENS, k=rng.randint(0, 2)))
+    rng.shuffle(parts)
+    return "&".join(parts).encode("latin-1")
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/pydantic")
+    async def via_model(auth: Annotated[Auth, Query()]):
+        return auth.model_dump()
+
+    @app.get("/decoder")
+    async def via_decoder(request: Request):
+        return asdict(decode_trx_query(request.scope["query_string"]))
+
+    return app
+
+
+async def _call(app: FastAPI, path: str, query_string: bytes) -> tuple[int, dict]:
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string,
+        "root_path": "",
+        "headers": [],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return messages[0]["status"], json.loads(body)
+
+
+def test_decoder_matches_pydantic_query_model():
+    rng = random.Random(1234)
+    cases = EDGE_CASES + [_random_query(rng) for _ in range(1000)]
+    app = make_app()
+
+    async def run():
+        for query_string in cases:
+            expected = await _call(app, "/pydantic", query_string)
+            actual = await _call(app, "/decoder", query_string)
+            assert actual == expected, query_string
+
+    asyncio.run(run())
+
+
+def test_decoder_returns_frozen_record():
+    query = decode_trx_query(VALID)
+    assert query == TrxQuery("T1", "M1", "081", "P5", "1111", "PW")
+    with pytest.raises(AttributeError):
+        query.trxid = "T2"
+
+
+def test_valid_share_of_random_cases_is_meaningful():
+    # pastikan fuzzing menguji jalur sukses maupun jalur error
+    rng = random.Random(1234)
+    outcomes = set()
+    for _ in range(1000):
+        try:
+            decode_trx_query(_random_query(rng))
+            outcomes.add("ok")
+        except Exception:
+            outcomes.add("error")
+    assert outcomes == {"ok", "error"}